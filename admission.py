@@ -0,0 +1,244 @@
+"""요청 수용 제어 (CPU 사용이 큰 엔드포인트의 동시 처리 제한)
+
+main.py는 동시에 몇 개의 파싱이 돌든 제한하지 않아서, PDF 여러 개짜리 /api/match가
+몰리면 무료 인스턴스가 스왑에 들어가고 모든 요청이 함께 느려진다.
+
+AdmissionController는 요청 가중치(PDF 개수 + 크기) 합계를 ADMISSION_CAPACITY 이하로 유지하는
+가중 세마포어다. 자리가 없으면 도착 순서대로 대기하고(이벤트 루프에서 대기 — 스레드 점유 없음),
+  - 대기열이 ADMISSION_MAX_QUEUE개로 가득 차 있으면 즉시 429
+  - ADMISSION_MAX_WAIT_SEC 안에 자리가 나지 않으면 503
+두 경우 모두 Retry-After(최근 평균 처리 시간 × 대기열 길이로 추정)를 함께 돌려준다.
+대기열 길이와 대기 시간은 stats()로 노출한다 (오토스케일링 지표).
+
+Lane은 우선순위 클래스별 수용 제어 + 전용 워커 스레드다. 단일 PDF 미리보기(interactive)는
+대량 매칭(bulk)과 자리도 워커도 공유하지 않아서, bulk 요청이 밀려 있어도 대기하지 않는다.
+bulk 워커 수를 작게 두면 파싱 스레드끼리의 CPU(GIL) 경쟁도 제한된다.
+"""
+import asyncio
+import functools
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+ADMISSION_CAPACITY = float(os.environ.get("ADMISSION_CAPACITY", "4"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", "16"))
+ADMISSION_MAX_WAIT_SEC = float(os.environ.get("ADMISSION_MAX_WAIT_SEC", "20"))
+ADMISSION_MB_PER_UNIT = float(os.environ.get("ADMISSION_MB_PER_UNIT", "5"))
+_EWMA_ALPHA = 0.2
+_DEFAULT_RETRY_AFTER_SEC = 5
+_MAX_RETRY_AFTER_SEC = 60
+
+
+class AdmissionRejected(Exception):
+    """수용 거절 — status_code(429/503)와 retry_after(초)를 응답에 사용"""
+
+    def __init__(self, status_code, retry_after, message):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def request_weight(file_sizes):
+    """요청 가중치 — 파일당 1 + 크기 ADMISSION_MB_PER_UNIT MB마다 1"""
+    return sum(1 + (size or 0) / (1024 * 1024) / ADMISSION_MB_PER_UNIT for size in file_sizes)
+
+
+class AdmissionController:
+    """가중 세마포어 + 크기 제한 FIFO 대기열 (asyncio)"""
+
+    def __init__(self, capacity=ADMISSION_CAPACITY, max_queue=ADMISSION_MAX_QUEUE,
+                 max_wait_sec=ADMISSION_MAX_WAIT_SEC):
+        self.capacity = capacity
+        self.max_queue = max_queue
+        self.max_wait_sec = max_wait_sec
+        self.in_use = 0.0
+        self.active = 0
+        self._waiters = deque()   # [weight, future]
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.avg_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.avg_hold_sec = None
+
+    def _fits(self, weight):
+        return self.in_use + weight <= self.capacity
+
+    def _retry_after(self):
+        """대기열이 빠질 때까지 예상 시간 (초)"""
+        if self.avg_hold_sec is None:
+            return _DEFAULT_RETRY_AFTER_SEC
+        queued = sum(w for w, _ in self._waiters)
+        estimate = self.avg_hold_sec * (1 + queued / max(self.capacity, 1))
+        return min(_MAX_RETRY_AFTER_SEC, max(1, math.ceil(estimate)))
+
+    async def acquire(self, weight):
+        """weight만큼 자리 확보 (가중치가 용량보다 크면 용량만큼)
+
+        Returns:
+            (확보한 가중치, 처리 시작 시각) — release()에 그대로 넘긴다
+        """
+        weight = min(weight, self.capacity)
+        wait_start = time.monotonic()
+        if not self._waiters and self._fits(weight):
+            self._admit(weight, 0.0)
+            return weight, wait_start
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(
+                429, self._retry_after(), f"요청이 너무 많습니다 (대기 {len(self._waiters)}건)"
+            )
+
+        waiter = [weight, asyncio.get_running_loop().create_future()]
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter[1]), self.max_wait_sec)
+        except asyncio.TimeoutError:
+            if waiter[1].done():
+                # 시간 초과와 동시에 자리가 난 경우 — 확보한 자리를 그대로 사용
+                pass
+            else:
+                self._waiters.remove(waiter)
+                waiter[1].cancel()
+                self.rejected_timeout += 1
+                self._wake()   # 뒤에서 기다리던 작은 요청이 이제 들어갈 수 있음
+                raise AdmissionRejected(
+                    503, self._retry_after(), f"서버가 바쁩니다 ({self.max_wait_sec:g}초 대기 초과)"
+                )
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 — 이미 자리를 받았으면 반납
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._wake()
+            elif waiter[1].done() and not waiter[1].cancelled():
+                self.release((weight, wait_start))
+            raise
+        self._record_wait((time.monotonic() - wait_start) * 1000)
+        return weight, time.monotonic()
+
+    def _admit(self, weight, wait_ms):
+        self.in_use += weight
+        self.active += 1
+        self.admitted += 1
+        self._record_wait(wait_ms)
+
+    def _record_wait(self, wait_ms):
+        self.avg_wait_ms += _EWMA_ALPHA * (wait_ms - self.avg_wait_ms)
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def release(self, ticket):
+        """자리 반납 — 앞에서부터 들어갈 수 있는 대기 요청을 깨운다 (FIFO, 앞 요청을 건너뛰지 않음)"""
+        weight, started_at = ticket
+        self.in_use -= weight
+        self.active -= 1
+        hold_sec = time.monotonic() - started_at
+        if self.avg_hold_sec is None:
+            self.avg_hold_sec = hold_sec
+        else:
+            self.avg_hold_sec += _EWMA_ALPHA * (hold_sec - self.avg_hold_sec)
+        self._wake()
+
+    def _wake(self):
+        """대기열 앞에서부터 들어갈 수 있는 요청을 깨운다 (반납, 시간 초과/취소로 앞 요청이 빠졌을 때)"""
+        while self._waiters and self._fits(self._waiters[0][0]):
+            waiter_weight, future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_use += waiter_weight
+            self.active += 1
+            self.admitted += 1
+            future.set_result(True)
+
+    def stats(self):
+        """대기열/처리 현황 (오토스케일링 지표)"""
+        return {
+            "capacity": self.capacity,
+            "in_use": round(self.in_use, 2),
+            "active": self.active,
+            "queue_depth": len(self._waiters),
+            "queued_weight": round(sum(w for w, _ in self._waiters), 2),
+            "max_queue": self.max_queue,
+            "max_wait_sec": self.max_wait_sec,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_wait_ms": round(self.avg_wait_ms, 1),
+            "max_wait_ms": round(self.max_wait_ms, 1),
+            "avg_hold_sec": round(self.avg_hold_sec, 3) if self.avg_hold_sec is not None else None,
+        }
+
+
+# ══════════════════════════════════════════════
+# 우선순위 레인 (클래스별 수용 제어 + 전용 워커)
+# ══════════════════════════════════════════════
+
+LANE_INTERACTIVE = "interactive"   # 단일 PDF 미리보기 (/api/parse-pdf)
+LANE_BULK = "bulk"                 # 여러 PDF 매칭/Excel 생성
+
+LANE_SETTINGS = {
+    LANE_INTERACTIVE: {
+        "capacity": float(os.environ.get("LANE_INTERACTIVE_CAPACITY", "2")),
+        "workers": int(os.environ.get("LANE_INTERACTIVE_WORKERS", "2")),
+        "max_queue": int(os.environ.get("LANE_INTERACTIVE_MAX_QUEUE", "8")),
+        "max_wait_sec": float(os.environ.get("LANE_INTERACTIVE_MAX_WAIT_SEC", "5")),
+    },
+    LANE_BULK: {
+        "capacity": ADMISSION_CAPACITY,
+        "workers": int(os.environ.get("LANE_BULK_WORKERS", "1")),
+        "max_queue": ADMISSION_MAX_QUEUE,
+        "max_wait_sec": ADMISSION_MAX_WAIT_SEC,
+    },
+}
+
+_STOP = object()
+
+
+class Lane:
+    """우선순위 클래스 1개 — 수용 제어(AdmissionController) + 전용 스레드풀"""
+
+    def __init__(self, name):
+        settings = LANE_SETTINGS[name]
+        self.name = name
+        self.workers = max(1, settings["workers"])
+        self.admission = AdmissionController(
+            settings["capacity"], settings["max_queue"], settings["max_wait_sec"]
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"lane-{name}")
+
+    async def acquire(self, weight):
+        return await self.admission.acquire(weight)
+
+    def release(self, ticket):
+        self.admission.release(ticket)
+
+    async def run(self, fn, *args, **kwargs):
+        """동기 함수를 이 레인의 워커 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def run_from_thread(self, loop, weight, fn, *args, **kwargs):
+        """이벤트 루프 밖 스레드(작업 워커 등)에서 weight만큼 자리를 확보하고 이 레인 워커에서 fn 실행
+
+        수용 제어 상태는 이벤트 루프에서만 바꾼다 (acquire/release 모두 loop에서 실행).
+        끝날 때까지 호출 스레드를 막고, 거절되면 AdmissionRejected.
+        """
+        async def _run():
+            ticket = await self.acquire(weight)
+            try:
+                return await self.run(fn, *args, **kwargs)
+            finally:
+                self.release(ticket)
+        return asyncio.run_coroutine_threadsafe(_run(), loop).result()
+
+    async def iterate(self, iterator):
+        """동기 이터레이터를 이 레인의 워커에서 한 항목씩 진행 (스트리밍 응답용)"""
+        while True:
+            item = await self.run(next, iterator, _STOP)
+            if item is _STOP:
+                return
+            yield item
+
+    def stats(self):
+        return {"workers": self.workers, **self.admission.stats()}
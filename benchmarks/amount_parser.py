@@ -0,0 +1,218 @@
+"""금액 파서 벤치마크 — 통합 파서(korean_amount) vs 기존 보험사별 파서
+
+실행: python benchmarks/amount_parser.py [반복횟수]
+
+기존 함수는 통합 전 pdf_parser.py 구현을 그대로 복사해 둔 것 (비교 기준).
+결과가 다른 입력도 함께 출력한다 (복합 단위 1억5천만원 등은 통합 파서가 정확).
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import korean_amount  # noqa: E402
+
+
+# ══════════════════════════════════════════════
+# 기존 구현 (통합 전)
+# ══════════════════════════════════════════════
+
+def legacy_parse_amount(text):
+    """금액 텍스트를 숫자(원 단위)로 변환"""
+    if not text:
+        return None
+    text = text.replace(" ", "").replace(",", "")
+
+    if re.search(r'[가-힣]{2,}', text) and "원" not in text and "만" not in text and "억" not in text:
+        return None
+
+    match = re.search(r'(\d+)(억원|억)', text)
+    if match:
+        return int(match.group(1)) * 100000000
+
+    match = re.search(r'(\d+)(천만원)', text)
+    if match:
+        return int(match.group(1)) * 10000000
+
+    match = re.search(r'(\d+)(백만원|백만)', text)
+    if match:
+        return int(match.group(1)) * 1000000
+
+    match = re.search(r'(\d+)(만원|만)', text)
+    if match:
+        return int(match.group(1)) * 10000
+
+    match = re.search(r'(\d+)(천원)', text)
+    if match:
+        return int(match.group(1)) * 1000
+
+    match = re.search(r'(\d+)(원)?$', text)
+    if match:
+        num = int(match.group(1))
+        if num >= 10000:
+            return num
+
+    return None
+
+
+def legacy_parse_korean_amount(text):
+    """한글 금액을 원 단위 숫자로 변환 (KB)"""
+    text = text.replace(',', '').replace(' ', '')
+
+    match = re.match(r'(\d+)천(\d*)백만원', text)
+    if match:
+        thousands = int(match.group(1))
+        hundreds = int(match.group(2)) if match.group(2) else 0
+        return (thousands * 1000 + hundreds * 100) * 10000
+
+    match = re.match(r'(\d+)억(\d*천?만?)원?', text)
+    if match:
+        billions = int(match.group(1))
+        rest = match.group(2)
+        rest_val = 0
+        if rest:
+            rest_match = re.match(r'(\d+)천만', rest)
+            if rest_match:
+                rest_val = int(rest_match.group(1)) * 10000000
+            else:
+                rest_match = re.match(r'(\d+)만', rest)
+                if rest_match:
+                    rest_val = int(rest_match.group(1)) * 10000
+        return billions * 100000000 + rest_val
+
+    match = re.match(r'(\d+)천만원', text)
+    if match:
+        return int(match.group(1)) * 10000000
+
+    match = re.match(r'(\d+)백만원', text)
+    if match:
+        return int(match.group(1)) * 1000000
+
+    match = re.match(r'(\d+)만원', text)
+    if match:
+        return int(match.group(1)) * 10000
+
+    return None
+
+
+def legacy_extract_kb_amount(text):
+    """텍스트에서 KB 가입금액 패턴 추출 (원 단위 반환)"""
+    match = re.search(r'(\d+천\d*백만원|\d+억\d*천?만?원|\d+천만원|\d+백만원|\d+만원)', text)
+    if match:
+        return legacy_parse_korean_amount(match.group(1))
+    return None
+
+
+def legacy_parse_meritz_amount(text):
+    """메리츠 가입금액 파싱 (만원 단위 반환)"""
+    text = text.replace(' ', '').replace(',', '')
+    if text in ['안내참조', '세부보장참조', '세부보장', '참조']:
+        return None
+    if not any(c.isdigit() for c in text):
+        return None
+
+    m = re.match(r'^(\d+)억(\d*)([천만]?)(\d*)([만]?)원?$', text)
+    if m:
+        total = int(m.group(1)) * 10000
+        if m.group(2):
+            sub_num = int(m.group(2))
+            sub_unit = m.group(3)
+            if sub_unit == '천':
+                total += sub_num * 1000
+                if m.group(4):
+                    total += int(m.group(4))
+            elif sub_unit == '만':
+                total += sub_num
+            else:
+                total += sub_num
+        return total
+
+    m = re.match(r'^(\d+)천(\d*)만원?$', text)
+    if m:
+        total = int(m.group(1)) * 1000
+        if m.group(2):
+            total += int(m.group(2))
+        return total
+
+    m = re.match(r'^(\d+)백(\d*)만원?$', text)
+    if m:
+        total = int(m.group(1)) * 100
+        if m.group(2):
+            total += int(m.group(2))
+        return total
+
+    m = re.match(r'^(\d+)만원?$', text)
+    if m:
+        return int(m.group(1))
+    return None
+
+
+# ══════════════════════════════════════════════
+# 통합 파서 (보험사 정책 적용)
+# ══════════════════════════════════════════════
+
+def unified_meritz_amount(text):
+    amount = korean_amount.parse_korean_amount(text.replace(' ', ''), scaled=True)
+    return amount // 10000 if amount else None
+
+
+SAMPLES = [
+    "1억원", "1억", "2억5천만원", "1억5천만원", "1억2천", "5천만원", "3,000만원",
+    "1천5백만원", "5백만원", "1백50만원", "300만원", "20만원", "20만", "1만원",
+    "5천원", "50,000원", "100,000", "2,000", "10", "세부보장참조", "안내참조",
+    "간병인지원", "1천만원", "1천만", "", "  1,000 만원 ", "80세만기", "20년납",
+]
+
+KB_LINES = [
+    "암진단비 3,000만원 20년납", "질병사망 1억원", "뇌출혈진단비 1억2천만원 100세만기",
+    "상해입원일당 2만원", "유사암진단비 1천만원", "수술비 5백만원", "보장내용 세부보장참조",
+]
+
+CASES = [
+    ("parse_amount", legacy_parse_amount, korean_amount.parse_amount, SAMPLES),
+    ("kb _parse_korean_amount", legacy_parse_korean_amount,
+     lambda t: korean_amount.parse_korean_amount(t.replace(' ', ''), scaled=True),
+     [s for s in SAMPLES if s.strip().endswith("원") and ("만" in s or "억" in s)]),
+    ("kb _extract_kb_amount_from_text", legacy_extract_kb_amount,
+     lambda t: korean_amount.find_korean_amount(t, won_suffix=True), KB_LINES),
+    ("meritz parse_meritz_amount", legacy_parse_meritz_amount, unified_meritz_amount, SAMPLES),
+]
+
+
+def _clear_caches():
+    korean_amount.parse_amount.cache_clear()
+    korean_amount.parse_korean_amount.cache_clear()
+    korean_amount.find_korean_amount.cache_clear()
+
+
+def _bench(fn, samples, repeat, cold=False):
+    """호출당 평균 시간 (us) — cold면 반복마다 메모이즈 캐시를 비움"""
+    elapsed = 0.0
+    for _ in range(repeat):
+        if cold:
+            _clear_caches()
+        start = time.perf_counter()
+        for s in samples:
+            fn(s)
+        elapsed += time.perf_counter() - start
+    return elapsed / (repeat * len(samples)) * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for label, legacy, unified, samples in CASES:
+        legacy_us = _bench(legacy, samples, repeat)
+        cold_us = _bench(unified, samples, repeat, cold=True)
+        cached_us = _bench(unified, samples, repeat)
+        print(f"{label:<28} legacy {legacy_us:6.2f}us  unified cold {cold_us:6.2f}us  "
+              f"cached {cached_us:6.2f}us  (x{legacy_us / cold_us:.1f} / x{legacy_us / cached_us:.1f})")
+        for s in samples:
+            old, new = legacy(s), unified(s)
+            if old != new:
+                print(f"    차이: {s!r:<22} legacy={old}  unified={new}")
+
+
+if __name__ == "__main__":
+    main()
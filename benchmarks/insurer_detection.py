@@ -0,0 +1,125 @@
+"""보험사 감지 벤치마크 — 키워드 표(_detect_insurer_from_text) vs 기존 구현
+
+실행: python benchmarks/insurer_detection.py [무작위 샘플 수]
+
+기존 함수는 키워드 표로 합치기 전 pdf_parser.py 구현을 그대로 복사해 둔 것 (비교 기준).
+키워드·대소문자 변형·잡음 글자를 무작위로 섞은 텍스트에서 두 함수 결과가 같은지 확인하고,
+3페이지 크기 텍스트에서 시간을 비교한다.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pdf_parser import _detect_insurer_from_text  # noqa: E402
+
+
+# ══════════════════════════════════════════════
+# 기존 구현 (키워드 표 통합 전)
+# ══════════════════════════════════════════════
+
+def legacy_detect_insurer_from_text(text):
+    """이미 추출된 텍스트에서 보험사 감지"""
+    keywords_ordered = [
+        ("삼성생명", "samsung_life"),
+        ("삼성화재", "samsung"),
+        ("메리츠화재", "meritz"),
+        ("메리츠", "meritz"),
+        ("미래에셋생명", "mirae"),
+        ("미래에셋", "mirae"),
+        ("KB손해", "kb"), ("KB손보", "kb"),
+        ("KB 플러스", "kb"), ("KB플러스", "kb"),
+        ("DB손해", "db"), ("DB손보", "db"),
+        ("ABL", "abl"), ("에이비엘", "abl"),
+        ("흥국", "heungkuk"), ("한화", "hanwha"),
+        ("현대해상", "hyundai"), ("롯데손해", "lotte"),
+        ("NH농협", "nh"), ("동양생명", "dongyang"),
+        ("교보생명", "kyobo"), ("신한라이프", "shinhan"),
+        ("라이나생명", "lina"), ("라이나", "lina"),
+    ]
+    for keyword, insurer in keywords_ordered:
+        if keyword in text:
+            return insurer
+    if "kbinsure" in text.lower():
+        return "kb"
+    if "lina.co.kr" in text.lower():
+        return "lina"
+    if "meritzfire.com" in text.lower() or "1566-7711" in text:
+        return "meritz"
+    # DB손해보험: PDF에 "DB손해" 키워드 없이 "idbins.com" 또는 "프로미라이프" 포함
+    if "idbins.com" in text.lower() or "프로미라이프" in text:
+        return "db"
+    if "삼성" in text:
+        if any(kw in text for kw in ["생명보험", "건강보험", "종신보험", "The간편한", "다모은"]):
+            return "samsung_life"
+        return "samsung"
+    return None
+
+
+# ══════════════════════════════════════════════
+# 무작위 입력
+# ══════════════════════════════════════════════
+
+_PIECES = [
+    "삼성생명", "삼성화재", "삼성", "메리츠화재", "메리츠", "미래에셋생명", "미래에셋",
+    "KB손해", "KB손보", "KB 플러스", "KB플러스", "DB손해", "DB손보", "ABL", "에이비엘",
+    "흥국", "한화", "현대해상", "롯데손해", "NH농협", "동양생명", "교보생명", "신한라이프",
+    "라이나생명", "라이나", "kbinsure", "KBInsure", "lina.co.kr", "LINA.CO.KR", "meritzfire.com",
+    "MeritzFire.Com", "1566-7711", "idbins.com", "IDBINS.COM", "프로미라이프",
+    "생명보험", "건강보험", "종신보험", "The간편한", "다모은",
+    # 키워드 일부/인접 글자 (겹침·경계 확인용)
+    "삼", "성", "생명", "화재", "KB", "DB", "AB", "L", "라이", "나", "lina", "co.kr", ".com", "1566",
+]
+_NOISE = ["", " ", "\n", "보험", "가입금액", "x", "-", "(무)", "주계약"]
+
+
+def random_text(rng, max_pieces=6):
+    """키워드 조각과 잡음을 무작위로 이어 붙인 텍스트"""
+    parts = []
+    for _ in range(rng.randint(0, max_pieces)):
+        parts.append(rng.choice(_NOISE))
+        parts.append(rng.choice(_PIECES))
+    parts.append(rng.choice(_NOISE))
+    return "".join(parts)
+
+
+def mismatches(samples, seed=0):
+    """samples개 무작위 텍스트 중 기존 함수와 결과가 다른 (텍스트, 기존, 새) 목록"""
+    rng = random.Random(seed)
+    diffs = []
+    for _ in range(samples):
+        text = random_text(rng)
+        old, new = legacy_detect_insurer_from_text(text), _detect_insurer_from_text(text)
+        if old != new:
+            diffs.append((text, old, new))
+    return diffs
+
+
+def _bench(fn, texts):
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return (time.perf_counter() - start) / len(texts) * 1e6
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    diffs = mismatches(samples)
+    print(f"무작위 {samples}건 중 결과가 다른 입력 {len(diffs)}건")
+    for text, old, new in diffs[:20]:
+        print(f"    차이: {text!r}  legacy={old}  table={new}")
+
+    # 실제 페이지 크기 (앞 3페이지 ≈ 수천 자)에서 시간 비교
+    rng = random.Random(1)
+    pages = [random_text(rng, 400) for _ in range(200)]
+    # 키워드가 뒤쪽에만 있는 경우 (보험사명이 3페이지 하단에 처음 나오는 양식)
+    pages += ["보험 가입금액 안내 문구 " * 300 + random_text(rng) for _ in range(200)]
+    legacy_us = _bench(legacy_detect_insurer_from_text, pages)
+    table_us = _bench(_detect_insurer_from_text, pages)
+    print(f"3페이지 크기 텍스트: legacy {legacy_us:7.1f}us  table {table_us:7.1f}us  (x{legacy_us / table_us:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""상품명/보험료 스캐너 벤치마크 — 미리 컴파일한 스캐너 vs 기존 구현
+
+실행: python benchmarks/text_scanners.py [무작위 샘플 수]
+
+기존 함수는 미리 컴파일하기 전 pdf_parser.py 구현을 그대로 복사해 둔 것 (비교 기준).
+보험사별 상품명/보험료 줄과 잡음 줄을 무작위로 섞은 페이지에서 두 구현의 결과가 같은지 확인하고,
+페이지 크기 텍스트에서 시간을 비교한다.
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pdf_parser import _detect_product_name_from_text, _extract_premium_from_texts  # noqa: E402
+
+
+# ══════════════════════════════════════════════
+# 기존 구현 (미리 컴파일 전)
+# ══════════════════════════════════════════════
+
+def legacy_detect_product_name_from_text(page_texts):
+    """이미 추출된 페이지 텍스트에서 상품명 추출"""
+    for text in page_texts:
+        if not text:
+            continue
+        for line in text.split('\n'):
+            line = line.strip()
+
+            # 보험상품명 라벨이 있는 줄 (흥국생명 등)
+            product_label_match = re.search(r'보험상품명\s+(.+)', line)
+            if product_label_match:
+                name = product_label_match.group(1).strip()
+                # (무) 접두사 제거
+                name = re.sub(r'^\(무\)\s*', '', name).strip()
+                if len(name) > 4:
+                    return name[:50] if len(name) > 50 else name
+
+            kb_match = re.search(r'(KB\s*플러스\s*[^\(\n]+보험)', line)
+            if kb_match:
+                name = kb_match.group(1).strip()
+                name = re.sub(r'\(무배당\).*', '', name).strip()
+                return name[:30] if len(name) > 30 else name
+
+            kb_match2 = re.search(r'(KB\s*[^\(\n]*보험[^\(\n]*)\(무배당\)', line)
+            if kb_match2:
+                name = kb_match2.group(1).strip()
+                return name[:30] if len(name) > 30 else name
+
+            mirae_match = re.search(r'(M-케어\s*건강[^\(]*)', line)
+            if mirae_match:
+                name = mirae_match.group(1).strip()
+                return name[:30] if len(name) > 30 else name
+
+            if re.match(r'^\(무\)|^\(유\)', line):
+                name = re.sub(r'^\(무\)\s*|^\(유\)\s*', '', line)
+                # 상품명에 '보험' 포함 필수 (표지의 짧은 줄 제외)
+                if '보험' in name:
+                    name = name.strip()
+                    return name[:50] if len(name) > 50 else name
+                # '보험' 없으면 스킵 (표지 줄일 수 있음)
+
+            # 삼성화재: "무배당삼성화재 건강보험 천만안심(2601.13)..." 패턴
+            samsung_match2 = re.search(r'(?:무배당)?삼성화재\s+(.+?)(?:\([\d.]+\))', line)
+            if samsung_match2:
+                name = samsung_match2.group(1).strip()
+                return name[:30] if len(name) > 30 else name
+
+            # 삼성: "삼성 뉴골드보험(무배당)" 패턴 (레거시)
+            samsung_match = re.match(r'^삼성\s+(.+보험)', line)
+            if samsung_match:
+                name = samsung_match.group(1).strip()
+                name = re.sub(r'\(\d{4}\).*', '', name).strip()
+                return name[:30] if len(name) > 30 else name
+
+            meritz_match = re.search(r'(메리츠\s*[^\(\n]*보험[^\(\n]*)', line)
+            if meritz_match:
+                name = meritz_match.group(1).strip()
+                name = re.sub(r'\(무배당\).*', '', name).strip()
+                return name[:30] if len(name) > 30 else name
+
+            # 신한라이프: "신한통합건강보험 원(ONE)(무배당, 갱신형)" 패턴
+            shinhan_match = re.search(r'(신한통합[^\(\n]*보험[^\(\n]*?)(?:\s*원\(ONE\)|\(무배당)', line)
+            if shinhan_match:
+                name = shinhan_match.group(1).strip()
+                return name[:30] if len(name) > 30 else name
+            # 신한라이프 상품명 라벨: "상품명\n신한통합건강보험..."
+            if '신한통합' in line and '보험' in line:
+                name = re.sub(r'\(무배당.*\)|\(갱신형\)|\(생명보험\)', '', line).strip()
+                name = re.sub(r'\s*원\(ONE\)', '', name).strip()
+                if len(name) > 4 and '보험' in name:
+                    return name[:30] if len(name) > 30 else name
+
+            # 라이나생명: "무배당새로담는건강보험(해약환급금미지급형Ⅱ)" 패턴
+            lina_match = re.search(r'무배당(새로담는[^\(\n]*보험)', line)
+            if lina_match:
+                name = lina_match.group(1).strip()
+                # (해약환급금...) 부분 제거
+                name = re.sub(r'\(해약환급금.*', '', name).strip()
+                if len(name) > 4:
+                    return name[:30] if len(name) > 30 else name
+
+            # DB손해보험: "무배당 프로미라이프\n건강할때 가입하는 청춘어람플러스 종합보험2601" 패턴
+            db_match = re.search(r'(?:건강할때\s*가입하는\s*)?([^\n]*(?:종합보험|건강보험|보장보험|질병보험)[^\n]*\d{4})', line)
+            if db_match and 'idbins' not in line.lower() and '프로미라이프' not in line:
+                name = db_match.group(1).strip()
+                name = re.sub(r'\(무배당\).*', '', name).strip()
+                # "종합보험2601" 등에서 "종합보험" + 숫자코드 제거 → 핵심 상품명만 추출
+                name = re.sub(r'\s*(종합보험|건강보험|보장보험|질병보험)\d*$', '', name).strip()
+                if len(name) > 2:
+                    return name[:30] if len(name) > 30 else name
+
+            # 현대해상: "무배당현대해상퍼펙트플러스종합보험(연만기갱신형)(Hi2601)" 패턴
+            hyundai_match = re.search(r'(?:무배당)?현대해상(.+?종합보험|.+?보험)(?:\([^)]*\))', line)
+            if hyundai_match:
+                name = hyundai_match.group(1).strip()
+                # "보험" 등 접미사 제거하고 핵심 상품명만 추출
+                name = re.sub(r'종합보험$|보험$', '', name).strip()
+                if len(name) >= 2:
+                    return name[:30] if len(name) > 30 else name
+
+            # 흥국생명 상품명 감지
+            # 1) "(무)흥국 XXX보험" 또는 "무배당 흥국 XXX보험" 패턴 (상품명 확실)
+            heungkuk_product = re.search(r'(?:\(무\)\s*|\(무배당\)\s*|무배당\s+)(흥국\s*[^\(\n]*보험[^\(\n]*)', line)
+            if heungkuk_product:
+                name = heungkuk_product.group(1).strip()
+                name = re.sub(r'\(무배당\).*|\(무\).*', '', name).strip()
+                if len(name) > 4:
+                    return name[:30] if len(name) > 30 else name
+            # 2) "흥국 XXX보험" (회사명만 있는 줄 제외)
+            heungkuk_match = re.search(r'(흥국\s*(?:생명)?\s*[^\(\n]*보험[^\(\n]*)', line)
+            if heungkuk_match:
+                name = heungkuk_match.group(1).strip()
+                name = re.sub(r'\(무배당\).*|\(무\).*', '', name).strip()
+                # 흥국생명보험(주), 흥국생명보험주식회사 같은 회사명 제외
+                name_nospace = name.replace(" ", "")
+                if ('보험(주)' in name or '보험주식회사' in name_nospace or
+                    name_nospace in ['흥국생명보험', '흥국생명'] or
+                    '제안서' in name):
+                    continue
+                if len(name) > 4:
+                    return name[:30] if len(name) > 30 else name
+
+    return "상품명 미확인"
+
+
+def legacy_extract_premium_from_texts(page_texts):
+    """이미 추출된 페이지 텍스트에서 보험료 추출"""
+    patterns = [
+        r'실납입보험료\s*([\d,]+)\s*원',
+        r'1회차보험료\(할인후\)\s*([\d,]+)\s*원',
+        r'할인후초회보험료\s*([\d,]+)\s*원',
+        r'보장보험료\s*합계\s*([\d,]+)\s*원',
+        r'합\s*계\s*보\s*험\s*료\s*([\d,]+)\s*원',
+        r'합계보험료\s*([\d,]+)\s*원',
+        r'보험료\s*합계\s*([\d,]+)원',  # 신한라이프: "보험료 합계\n90,906원"
+        r'합\s*계\s*([\d,]+)',
+        r'보험료\s*[:\s]?\s*([\d,]+)\s*원',
+    ]
+    for text in page_texts:
+        if not text:
+            continue
+        for pattern in patterns:
+            match = re.search(pattern, text)
+            if match:
+                val = int(match.group(1).replace(',', ''))
+                if val >= 1000:
+                    return val
+    return None
+
+
+# ══════════════════════════════════════════════
+# 무작위 입력
+# ══════════════════════════════════════════════
+
+# 보험사별 상품명 줄 (패턴마다 최소 1개) + 회사명/표지 줄
+_PRODUCT_LINES = [
+    "보험상품명 (무)흥국생명 다사랑건강보험", "보험상품명 (무)짧음",
+    "KB 플러스 건강보험(무배당)", "KB 금쪽같은 자녀보험(무배당) 2601",
+    "M-케어 건강보험(무배당)", "(무)실속 종합보험", "(유)표지", "(무)건강보험 안내",
+    "무배당삼성화재 건강보험 천만안심(2601.13)", "삼성 뉴골드보험(2301) 안내",
+    "메리츠 알파플러스 건강보험(무배당)", "신한통합건강보험 원(ONE)(무배당, 갱신형)",
+    "신한통합건강보험(생명보험)", "무배당새로담는건강보험(해약환급금미지급형Ⅱ)",
+    "건강할때 가입하는 청춘어람플러스 종합보험2601", "무배당 프로미라이프 종합보험2601",
+    "www.idbins.com 질병보험 1234", "무배당현대해상퍼펙트플러스종합보험(연만기갱신형)(Hi2601)",
+    "(무)흥국 다사랑 암보험", "흥국생명보험(주)", "흥국 든든 건강보험 제안서", "흥국 든든 건강보험",
+]
+_PREMIUM_LINES = [
+    "실납입보험료 52,300원", "1회차보험료(할인후) 48,000 원", "할인후초회보험료 61,200원",
+    "보장보험료 합계 33,000원", "합 계 보 험 료 45,600원", "합계보험료 18,750원",
+    "보험료 합계\n90,906원", "합 계 12,340", "합계 500", "보험료: 7,700원", "보험료 900원",
+]
+_NOISE_LINES = [
+    "", "가입설계서", "피보험자 홍길동(남자 40세)", "보험기간 20년", "  ", "보장내용 안내",
+    "1 암진단비 1,000만원", "보험계약자 홍길동", "(무)", "KB", "삼성", "메리츠",
+]
+
+
+def random_pages(rng, max_pages=3, max_lines=12):
+    """상품명/보험료/잡음 줄을 섞은 페이지 텍스트 목록"""
+    pages = []
+    for _ in range(rng.randint(1, max_pages)):
+        lines = []
+        for _ in range(rng.randint(0, max_lines)):
+            pool = rng.choice((_PRODUCT_LINES, _PREMIUM_LINES, _NOISE_LINES, _NOISE_LINES))
+            line = rng.choice(pool)
+            if rng.random() < 0.2:
+                line = " " + line + " "
+            lines.append(line)
+        pages.append("\n".join(lines))
+    return pages
+
+
+def mismatches(samples, seed=0):
+    """samples개 무작위 입력 중 기존 구현과 결과가 다른 (함수명, 페이지, 기존, 새) 목록"""
+    rng = random.Random(seed)
+    diffs = []
+    for _ in range(samples):
+        pages = random_pages(rng)
+        for label, legacy, current in (
+            ("product", legacy_detect_product_name_from_text, _detect_product_name_from_text),
+            ("premium", legacy_extract_premium_from_texts, _extract_premium_from_texts),
+        ):
+            old, new = legacy(pages), current(pages)
+            if old != new:
+                diffs.append((label, pages, old, new))
+    return diffs
+
+
+def _bench(fn, inputs):
+    start = time.perf_counter()
+    for pages in inputs:
+        fn(pages)
+    return (time.perf_counter() - start) / len(inputs) * 1e6
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    diffs = mismatches(samples)
+    print(f"무작위 {samples}건 중 결과가 다른 입력 {len(diffs)}건")
+    for label, pages, old, new in diffs[:20]:
+        print(f"    차이({label}): {pages!r}  legacy={old!r}  precompiled={new!r}")
+
+    # 앞 10페이지(페이지당 수십 줄) 크기, 상품명/보험료는 뒤쪽 페이지에만
+    rng = random.Random(1)
+    inputs = []
+    for _ in range(50):
+        pages = ["\n".join(rng.choice(_NOISE_LINES) for _ in range(60)) for _ in range(9)]
+        pages.append(rng.choice(_PRODUCT_LINES) + "\n" + rng.choice(_PREMIUM_LINES))
+        inputs.append(pages)
+    for label, legacy, current in (
+        ("상품명", legacy_detect_product_name_from_text, _detect_product_name_from_text),
+        ("보험료", legacy_extract_premium_from_texts, _extract_premium_from_texts),
+    ):
+        legacy_us, current_us = _bench(legacy, inputs), _bench(current, inputs)
+        print(f"{label} 10페이지: legacy {legacy_us:7.1f}us  precompiled {current_us:7.1f}us  "
+              f"(x{legacy_us / current_us:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""보일러플레이트(약관/안내) 페이지 지문 인덱스
+
+가입제안서의 대부분은 보험사 공통 페이지(약관 요약, 유의사항, 공시 페이지)라서
+고객이 달라도 텍스트가 글자 그대로 같다. 이런 페이지도 '가입금액', '보장내용' 같은
+키워드를 포함해서 매번 테이블 추출 대상이 된다.
+
+특약 추출에 성공한 파싱에서 테이블을 뽑아 봤지만 특약이 하나도 안 나온 페이지의
+지문(NFC 정규화 + 공백/줄바꿈 제거 텍스트의 blake2b 해시)을 기록하고,
+BOILERPLATE_MIN_SEEN번 관측되면 보일러플레이트로 확정해 이후 테이블 추출에서 제외한다.
+특약이 나온 적 있는 지문은 표시해 두고 다시는 보일러플레이트로 학습하지 않는다.
+확정된 페이지도 BOILERPLATE_RECHECK_RATE 비율로는 제외하지 않고 다시 추출해서, 잘못 학습된
+페이지(보장 테이블이 있는 공통 표지 등)에서 특약이 나오면 확정을 취소한다.
+
+인덱스는 앱 전용 디렉터리(BOILERPLATE_DIR)의 JSON 파일로 저장해서 재시작 후에도 유지한다
+(PDF_BOILERPLATE_INDEX로 파일 경로 직접 지정, 빈 값이면 메모리만).
+"""
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from page_text import as_page_text
+
+BOILERPLATE_DIR = os.environ.get(
+    "BOILERPLATE_DIR", os.path.join(tempfile.gettempdir(), "insurance_matcher_boilerplate")
+)
+BOILERPLATE_INDEX_PATH = os.environ.get(
+    "PDF_BOILERPLATE_INDEX", os.path.join(BOILERPLATE_DIR, "pdf_boilerplate_index.json")
+)
+BOILERPLATE_MIN_SEEN = int(os.environ.get("PDF_BOILERPLATE_MIN_SEEN", "2"))
+BOILERPLATE_RECHECK_RATE = float(os.environ.get("PDF_BOILERPLATE_RECHECK_RATE", "0.05"))
+_HAD_COVERAGES = -1   # 특약이 나온 적 있는 지문 (학습 금지)
+_MAX_ENTRIES = 20000
+_SAVE_INTERVAL_SEC = 60
+_INDEX_VERSION = 1
+
+
+def page_fingerprint(text):
+    """페이지 텍스트 지문 (정규화 텍스트의 128bit 해시)"""
+    normalized = as_page_text(text).nfc.compact
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class BoilerplateIndex:
+    """페이지 지문 → 특약 없이 관측된 횟수 (특약이 나온 적 있으면 _HAD_COVERAGES, LRU, 최대 _MAX_ENTRIES개)"""
+
+    def __init__(self, path=BOILERPLATE_INDEX_PATH, min_seen=BOILERPLATE_MIN_SEEN,
+                 recheck_rate=BOILERPLATE_RECHECK_RATE):
+        self.path = path
+        self.min_seen = max(1, min_seen)
+        self.recheck_rate = recheck_rate
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()   # 파일 쓰기 직렬화 (스냅샷 순서대로 저장)
+        self._loaded = False
+        self._dirty = False
+        self._last_save = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.learned = 0
+        self.rechecks = 0
+        self.unlearned = 0
+
+    def _load(self):
+        """저장된 인덱스 로드 (처음 사용할 때 한 번) — lock 안에서 호출"""
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _INDEX_VERSION:
+                return
+            for fingerprint, count in data.get("pages", []):
+                self._seen[fingerprint] = int(count)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[WARN] Boilerplate index load failed ({self.path}): {e}")
+            self._seen.clear()
+
+    def _save(self):
+        """인덱스 저장 — lock 밖에서 호출
+
+        lock 안에서는 스냅샷만 뜨고, JSON 직렬화와 파일 쓰기는 lock 밖에서 해서
+        저장 중에도 known_pages/observe가 기다리지 않는다.
+        """
+        with self._save_lock:
+            with self._lock:
+                self._dirty = False
+                self._last_save = time.monotonic()
+                pages = list(self._seen.items())
+            if self.path:
+                self._write({"version": _INDEX_VERSION, "pages": pages})
+
+    def _write(self, data):
+        """JSON 파일 쓰기 (임시 파일에 쓰고 교체)"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARN] Boilerplate index save failed ({self.path}): {e}")
+
+    def known_pages(self, page_texts, page_indices):
+        """page_indices 중 보일러플레이트로 확정된 페이지 집합 (조회마다 hit/miss 집계)
+
+        확정된 페이지도 recheck_rate 비율로는 빼고 반환한다 (다시 추출해서 observe로 재검증).
+        """
+        fingerprints = {i: page_fingerprint(page_texts[i]) for i in page_indices if i < len(page_texts)}
+        known = set()
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            for i, fingerprint in fingerprints.items():
+                if self._seen.get(fingerprint, 0) >= self.min_seen:
+                    self._seen.move_to_end(fingerprint)
+                    if self.recheck_rate and random.random() < self.recheck_rate:
+                        self.rechecks += 1
+                        continue
+                    known.add(i)
+            self.hits += len(known)
+            self.misses += len(fingerprints) - len(known)
+        return known
+
+    def observe(self, page_texts, empty_pages, coverage_pages):
+        """특약 추출 성공 후 결과 기록 — empty_pages는 후보 횟수 +1, coverage_pages는 학습 금지로 표시"""
+        empty = [page_fingerprint(page_texts[i]) for i in empty_pages if i < len(page_texts)]
+        content = [page_fingerprint(page_texts[i]) for i in coverage_pages if i < len(page_texts)]
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            promoted = False
+            for fingerprint in content:
+                count = self._seen.get(fingerprint)
+                if count != _HAD_COVERAGES:
+                    if count is not None and count >= self.min_seen:
+                        self.unlearned += 1
+                    self._seen[fingerprint] = _HAD_COVERAGES
+                    self._dirty = True
+                self._seen.move_to_end(fingerprint)
+            for fingerprint in empty:
+                if self._seen.get(fingerprint) == _HAD_COVERAGES:
+                    continue
+                count = self._seen.get(fingerprint, 0) + 1
+                self._seen[fingerprint] = count
+                self._seen.move_to_end(fingerprint)
+                self._dirty = True
+                if count == self.min_seen:
+                    self.learned += 1
+                    promoted = True
+            while len(self._seen) > _MAX_ENTRIES:
+                self._seen.popitem(last=False)
+            save = self._dirty and (promoted or time.monotonic() - self._last_save >= _SAVE_INTERVAL_SEC)
+        if save:
+            self._save()
+
+    def stats(self):
+        """hit/miss 집계 + 인덱스 크기"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "learned": self.learned,
+                "rechecks": self.rechecks,
+                "unlearned": self.unlearned,
+                "known_pages": sum(1 for c in self._seen.values() if c >= self.min_seen),
+                "candidate_pages": sum(1 for c in self._seen.values() if 0 <= c < self.min_seen),
+                "coverage_pages": sum(1 for c in self._seen.values() if c == _HAD_COVERAGES),
+            }
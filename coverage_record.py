@@ -0,0 +1,114 @@
+"""특약 레코드(Coverage)와 추출 결과 수집기
+
+Coverage: 파서 → 매처로 전달되는 특약 1건. `{"특약명", "가입금액"}` dict 대신
+__slots__ 객체를 쓰고 특약명은 sys.intern으로 공유한다 (같은 특약명이 페이지/PDF마다
+반복되므로 문자열 1개만 유지). JSON 변환(to_dict)은 API 응답 직전에 한 번만 한다.
+
+CoverageCollector: 보험사별 파서마다 `if not any(r["특약명"] == name for r in results)`로
+중복을 검사하던 것을 특약명 인덱스(dict)로 대체 — 특약 수에 대해 O(1) 검사.
+추가 순서는 그대로 유지되고, 결과는 Coverage 리스트로 반환한다.
+
+병합 정책 (같은 특약명이 다시 나올 때):
+  - "first": 처음 나온 항목 유지 (기존 동작)
+  - "max":   가입금액이 더 큰 항목으로 교체 (위치는 처음 나온 자리 유지)
+"""
+
+import sys
+
+POLICY_FIRST = "first"
+POLICY_MAX = "max"
+
+
+class Coverage:
+    """특약 1건 — 특약명(name), 가입금액(amount, 원), 14급 지급액(grade14, KB 자동차사고부상)"""
+
+    __slots__ = ("name", "amount", "grade14")
+
+    def __init__(self, name, amount, grade14=None):
+        self.name = sys.intern(name)
+        self.amount = amount
+        self.grade14 = grade14
+
+    def __repr__(self):
+        return f"Coverage({self.name!r}, {self.amount!r})"
+
+    def rename(self, name):
+        self.name = sys.intern(name)
+
+    def to_dict(self):
+        """API 응답용 dict (기존 스키마: 특약명, 가입금액[, 14급지급액])"""
+        item = {"특약명": self.name, "가입금액": self.amount}
+        if self.grade14 is not None:
+            item["14급지급액"] = self.grade14
+        return item
+
+
+def coverages_to_dicts(coverages):
+    """Coverage 리스트 → API 응답용 dict 리스트"""
+    return [c.to_dict() for c in coverages]
+
+
+class CoverageCollector:
+    """특약명 인덱스가 있는 순서 유지 특약 목록"""
+
+    def __init__(self, policy=POLICY_FIRST):
+        if policy not in (POLICY_FIRST, POLICY_MAX):
+            raise ValueError(f"알 수 없는 병합 정책: {policy}")
+        self.policy = policy
+        self.items = []
+        self._index = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def get(self, name):
+        """특약명으로 항목 조회 (없으면 None)"""
+        return self._index.get(name)
+
+    def add(self, name, amount, grade14=None):
+        """특약 추가 — 새로 추가되면 True, 중복이면 정책 적용 후 False"""
+        existing = self._index.get(name)
+        if existing is None:
+            item = Coverage(name, amount, grade14)
+            self._index[item.name] = item
+            self.items.append(item)
+            return True
+        if self.policy == POLICY_MAX and (amount or 0) > (existing.amount or 0):
+            existing.amount = amount
+            existing.grade14 = grade14
+        return False
+
+    def add_item(self, item):
+        """Coverage 추가 — 새로 추가되면 True, 중복이면 정책 적용 후 False"""
+        existing = self._index.get(item.name)
+        if existing is None:
+            self._index[item.name] = item
+            self.items.append(item)
+            return True
+        if self.policy == POLICY_MAX and (item.amount or 0) > (existing.amount or 0):
+            existing.amount = item.amount
+            existing.grade14 = item.grade14
+        return False
+
+    def extend(self, items):
+        """Coverage 여러 개 추가 (순서대로 add_item)"""
+        for item in items:
+            self.add_item(item)
+        return self
+
+    def rename(self, old_name, new_name):
+        """특약명 변경 (인덱스 갱신) — new_name이 이미 있으면 변경하지 않고 False"""
+        item = self._index.get(old_name)
+        if item is None or new_name in self._index:
+            return False
+        del self._index[old_name]
+        item.rename(new_name)
+        self._index[item.name] = item
+        return True
+
@@ -0,0 +1,61 @@
+"""요청 단위 시간 예산 (파싱 단계 전체에 전달)
+
+PyMuPDF는 15초 스레드 타임아웃이 있지만 pdfplumber 테이블 추출과 폴백 경로는
+제한이 없어서, 느린 PDF는 클라이언트가 먼저 타임아웃되고 아무 결과도 못 받는다.
+
+Deadline은 요청 시작 시 만들어 각 단계에 넘긴다.
+  - timeout(기본값): 남은 시간으로 잘린 타임아웃 (스레드 join, 큐 대기 등)
+  - allow(단계, 여유): 여유 시간보다 많이 남았으면 True, 아니면 생략 단계로 기록하고 False
+  - stage(단계): with 블록 소요 시간을 단계별로 누적 (ms, StageTimings)
+생략된 단계가 하나라도 있으면 partial=True — 호출부는 지금까지의 결과를 그대로 반환한다.
+"""
+import os
+import time
+
+from timings import StageTimings
+
+PARSE_TIME_BUDGET_SEC = float(os.environ.get("PARSE_TIME_BUDGET_SEC", "50"))
+
+
+class Deadline(StageTimings):
+    """시간 예산 + 단계별 소요 시간 (budget_sec가 0/None이면 무제한)"""
+
+    def __init__(self, budget_sec=PARSE_TIME_BUDGET_SEC):
+        super().__init__()
+        self.budget_sec = budget_sec if budget_sec and budget_sec > 0 else None
+        self.expires_at = self.started_at + self.budget_sec if self.budget_sec else None
+        self.skipped = []
+
+    def remaining(self):
+        """남은 시간 (초) — 무제한이면 None"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def timeout(self, default):
+        """default와 남은 시간 중 작은 값"""
+        remaining = self.remaining()
+        return default if remaining is None else min(default, remaining)
+
+    def allow(self, stage, reserve_sec=0.0):
+        """단계 실행 여부 — 남은 시간이 reserve_sec 이하면 생략 단계로 기록하고 False"""
+        remaining = self.remaining()
+        if remaining is None or remaining > reserve_sec:
+            return True
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+        return False
+
+    def child(self):
+        """같은 만료 시각을 쓰는 새 Deadline (요청 안의 PDF별로 단계 시간/생략 단계 분리)"""
+        child = Deadline(None)
+        child.budget_sec = self.budget_sec
+        child.expires_at = self.expires_at
+        return child
+
+    @property
+    def partial(self):
+        return bool(self.skipped)
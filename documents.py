@@ -0,0 +1,137 @@
+"""업로드한 PDF의 파싱 결과 보관 (문서 id로 재매칭)
+
+상담원은 threshold, sheet_name을 바꿔 가며 같은 PDF로 여러 번 매칭한다. 매번 PDF를 다시
+올리고 다시 파싱하는 대신, 한 번 업로드해서 파싱 결과를 문서로 보관하고 id를 돌려준다.
+매칭 엔드포인트는 PDF 파일 대신 문서 id를 받아 match_coverages + Excel 기록만 다시 한다.
+
+  - 파싱 결과(parse_pdf_all_in_one 반환값)만 메모리에 보관 (PDF 원본은 보관하지 않음)
+  - 같은 내용의 PDF를 다시 올리면 파싱하지 않고 기존 파싱 결과로 새 문서를 만든다 (partial 결과는 제외)
+  - 마지막 사용 후 DOCUMENT_TTL_SEC가 지나면 삭제, DOCUMENT_MAX_COUNT개를 넘으면 오래 안 쓴 것부터 삭제
+"""
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+DOCUMENT_TTL_SEC = float(os.environ.get("DOCUMENT_TTL_SEC", "21600"))
+DOCUMENT_MAX_COUNT = int(os.environ.get("DOCUMENT_MAX_COUNT", "500"))
+
+
+class DocumentNotFound(KeyError):
+    """없거나 만료된 문서 id (missing: 찾지 못한 id 목록)"""
+
+    def __init__(self, missing):
+        super().__init__(", ".join(missing))
+        self.missing = missing
+
+
+class Document:
+    """업로드 PDF 1개의 파싱 결과"""
+
+    def __init__(self, filename, pdf_info, digest, size):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.pdf_info = pdf_info
+        self.digest = digest
+        self.size = size
+        self.created_at = time.time()
+        self.last_used_at = self.created_at
+
+    def to_dict(self):
+        """문서 요약 (특약 목록 제외)"""
+        pdf_info = self.pdf_info
+        return {
+            "document_id": self.id,
+            "filename": self.filename,
+            "size": self.size,
+            "insurer_code": pdf_info["insurer_code"],
+            "insurer_name": pdf_info["insurer_name"],
+            "product_name": pdf_info["product_name"],
+            "premium": pdf_info["premium"],
+            "coverage_count": len(pdf_info["coverages"]),
+            "partial": pdf_info["partial"],
+            "created_at": self.created_at,
+            "expires_at": self.last_used_at + DOCUMENT_TTL_SEC,
+        }
+
+
+class DocumentStore:
+    """문서 id → Document (마지막 사용 순서로 정렬, TTL + 개수 제한)"""
+
+    def __init__(self, ttl_sec=DOCUMENT_TTL_SEC, max_count=DOCUMENT_MAX_COUNT):
+        self.ttl_sec = ttl_sec
+        self.max_count = max_count
+        self._documents = OrderedDict()
+        self._by_digest = {}
+        self._lock = threading.Lock()
+        self.reused = 0
+
+    def find_parsed(self, digest):
+        """같은 내용(sha256)의 완전한 파싱 결과 (없으면 None)"""
+        self._sweep()
+        with self._lock:
+            document = self._documents.get(self._by_digest.get(digest))
+            if document is None:
+                return None
+            self._touch(document)
+            self.reused += 1
+            return document.pdf_info
+
+    def put(self, filename, pdf_info, digest, size):
+        document = Document(filename, pdf_info, digest, size)
+        with self._lock:
+            self._documents[document.id] = document
+            if not pdf_info["partial"]:
+                self._by_digest[digest] = document.id
+            while len(self._documents) > self.max_count:
+                _, evicted = self._documents.popitem(last=False)
+                self._forget_digest(evicted)
+        return document
+
+    def get(self, document_id):
+        """문서 조회 (없거나 만료되면 None)"""
+        self._sweep()
+        with self._lock:
+            document = self._documents.get(document_id)
+            if document is not None:
+                self._touch(document)
+            return document
+
+    def get_many(self, document_ids):
+        """문서 id 순서대로 조회 — 하나라도 없으면 DocumentNotFound"""
+        documents = [self.get(document_id) for document_id in document_ids]
+        missing = [i for i, d in zip(document_ids, documents) if d is None]
+        if missing:
+            raise DocumentNotFound(missing)
+        return documents
+
+    def delete(self, document_id):
+        with self._lock:
+            document = self._documents.pop(document_id, None)
+            if document is not None:
+                self._forget_digest(document)
+            return document is not None
+
+    def _touch(self, document):
+        document.last_used_at = time.time()
+        self._documents.move_to_end(document.id)
+
+    def _forget_digest(self, document):
+        if self._by_digest.get(document.digest) == document.id:
+            del self._by_digest[document.digest]
+
+    def _sweep(self):
+        """마지막 사용 후 보관 기간이 지난 문서 삭제 (오래 안 쓴 것부터 정렬되어 있음)"""
+        cutoff = time.time() - self.ttl_sec
+        with self._lock:
+            while self._documents:
+                document = next(iter(self._documents.values()))
+                if document.last_used_at > cutoff:
+                    break
+                self._documents.popitem(last=False)
+                self._forget_digest(document)
+
+    def stats(self):
+        with self._lock:
+            return {"count": len(self._documents), "max_count": self.max_count, "reused": self.reused}
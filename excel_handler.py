@@ -31,7 +31,13 @@ def find_structure(excel_path, sheet_name=None, search_col=2):
     """엑셀 보장분석표 구조 자동 탐지"""
     wb = openpyxl.load_workbook(excel_path)
     ws = wb[sheet_name] if sheet_name else wb.active
+    structure = sheet_structure(ws, search_col)
+    wb.close()
+    return structure
 
+
+def sheet_structure(ws, search_col=2):
+    """워크시트에서 보장분석표 구조 탐지 (find_structure 본체)"""
     structure = {
         "insurer_row": None,
         "product_row": None,
@@ -60,7 +66,6 @@ def find_structure(excel_path, sheet_name=None, search_col=2):
     if structure["start_row"] is None and structure["premium_row"]:
         structure["start_row"] = structure["premium_row"] + 3
 
-    wb.close()
     return structure
 
 
@@ -68,7 +73,13 @@ def read_excel_coverages(excel_path, sheet_name=None, coverage_col=2, amount_col
     """Excel 보장분석표에서 특약명 목록 읽기"""
     wb = openpyxl.load_workbook(excel_path)
     ws = wb[sheet_name] if sheet_name else wb.active
+    coverages = sheet_coverages(ws, coverage_col, amount_col, start_row)
+    wb.close()
+    return coverages
 
+
+def sheet_coverages(ws, coverage_col=2, amount_col=4, start_row=8):
+    """워크시트에서 특약명 목록 읽기 (read_excel_coverages 본체)"""
     coverages = []
     skip_values = [
         "주계약", "특약", "합계", "총보험료", "보장항목",
@@ -95,7 +106,6 @@ def read_excel_coverages(excel_path, sheet_name=None, coverage_col=2, amount_col
             "amount_col": amount_col
         })
 
-    wb.close()
     return coverages
 
 
@@ -0,0 +1,167 @@
+"""비동기 작업 큐 (대량 PDF 매칭용)
+
+/api/match, /api/match-with-summary는 파싱+매칭+Excel 기록이 끝날 때까지 HTTP 연결을
+붙잡고 있어서, PDF가 많은 고객은 로드밸런서 유휴 타임아웃(60초)에 걸려 실패한다.
+
+작업 API는 업로드 파일을 작업 폴더(JOB_DIR/<job_id>)에 저장하고 작업 id를 바로 반환한다.
+작업은 프로세스 안의 워커 스레드(JOB_WORKERS개)가 순서대로 실행하고, 클라이언트는
+상태(PDF별 진행률)를 조회하다가 끝나면 결과(JSON 또는 xlsx)를 받아 간다.
+
+  - 대기 중인 작업이 JOB_MAX_PENDING개를 넘으면 제출 거절 (JobQueueFull)
+  - 끝난 작업은 JOB_TTL_SEC 동안 보관 후 작업 폴더와 함께 삭제 (제출/조회 시 정리)
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "1"))
+JOB_MAX_PENDING = int(os.environ.get("JOB_MAX_PENDING", "20"))
+JOB_TTL_SEC = float(os.environ.get("JOB_TTL_SEC", "3600"))
+JOB_DIR = os.environ.get("JOB_DIR", os.path.join(tempfile.gettempdir(), "insurance_matcher_jobs"))
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 JOB_MAX_PENDING개 이상"""
+
+
+class Job:
+    """작업 1건 — 상태, PDF별 진행률, 결과(JSON 또는 파일 경로)"""
+
+    def __init__(self, kind, item_names, workdir):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.workdir = workdir
+        self.status = STATUS_QUEUED
+        self.items = [{"name": name, "status": STATUS_QUEUED} for name in item_names]
+        self.result = None
+        self.result_path = None
+        self.result_filename = None
+        self.error = None
+        self.traceback = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def file_path(self, name):
+        """작업 폴더 안의 파일 경로"""
+        return os.path.join(self.workdir, name)
+
+    def item_started(self, index):
+        with self._lock:
+            if index < len(self.items):
+                self.items[index]["status"] = STATUS_RUNNING
+
+    def item_finished(self, index, **info):
+        """PDF 1개 완료 — 다음 PDF를 진행 중으로 표시"""
+        with self._lock:
+            self.items[index].update(info, status=STATUS_DONE)
+            if index + 1 < len(self.items):
+                self.items[index + 1]["status"] = STATUS_RUNNING
+
+    def to_dict(self):
+        """상태 조회 응답"""
+        with self._lock:
+            items = [dict(item) for item in self.items]
+        done = sum(1 for item in items if item["status"] == STATUS_DONE)
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {"done": done, "total": len(items), "items": items},
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """워커 스레드 수가 제한된 프로세스 내 작업 큐 (결과는 TTL 동안 보관)"""
+
+    def __init__(self, workers=JOB_WORKERS, max_pending=JOB_MAX_PENDING, ttl_sec=JOB_TTL_SEC, root=JOB_DIR):
+        self.max_pending = max_pending
+        self.ttl_sec = ttl_sec
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind, item_names, files, run):
+        """작업 제출 — files({파일명: bytes})를 작업 폴더에 저장하고 run(job)을 워커에서 실행
+
+        run의 반환값이 작업 결과(JSON)가 된다 (파일 결과는 run 안에서 job.result_path 지정).
+        """
+        self._sweep()
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job.status == STATUS_QUEUED)
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 ({pending}건)")
+            os.makedirs(self.root, exist_ok=True)
+            job = Job(kind, item_names, tempfile.mkdtemp(prefix="job_", dir=self.root))
+            self._jobs[job.id] = job
+        try:
+            for name, content in files.items():
+                with open(job.file_path(name), "wb") as f:
+                    f.write(content)
+        except OSError:
+            self._discard(job)
+            raise
+        self._executor.submit(self._run, job, run)
+        return job
+
+    def get(self, job_id):
+        """작업 조회 (없거나 만료되면 None)"""
+        self._sweep()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, run):
+        job.status = STATUS_RUNNING
+        job.started_at = time.time()
+        if job.items:
+            job.item_started(0)
+        try:
+            job.result = run(job)
+            job.status = STATUS_DONE
+        except Exception as e:
+            print(f"[WARN] Job {job.id} failed: {e}")
+            job.error = str(e)
+            job.traceback = traceback.format_exc()
+            job.status = STATUS_FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def _sweep(self):
+        """보관 기간이 지난 작업 삭제 (작업 폴더 포함)"""
+        now = time.time()
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job.finished_at is not None and now - job.finished_at > self.ttl_sec
+            ]
+        for job in expired:
+            self._discard(job)
+
+    def _discard(self, job):
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        shutil.rmtree(job.workdir, ignore_errors=True)
+
+    def stats(self):
+        """상태별 작업 수"""
+        with self._lock:
+            counts = {STATUS_QUEUED: 0, STATUS_RUNNING: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
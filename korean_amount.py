@@ -0,0 +1,107 @@
+"""한글 금액 파서 (억/천만/백만/만/천/원 조합 + 콤마 표기)
+
+보험사 파서마다 따로 있던 금액 정규식을 하나의 컴파일된 문법으로 통합.
+  - 1억5천만원, 1천5백만원, 1백50만원, 3,000만원, 20만, 5천원, 50,000원
+  - 억 뒤에 만이 생략된 표기 (1억2천 = 1억2천만)
+  - 단위 묶음 사이 공백 (1억 5천만원, 3천 5백만원) — 단위 없는 숫자 앞 공백은 이어 붙이지 않음
+같은 셀 문자열이 페이지/행마다 반복되므로 결과는 lru_cache로 메모이즈한다.
+
+  parse_korean_amount  — 문자열 전체가 금액 하나 (원 단위 반환)
+  find_korean_amount   — 줄 안에서 첫 번째 금액 찾기
+  parse_amount         — 테이블 셀 금액 (기존 pdf_parser.parse_amount 정책)
+"""
+import re
+from functools import lru_cache
+
+_AMOUNT_CACHE_SIZE = 8192
+
+_NUM = r'\d[\d,]*'
+_AMOUNT_RE = re.compile(
+    r'(?=\d)'
+    rf'(?:(?P<eok>{_NUM})\s*억)?'
+    rf'(?:\s*(?:(?P<man_k>{_NUM})\s*천\s*)?(?:(?P<man_h>{_NUM})\s*백\s*)?(?P<man>{_NUM})?\s*(?P<man_unit>만))?'
+    rf'(?:\s*(?P<k>{_NUM})\s*천)?(?:\s*(?P<h>{_NUM})\s*백)?(?P<won>{_NUM})?'
+    r'\s*(?P<won_unit>원)?'
+)
+_HANGUL_WORD_RE = re.compile(r'[가-힣]{2,}')
+
+
+def _num(value):
+    return int(value.replace(',', '')) if value else 0
+
+
+def _match_value(match):
+    """금액 매치 → (원 단위 금액, 억/만 단위 포함 여부, 천/백 단위 포함 여부)"""
+    eok, man_k, man_h, man, man_unit, k, h, won, _ = match.groups()
+    man_val = _num(man_k) * 1000 + _num(man_h) * 100 + _num(man)
+    rest = _num(k) * 1000 + _num(h) * 100 + _num(won)
+    has_man = man_unit is not None
+    has_kh = bool(k or h)
+    if eok and not has_man and has_kh and not won:
+        # 1억2천 → 1억2천만 (억 뒤 천/백은 만 단위 생략 표기)
+        man_val, rest, has_man = rest, 0, True
+    return _num(eok) * 100000000 + man_val * 10000 + rest, bool(eok) or has_man, has_kh
+
+
+@lru_cache(maxsize=_AMOUNT_CACHE_SIZE)
+def parse_korean_amount(text, scaled=False):
+    """금액 문자열 하나를 원 단위 정수로 변환 (문자열 전체가 금액이어야 함)
+
+    Args:
+        scaled: True면 억/만 단위가 있는 금액만 인정 (예: '50000' → None)
+    """
+    if not text:
+        return None
+    match = _AMOUNT_RE.fullmatch(text.strip())
+    if not match:
+        return None
+    value, has_scale, _ = _match_value(match)
+    if scaled and not has_scale:
+        return None
+    return value
+
+
+@lru_cache(maxsize=_AMOUNT_CACHE_SIZE)
+def find_korean_amount(text, won_suffix=False):
+    """줄 안에서 억/만 단위가 있는 첫 번째 금액 (원 단위)
+
+    Args:
+        won_suffix: True면 '원'으로 끝나는 금액만 인정 (예: '20만' 제외, '20만원' 인정)
+    """
+    if not text:
+        return None
+    for match in _AMOUNT_RE.finditer(text):
+        if won_suffix and match.group("won_unit") is None:
+            continue
+        value, has_scale, _ = _match_value(match)
+        if has_scale:
+            return value
+    return None
+
+
+@lru_cache(maxsize=_AMOUNT_CACHE_SIZE)
+def parse_amount(text):
+    """테이블 셀 금액 텍스트를 원 단위로 변환
+
+    - 공백/콤마 무시, 한글 단어만 있고 원/만/억이 없으면 None ('세부보장참조' 등)
+    - 단위(억/만/천/백)가 있는 금액 중 가장 큰 값 — 억/만 없이 천/백만 있으면 '원'이 붙어야 함
+      ('5천원'은 5000, '3천'은 None)
+    - 단위 없는 숫자(또는 숫자+원)는 셀 끝에 있고 1만 이상일 때만 인정 (보험기간/나이 제외)
+    """
+    if not text:
+        return None
+    text = text.replace(" ", "").replace(",", "")
+
+    if _HANGUL_WORD_RE.search(text) and "원" not in text and "만" not in text and "억" not in text:
+        return None
+
+    best = None
+    for match in _AMOUNT_RE.finditer(text):
+        value, has_scale, has_kh = _match_value(match)
+        if not has_scale and has_kh and match.group("won_unit") is None:
+            continue
+        if not (has_scale or has_kh) and not (match.end() == len(text) and value >= 10000):
+            continue
+        if best is None or value > best:
+            best = value
+    return best
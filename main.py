@@ -1,14 +1,33 @@
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import os
 import tempfile
 import shutil
+import time
 import traceback
 from urllib.parse import quote
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse, PlainTextResponse
 from typing import List, Optional
 
-from pdf_parser import parse_pdf_all_in_one
+from admission import LANE_BULK, LANE_INTERACTIVE, AdmissionRejected, Lane, request_weight
+from deadline import Deadline
+import metrics
+from pdf_parser import parse_pdf_all_in_one, boilerplate_stats, layout_cache_stats
+from coverage_record import coverages_to_dicts
+from timings import StageTimings
+from profiling import (
+    REQUEST_FORMATS, SAMPLER_FORMATS, PROFILE_MAX_SEC,
+    RequestProfiler, StackSampler, admin_enabled, check_admin_token,
+)
+from singleflight import AsyncSingleFlight, SingleFlight, content_key, file_digest
+from documents import Document, DocumentNotFound, DocumentStore
+from templates import TemplateRegistry, TemplateRegistryFull
+from jobs import JobQueue, JobQueueFull, STATUS_DONE, STATUS_FAILED
 from excel_handler import (
     read_excel_coverages, write_matched_amounts,
     write_insurer_info, write_premium, find_structure
@@ -54,275 +73,1204 @@ async def health():
     return {"status": "ok"}
 
 
+# ══════════════════════════════════════════════
+# 수용 제어 + 우선순위 레인 (파싱 엔드포인트 동시 처리 제한)
+# ══════════════════════════════════════════════
+# 파싱/매칭 엔드포인트는 업로드 가중치(PDF 개수 + 크기)만큼 레인의 자리를 확보한 뒤
+# 레인 전용 워커에서 처리한다. 자리가 없으면 대기하고, 대기열이 가득 차면 429,
+# 대기 시간을 넘기면 503 (Retry-After 포함).
+#   interactive — /api/parse-pdf 미리보기 (bulk 부하와 분리)
+#   bulk        — 여러 PDF 매칭 (match, match-with-summary, stream)
+
+interactive_lane = Lane(LANE_INTERACTIVE)
+bulk_lane = Lane(LANE_BULK)
+
+
+def _upload_weight(upload_files):
+    """업로드 파일 목록의 수용 가중치"""
+    return request_weight(getattr(f, "size", None) for f in upload_files)
+
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected(request, exc):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"success": False, "error": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.get("/api/admission")
+async def admission_status():
+    """수용 제어 현황 — 레인별 대기열 길이/대기 시간 (오토스케일링 지표)"""
+    return {
+        "lanes": {lane.name: lane.stats() for lane in (interactive_lane, bulk_lane)},
+        "jobs": job_queue.stats(),
+    }
+
+
+# ══════════════════════════════════════════════
+# Prometheus 지표 (/metrics)
+# ══════════════════════════════════════════════
+# 엔드포인트별 요청 수/지연 시간과 업로드 바이트는 미들웨어에서, 보험사별 파싱/매칭 지표는
+# _parse_pdf/_match에서 기록한다. 캐시 적중률과 대기열 현황은 조회 시점에 수집한다.
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.monotonic()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # 라우트 템플릿(/api/jobs/{job_id})으로 묶는다 — 없는 경로는 하나로 (라벨 폭증 방지)
+        route = request.scope.get("route")
+        endpoint = getattr(route, "path", None) or "unmatched"
+        metrics.http_requests.inc(endpoint=endpoint, method=request.method, status=status)
+        metrics.http_request_duration.observe(time.monotonic() - start, endpoint=endpoint)
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and request.method == "POST":
+            metrics.upload_bytes.inc(int(content_length), endpoint=endpoint)
+
+
+@metrics.registry.collector
+def _cache_metrics():
+    boilerplate = boilerplate_stats()
+    layout = layout_cache_stats()
+    return [
+        ("layout_cache_lookups_total", "counter", "테이블 영역(레이아웃) 캐시 조회 수",
+         [({"result": "hit"}, layout["hits"]), ({"result": "miss"}, layout["misses"]),
+          ({"result": "rejected"}, layout["rejected"])]),
+        ("layout_cache_entries", "gauge", "테이블 영역 캐시 항목 수", [({}, layout["entries"])]),
+        ("boilerplate_lookups_total", "counter", "보일러플레이트 페이지 인덱스 조회 수",
+         [({"result": "hit"}, boilerplate["hits"]), ({"result": "miss"}, boilerplate["misses"])]),
+        ("boilerplate_rechecks_total", "counter", "확정된 보일러플레이트 페이지를 다시 추출해 검증한 횟수",
+         [({}, boilerplate["rechecks"])]),
+        ("boilerplate_unlearned_total", "counter", "재검증에서 특약이 나와 확정을 취소한 페이지 수",
+         [({}, boilerplate["unlearned"])]),
+    ]
+
+
+@metrics.registry.collector
+def _admission_metrics():
+    lanes = {lane.name: lane.stats() for lane in (interactive_lane, bulk_lane)}
+    return [
+        ("lane_queue_depth", "gauge", "레인별 수용 대기 요청 수",
+         [({"lane": name}, s["queue_depth"]) for name, s in lanes.items()]),
+        ("lane_in_use", "gauge", "레인별 사용 중인 가중치",
+         [({"lane": name}, s["in_use"]) for name, s in lanes.items()]),
+        ("lane_admitted_total", "counter", "레인별 수용된 요청 수",
+         [({"lane": name}, s["admitted"]) for name, s in lanes.items()]),
+        ("lane_rejected_total", "counter", "레인별 거절된 요청 수 (429 대기열 가득, 503 대기 초과)",
+         [({"lane": name, "reason": reason}, s[f"rejected_{reason}"])
+          for name, s in lanes.items() for reason in ("queue_full", "timeout")]),
+        ("jobs", "gauge", "상태별 작업 수",
+         [({"status": status}, count) for status, count in job_queue.stats().items()]),
+    ]
+
+
+@metrics.registry.collector
+def _singleflight_metrics():
+    flights = {"parse": parse_flight.stats(), "match": match_flight.stats()}
+    return [
+        ("singleflight_calls_total", "counter",
+         "동일 작업 합치기 — executed: 실제 실행, shared: 진행 중인 결과를 공유 (절약된 실행)",
+         [({"flight": name, "result": result}, s[result])
+          for name, s in flights.items() for result in ("executed", "shared")]),
+        ("singleflight_in_flight", "gauge", "진행 중인 합치기 대상 작업 수",
+         [({"flight": name}, s["in_flight"]) for name, s in flights.items()]),
+    ]
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return PlainTextResponse(metrics.registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+# ══════════════════════════════════════════════
+# 프로파일링 (관리자 토큰 — X-Admin-Token 헤더)
+# ══════════════════════════════════════════════
+# 요청 1건: parse-pdf, match-with-summary, match에 X-Profile 헤더 또는 ?profile=pstats|collapsed
+#           → 정상 처리 후 응답 대신 프로파일 결과(text/plain)를 반환
+# 워커 전체: GET /debug/profile?seconds=N&format=collapsed|top (한 번에 1건)
+
+_debug_profile_lock = asyncio.Lock()
+
+
+def _require_admin(request):
+    if not check_admin_token(request.headers.get("x-admin-token")):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 필요합니다")
+
+
+def _request_profiler(request):
+    """X-Profile 헤더 또는 ?profile=이 있으면 RequestProfiler, 없으면 None"""
+    output_format = request.query_params.get("profile") or request.headers.get("x-profile")
+    if not output_format:
+        return None
+    _require_admin(request)
+    if output_format not in REQUEST_FORMATS:
+        raise HTTPException(
+            status_code=400, detail=f"profile은 {', '.join(REQUEST_FORMATS)} 중 하나여야 합니다"
+        )
+    return RequestProfiler(output_format)
+
+
+def _profile_response(profiler, timings):
+    return PlainTextResponse(
+        profiler.render(),
+        headers={"X-Profile-Format": profiler.output_format, "Server-Timing": timings.server_timing_header()},
+    )
+
+
+@app.get("/debug/profile")
+async def debug_profile(
+    request: Request,
+    seconds: float = Query(10, gt=0),
+    output_format: str = Query("collapsed", alias="format"),
+):
+    """워커 전체 스택 샘플링 (최대 PROFILE_MAX_SEC초) — collapsed stack 또는 함수별 샘플 수"""
+    if not admin_enabled():
+        raise HTTPException(status_code=404, detail="Not Found")
+    _require_admin(request)
+    if output_format not in SAMPLER_FORMATS:
+        raise HTTPException(
+            status_code=400, detail=f"format은 {', '.join(SAMPLER_FORMATS)} 중 하나여야 합니다"
+        )
+    if _debug_profile_lock.locked():
+        raise HTTPException(status_code=409, detail="다른 프로파일링이 진행 중입니다")
+    async with _debug_profile_lock:
+        sampler = StackSampler().start()
+        try:
+            await asyncio.sleep(min(seconds, PROFILE_MAX_SEC))
+        finally:
+            sampler.stop()
+    return PlainTextResponse(sampler.render(output_format), headers={"X-Profile-Format": output_format})
+
+
+# ══════════════════════════════════════════════
+# PDF별 파싱 + 매칭 (동기 — 스레드풀/작업 워커에서 실행)
+# ══════════════════════════════════════════════
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.document"
+
+
+def _save_upload(content, suffix):
+    """업로드 내용을 임시 파일로 저장하고 경로 반환"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(content)
+        return tmp.name
+
+
+# 같은 PDF(내용 해시)를 동시에 파싱하는 요청은 1번만 파싱하고 결과를 공유
+# (예: 같은 업로드로 parse-pdf와 match-with-summary를 동시에 호출)
+parse_flight = SingleFlight()
+
+
+def _parse_pdf(pdf_path, deadline=None):
+    """PDF 파싱 (통합 1회 오픈) + 보험사별 파싱 지표 기록
+
+    같은 내용의 PDF가 다른 요청에서 파싱 중이면 그 결과를 기다려 공유한다
+    (결과는 호출자끼리 읽기 전용으로 공유 — 수정하지 않는다).
+    """
+    return parse_flight.do(file_digest(pdf_path), _parse_pdf_once, pdf_path, deadline)
+
+
+def _parse_pdf_once(pdf_path, deadline):
+    pdf_info = parse_pdf_all_in_one(pdf_path, deadline=deadline)
+    metrics.observe_parse(pdf_info)
+    return pdf_info
+
+
+def _load_pdf_info(source, deadline=None):
+    """PDF 항목의 파싱 결과 — 경로면 파싱, 업로드 문서(Document)면 보관된 결과"""
+    if isinstance(source, Document):
+        return source.pdf_info
+    return _parse_pdf(source, deadline=deadline)
+
+
+def _match(pdf_info, excel_coverages, threshold):
+    """특약 매칭 + 보험사별 매칭/미매칭 수 기록"""
+    start = time.monotonic()
+    result = match_coverages(pdf_info["coverages"], excel_coverages, threshold)
+    metrics.observe_match(pdf_info["insurer_code"], result, time.monotonic() - start)
+    return result
+
+
+def _pdf_timings(pdf_info, pdf_timings):
+    """PDF 1개의 단계별 소요 시간 블록 (보험사 코드, 페이지 수 태그)"""
+    stats = pdf_info.get("stats") or {}
+    return {
+        "insurer_code": pdf_info["insurer_code"],
+        "page_count": stats.get("page_count"),
+        "parse_ms": stats.get("elapsed_ms"),
+        "parse_stages": stats.get("timings", {}),
+        **pdf_timings.timings,
+    }
+
+
+def _add_pdf_timings(timings, pdf_info, pdf_timings=None, parsed=True):
+    """요청 단계 시간에 PDF 1개의 파싱 단계(parse_*)와 엑셀/매칭 단계 합산
+
+    parsed=False(보관된 업로드 문서)면 이번 요청에서 파싱하지 않았으므로 파싱 단계는 뺀다.
+    """
+    stats = pdf_info.get("stats") or {}
+    if parsed:
+        timings.add("parse", stats.get("elapsed_ms", 0.0))
+        timings.describe("parse", f"{pdf_info['insurer_code'] or 'unknown'}:{stats.get('page_count', 0)}p")
+        for name, elapsed_ms in stats.get("timings", {}).items():
+            timings.add(f"parse_{name}", elapsed_ms)
+    if pdf_timings is not None:
+        for name, elapsed_ms in pdf_timings.timings.items():
+            timings.add(name, elapsed_ms)
+
+
+def _summary_entry(pdf_idx, pdf_name, pdf_info, result):
+    """PDF 1개의 매칭 결과 (match-with-summary results 항목)"""
+    pdf_coverages = pdf_info["coverages"]
+    matched = result["matched"]
+    return {
+        "pdf_name": pdf_name,
+        "pdf_index": pdf_idx,
+        "column_letter": chr(ord('D') + pdf_idx),
+        "insurer_code": pdf_info["insurer_code"],
+        "insurer_name": pdf_info["insurer_name"],
+        "product_name": pdf_info["product_name"],
+        "premium": pdf_info["premium"],
+        "partial": pdf_info["partial"],
+        "pdf_coverage_count": len(pdf_coverages),
+        "pdf_coverages": [
+            {"특약명": c.name, "가입금액": c.amount}
+            for c in pdf_coverages
+        ],
+        "matched_count": len(matched),
+        "unmatched_excel_count": len(result["unmatched_excel"]),
+        "unmatched_pdf_count": len(result["unmatched_pdf"]),
+        "matched": [
+            {
+                "excel_row": m["excel_row"],
+                "excel_특약명": m["excel_특약명"],
+                "pdf_특약명": m["pdf_특약명"],
+                "가입금액": m["가입금액"],
+                "가입금액_만원": m["가입금액"] // 10000,
+                "유사도": m["유사도"],
+            }
+            for m in matched
+        ],
+        "unmatched_excel": [
+            {"특약명": u["특약명"], "row": u["row"]}
+            for u in result["unmatched_excel"]
+        ],
+        "unmatched_pdf": [
+            {"특약명": u.name, "가입금액": u.amount, "가입금액_만원": u.amount // 10000}
+            for u in result["unmatched_pdf"]
+        ],
+    }
+
+
+def _excel_layout(excel_path, sheet_name, template=None):
+    """Excel 구조 + PDF 열별 특약 목록 읽기 함수 read_coverages(amount_col)
+
+    업로드 Excel은 파일에서 구조를 탐지하고 PDF마다 특약명을 읽는다.
+    등록 템플릿은 미리 계산한 구조/특약 행을 쓴다 (파일 읽기 없음).
+    """
+    if template is not None:
+        sheet = template.sheet(sheet_name)
+        return sheet.structure, sheet.coverages
+    structure = find_structure(excel_path, sheet_name, 2)
+    start_row = structure["start_row"] or 8
+    return structure, functools.partial(_read_coverages, excel_path, sheet_name, start_row)
+
+
+def _read_coverages(excel_path, sheet_name, start_row, amount_col):
+    return read_excel_coverages(excel_path, sheet_name, 2, amount_col, start_row)
+
+
+def _iter_match_summary(pdf_items, read_coverages, threshold, deadline=None, timings=None, include_timings=False):
+    """(파일명, 경로 또는 Document) 목록을 순서대로 파싱+매칭 — PDF별 결과 항목을 하나씩 yield
+
+    read_coverages(amount_col): 해당 PDF 열의 Excel 특약 목록 (_excel_layout)
+    timings(StageTimings)가 주어지면 PDF별 단계 시간을 합산하고, include_timings면
+    결과 항목에 timings 블록을 붙인다.
+    """
+    for pdf_idx, (pdf_name, source) in enumerate(pdf_items):
+        current_amount_col = 4 + pdf_idx  # D=4, E=5, F=6, ...
+        pdf_timings = StageTimings()
+
+        # PDF 파싱 (통합 1회 오픈, 업로드 문서는 보관된 결과)
+        pdf_info = _load_pdf_info(source, deadline=deadline)
+
+        # Excel에서 특약명 읽기
+        with pdf_timings.stage("excel_read"):
+            excel_coverages = read_coverages(current_amount_col)
+
+        # 매칭
+        with pdf_timings.stage("match"):
+            result = _match(pdf_info, excel_coverages, threshold)
+
+        entry = _summary_entry(pdf_idx, pdf_name, pdf_info, result)
+        if isinstance(source, Document):
+            entry["document_id"] = source.id
+        if timings is not None:
+            _add_pdf_timings(timings, pdf_info, pdf_timings, parsed=not isinstance(source, Document))
+        if include_timings:
+            entry["timings"] = _pdf_timings(pdf_info, pdf_timings)
+        yield entry
+
+
+def _match_summary(pdf_items, excel_path, sheet_name, customer_name, threshold, deadline=None, on_result=None,
+                   timings=None, include_timings=False, template=None):
+    """PDF 전체 매칭 결과 JSON (on_result: PDF 1개 끝날 때마다 결과 항목으로 호출)
+
+    template(등록 템플릿)이 있으면 excel_path 대신 템플릿의 미리 계산한 구조/특약 행을 쓴다.
+    """
+    timings = timings if timings is not None else StageTimings()
+
+    # 구조 자동 탐지
+    with timings.stage("excel_structure"):
+        structure, read_coverages = _excel_layout(excel_path, sheet_name, template)
+
+    all_results = []
+    for entry in _iter_match_summary(
+        pdf_items, read_coverages, threshold, deadline, timings, include_timings
+    ):
+        all_results.append(entry)
+        if on_result:
+            on_result(entry)
+
+    summary = {
+        "success": True,
+        "customer_name": customer_name,
+        "structure": structure,
+        "total_pdfs": len(pdf_items),
+        "partial": any(r["partial"] for r in all_results),
+        "results": all_results,
+    }
+    if include_timings:
+        summary["timings"] = {"stages": dict(timings.timings), "total_ms": timings.elapsed_ms()}
+    return summary
+
+
+def _match_excel(pdf_items, output_path, sheet_name, threshold, deadline=None, on_result=None, timings=None):
+    """PDF별 매칭 결과를 output_path Excel에 기록 — 시간 예산 초과로 일부만 파싱됐으면 True
+
+    on_result(pdf_idx, pdf_info, result): PDF 1개 기록이 끝날 때마다 호출
+    timings(StageTimings): 파싱/엑셀 읽기·쓰기/매칭 단계 시간 합산
+    """
+    timings = timings if timings is not None else StageTimings()
+
+    # 구조 자동 탐지
+    with timings.stage("excel_structure"):
+        structure = find_structure(output_path, sheet_name, 2)
+    insurer_name_row = structure["insurer_row"] or 4
+    product_name_row = structure["product_row"] or 5
+    premium_row = structure["premium_row"] or 6
+    start_row = structure["start_row"] or 8
+    partial = False
+
+    for pdf_idx, (_, source) in enumerate(pdf_items):
+        current_amount_col = 4 + pdf_idx
+
+        # PDF 파싱 (통합 1회 오픈, 업로드 문서는 보관된 결과)
+        pdf_info = _load_pdf_info(source, deadline=deadline)
+        insurer_display = pdf_info["insurer_name"]
+        product_name = pdf_info["product_name"]
+        premium = pdf_info["premium"]
+        partial = partial or pdf_info["partial"]
+        _add_pdf_timings(timings, pdf_info, parsed=not isinstance(source, Document))
+
+        with timings.stage("excel_write"):
+            # 보험사명, 상품명 기록
+            write_insurer_info(
+                output_path, output_path,
+                insurer_display, insurer_name_row,
+                product_name, product_name_row,
+                current_amount_col, sheet_name
+            )
+
+            # 보험료 기록
+            if premium:
+                write_premium(
+                    output_path, output_path,
+                    premium, premium_row,
+                    current_amount_col, sheet_name
+                )
+
+        # 특약 추출 및 매칭
+        with timings.stage("excel_read"):
+            excel_coverages = read_excel_coverages(
+                output_path, sheet_name, 2, current_amount_col, start_row
+            )
+
+        with timings.stage("match"):
+            result = _match(pdf_info, excel_coverages, threshold)
+        matched = result["matched"]
+
+        # 매칭 결과 기록 (만원 단위)
+        if matched:
+            write_data = [{
+                "row": m["excel_row"],
+                "amount_col": m["amount_col"],
+                "가입금액": m["가입금액"] // 10000
+            } for m in matched]
+            with timings.stage("excel_write"):
+                write_matched_amounts(output_path, output_path, write_data, sheet_name)
+
+        if on_result:
+            on_result(pdf_idx, pdf_info, result)
+
+    return partial
+
+
+def _match_template_excel(pdf_items, template, sheet_name, threshold, deadline=None, on_result=None, timings=None):
+    """등록 템플릿 사본에 PDF별 매칭 결과 기록 — (결과 xlsx 내용, 일부만 파싱됐는지)
+
+    _match_excel과 같은 셀에 같은 순서로 기록하지만, 워크북을 메모리에서 한 번 열어
+    모두 기록한 뒤 한 번만 저장한다 (구조/특약 행은 템플릿에 미리 계산된 값).
+    """
+    timings = timings if timings is not None else StageTimings()
+
+    with timings.stage("excel_structure"):
+        sheet = template.sheet(sheet_name)
+    structure = sheet.structure
+    insurer_name_row = structure["insurer_row"] or 4
+    product_name_row = structure["product_row"] or 5
+    premium_row = structure["premium_row"] or 6
+    partial = False
+
+    with timings.stage("excel_clone"):
+        wb = template.open_workbook()
+    ws = wb[sheet_name] if sheet_name else wb.active
+
+    for pdf_idx, (_, source) in enumerate(pdf_items):
+        current_amount_col = 4 + pdf_idx
+
+        # PDF 파싱 (통합 1회 오픈, 업로드 문서는 보관된 결과)
+        pdf_info = _load_pdf_info(source, deadline=deadline)
+        partial = partial or pdf_info["partial"]
+        _add_pdf_timings(timings, pdf_info, parsed=not isinstance(source, Document))
+
+        # 보험사명, 상품명, 보험료 기록
+        ws.cell(row=insurer_name_row, column=current_amount_col, value=pdf_info["insurer_name"])
+        ws.cell(row=product_name_row, column=current_amount_col, value=pdf_info["product_name"])
+        if pdf_info["premium"]:
+            ws.cell(row=premium_row, column=current_amount_col, value=pdf_info["premium"])
+
+        with timings.stage("match"):
+            result = _match(pdf_info, sheet.coverages(current_amount_col), threshold)
+
+        # 매칭 결과 기록 (만원 단위)
+        for m in result["matched"]:
+            ws.cell(row=m["excel_row"], column=m["amount_col"], value=m["가입금액"] // 10000)
+
+        if on_result:
+            on_result(pdf_idx, pdf_info, result)
+
+    with timings.stage("excel_write"):
+        output = io.BytesIO()
+        wb.save(output)
+        wb.close()
+    return output.getvalue(), partial
+
+
+def _result_filename(customer_name):
+    """결과 Excel 파일명"""
+    if customer_name:
+        return f"{customer_name}_보장분석표.xlsx"
+    return "보장분석표_매칭결과.xlsx"
+
+
+def _download_headers(filename, partial):
+    """Excel 다운로드 응답 헤더 (한글 파일명은 RFC 5987 인코딩)"""
+    return {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}",
+        "X-Parse-Partial": "true" if partial else "false",
+        "Access-Control-Expose-Headers": "Content-Disposition, X-Parse-Partial",
+    }
+
+
 @app.post("/api/parse-pdf")
-async def parse_pdf(pdf_file: UploadFile = File(...)):
-    """단일 PDF 파싱 — 보험사, 상품명, 보험료, 특약 목록 반환 (최적화: 1회 오픈)"""
-    tmp_path = None
+async def parse_pdf(
+    request: Request,
+    response: Response,
+    pdf_file: UploadFile = File(...),
+    include_timings: bool = Query(False, alias="timings"),
+):
+    """단일 PDF 파싱 — 보험사, 상품명, 보험료, 특약 목록 반환 (최적화: 1회 오픈)
+
+    단계별 소요 시간은 Server-Timing 헤더로, ?timings=true면 응답 timings 블록으로도 반환.
+    """
+    timings = StageTimings()
+    profiler = ticket = tmp_path = None
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            content = await pdf_file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        profiler = _request_profiler(request)
+        with timings.stage("queue"):
+            ticket = await interactive_lane.acquire(_upload_weight([pdf_file]))
+        tmp_path = _save_upload(await pdf_file.read(), ".pdf")
 
         # 최적화: parse_pdf_all_in_one으로 PDF를 1회만 열어서 전체 정보 추출
-        pdf_info = parse_pdf_all_in_one(tmp_path)
+        parse = profiler.wrap(_parse_pdf) if profiler else _parse_pdf
+        pdf_info = await interactive_lane.run(parse, tmp_path)
+        _add_pdf_timings(timings, pdf_info)
+        if profiler:
+            return _profile_response(profiler, timings)
+        response.headers["Server-Timing"] = timings.server_timing_header()
 
-        return {
+        result = {
             "success": True,
             "filename": pdf_file.filename,
             "insurer_code": pdf_info["insurer_code"],
             "insurer_name": pdf_info["insurer_name"],
             "product_name": pdf_info["product_name"],
             "premium": pdf_info["premium"],
-            "coverages": pdf_info["coverages"],
+            "coverages": coverages_to_dicts(pdf_info["coverages"]),
             "coverage_count": len(pdf_info["coverages"]),
+            "partial": pdf_info["partial"],
+            "stats": pdf_info.get("stats"),
         }
+        if include_timings:
+            result["timings"] = _pdf_timings(pdf_info, StageTimings())
+        return result
+    except (AdmissionRejected, HTTPException):
+        raise
     except Exception as e:
         return JSONResponse(
             status_code=500,
             content={"success": False, "error": str(e), "traceback": traceback.format_exc()}
         )
     finally:
+        if ticket is not None:
+            interactive_lane.release(ticket)
+        if profiler:
+            profiler.close()
         if tmp_path and os.path.exists(tmp_path):
             os.unlink(tmp_path)
 
 
+# ══════════════════════════════════════════════
+# 업로드 문서 (파싱 결과 보관 → 문서 id로 재매칭)
+# ══════════════════════════════════════════════
+# threshold/sheet_name만 바꿔 다시 매칭할 때 PDF 재업로드·재파싱 없이 document_ids로
+# match_coverages + Excel 기록만 다시 한다.
+
+document_store = DocumentStore()
+_DOCUMENT_MATCH_WEIGHT = 0.1   # 업로드 문서 1개의 매칭 수용 가중치 (파싱 없음)
+
+
+def _parse_documents(pdf_items, deadline):
+    """[(파일명, 경로)] → [파싱 결과] (요청 시간 예산 공유)"""
+    return [_parse_pdf(pdf_path, deadline=deadline) for _, pdf_path in pdf_items]
+
+
+@app.post("/api/documents", status_code=201)
+async def upload_documents(pdf_files: List[UploadFile] = File(...)):
+    """PDF 업로드 → 파싱 결과를 문서로 보관하고 문서 id 반환
+
+    이미 보관 중인 것과 내용이 같은 PDF는 파싱하지 않고 그 결과로 새 문서를 만든다.
+    """
+    pdf_uploads = await _read_uploads(pdf_files)
+    digests = [hashlib.sha256(content).hexdigest() for _, content in pdf_uploads]
+    parsed = [document_store.find_parsed(digest) for digest in digests]
+    to_parse = [upload for upload, pdf_info in zip(pdf_uploads, parsed) if pdf_info is None]
+
+    if to_parse:
+        ticket = await bulk_lane.acquire(request_weight(len(content) for _, content in to_parse))
+        tmp_paths = []
+        try:
+            pdf_items = _save_pdf_uploads([], to_parse, tmp_paths)
+            deadline = Deadline()  # 요청 전체 파싱 시간 예산 (PDF 여러 개가 공유)
+            new_infos = iter(await bulk_lane.run(_parse_documents, pdf_items, deadline))
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            return JSONResponse(
+                status_code=500,
+                content={"success": False, "error": str(e), "traceback": traceback.format_exc()}
+            )
+        finally:
+            bulk_lane.release(ticket)
+            _remove_files(tmp_paths)
+        parsed = [pdf_info if pdf_info is not None else next(new_infos) for pdf_info in parsed]
+
+    documents = [
+        document_store.put(name, pdf_info, digest, len(content))
+        for (name, content), digest, pdf_info in zip(pdf_uploads, digests, parsed)
+    ]
+    return {"success": True, "documents": [document.to_dict() for document in documents]}
+
+
+@app.get("/api/documents/{document_id}")
+async def get_document(document_id: str):
+    """업로드 문서 요약 + 특약 목록"""
+    document = document_store.get(document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다 (만료되었거나 잘못된 id)")
+    return {
+        "success": True,
+        **document.to_dict(),
+        "coverages": coverages_to_dicts(document.pdf_info["coverages"]),
+    }
+
+
+@app.delete("/api/documents/{document_id}")
+async def delete_document(document_id: str):
+    """업로드 문서 삭제"""
+    if not document_store.delete(document_id):
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다 (만료되었거나 잘못된 id)")
+    return {"success": True, "document_id": document_id}
+
+
+@metrics.registry.collector
+def _document_metrics():
+    stats = document_store.stats()
+    return [
+        ("documents", "gauge", "보관 중인 업로드 문서 수", [({}, stats["count"])]),
+        ("document_parses_reused_total", "counter", "같은 내용의 보관 문서 파싱 결과를 재사용한 횟수",
+         [({}, stats["reused"])]),
+    ]
+
+
+# ══════════════════════════════════════════════
+# Excel 템플릿 (등록 → template_id로 매칭)
+# ══════════════════════════════════════════════
+# 같은 보장분석표를 매번 올리는 대신 한 번 등록하고 template_id로 매칭한다.
+# 시트 구조/특약 행은 미리 계산해 두고, 결과 파일은 보관된 워크북을 메모리에서 열어 기록한다.
+
+template_registry = TemplateRegistry()
+
+
+@app.post("/api/templates", status_code=201)
+async def upload_template(
+    excel_file: UploadFile = File(...),
+    sheet_name: Optional[str] = Form(None),
+):
+    """보장분석표 Excel 등록 → template_id + 시트 구조 반환 (같은 내용이면 같은 id)"""
+    ticket = await interactive_lane.acquire(_upload_weight([excel_file]))
+    try:
+        content = await excel_file.read()
+        sn = sheet_name if sheet_name else None
+        template = await interactive_lane.run(template_registry.register, excel_file.filename, content, sn)
+        return {"success": True, **template.to_dict(sn)}
+    except TemplateRegistryFull as e:
+        return JSONResponse(status_code=409, content={"success": False, "error": str(e)})
+    except KeyError:
+        return JSONResponse(status_code=400, content={"success": False, "error": f"시트를 찾을 수 없습니다: {sheet_name}"})
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": f"Excel 파일을 읽을 수 없습니다: {e}"})
+    finally:
+        interactive_lane.release(ticket)
+
+
+@app.get("/api/templates/{template_id}")
+async def get_template(template_id: str, sheet_name: Optional[str] = Query(None)):
+    """등록 템플릿 정보 + 시트 구조/특약 행"""
+    template = template_registry.get(template_id)
+    if template is None:
+        raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다 (삭제되었거나 잘못된 id)")
+    sn = sheet_name if sheet_name else None
+    try:
+        info = await interactive_lane.run(template.to_dict, sn)
+    except KeyError:
+        return JSONResponse(status_code=400, content={"success": False, "error": f"시트를 찾을 수 없습니다: {sheet_name}"})
+    return {"success": True, **info}
+
+
+@app.delete("/api/templates/{template_id}")
+async def delete_template(template_id: str):
+    """등록 템플릿 삭제"""
+    if not template_registry.delete(template_id):
+        raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다 (삭제되었거나 잘못된 id)")
+    return {"success": True, "template_id": template_id}
+
+
+@metrics.registry.collector
+def _template_metrics():
+    stats = template_registry.stats()
+    return [("templates", "gauge", "등록된 Excel 템플릿 수", [({}, stats["count"])])]
+
+
+async def _resolve_excel(excel_file, template_id):
+    """업로드 Excel 또는 등록 템플릿 (둘 중 하나) → (Excel 내용, Template)"""
+    if (excel_file is None) == (not template_id):
+        raise HTTPException(status_code=400, detail="excel_file 또는 template_id 중 하나가 필요합니다")
+    if excel_file is not None:
+        return await excel_file.read(), None
+    template = template_registry.get(template_id)
+    if template is None:
+        raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다 (삭제되었거나 잘못된 id)")
+    return None, template
+
+
+# 같은 업로드(PDF/Excel 내용 + 파라미터)로 동시에 들어온 매칭 요청은 1번만 처리
+# (더블클릭, 재시도) — 나중 요청은 수용 대기 없이 진행 중인 결과를 받는다 (X-Coalesced: true)
+match_flight = AsyncSingleFlight()
+
+
+async def _read_uploads(upload_files):
+    """업로드 파일 → [(파일명, 내용)]"""
+    return [(f.filename, await f.read()) for f in upload_files]
+
+
+def _match_flight_key(profiler, endpoint, documents, pdf_uploads, excel_content, *params):
+    """매칭 요청 합치기 키 (프로파일링 요청은 합치지 않음 → None)"""
+    if profiler:
+        return None
+    return content_key(
+        endpoint, [d.id for d in documents], *(part for upload in pdf_uploads for part in upload),
+        excel_content, params,
+    )
+
+
+def _resolve_documents(document_ids, pdf_uploads):
+    """document_ids(반복 필드 또는 쉼표 구분) → Document 목록 (PDF 업로드와 합쳐 1개 이상이어야 함)"""
+    ids = [i.strip() for value in document_ids or [] for i in value.split(",") if i.strip()]
+    try:
+        documents = document_store.get_many(ids)
+    except DocumentNotFound as e:
+        raise HTTPException(
+            status_code=404, detail=f"문서를 찾을 수 없습니다 (만료되었거나 잘못된 id): {', '.join(e.missing)}"
+        )
+    if not documents and not pdf_uploads:
+        raise HTTPException(status_code=400, detail="pdf_files 또는 document_ids가 필요합니다")
+    return documents
+
+
+def _match_weight(documents, pdf_uploads):
+    """매칭 요청 수용 가중치 — 업로드 문서는 파싱하지 않으므로 매칭/Excel 기록분만"""
+    return request_weight(len(content) for _, content in pdf_uploads) + len(documents) * _DOCUMENT_MATCH_WEIGHT
+
+
+def _save_pdf_uploads(documents, pdf_uploads, tmp_paths):
+    """매칭할 PDF 항목 — 업로드 문서 (파일명, Document) 다음에 PDF 업로드를 임시 파일로 저장한
+    (파일명, 경로) (경로는 tmp_paths에도 추가)
+    """
+    pdf_items = [(document.filename, document) for document in documents]
+    for name, content in pdf_uploads:
+        tmp_path = _save_upload(content, ".pdf")
+        tmp_paths.append(tmp_path)
+        pdf_items.append((name, tmp_path))
+    return pdf_items
+
+
+def _remove_files(paths):
+    for p in paths:
+        if p and os.path.exists(p):
+            os.unlink(p)
+
+
+async def _run_match_summary(documents, pdf_uploads, excel_content, template, customer_name, threshold,
+                             sheet_name, include_timings, profiler=None):
+    """match-with-summary 처리 (수용 대기 → 저장 → 파싱/매칭) — (결과 JSON, StageTimings)"""
+    timings = StageTimings()
+    with timings.stage("queue"):
+        ticket = await bulk_lane.acquire(_match_weight(documents, pdf_uploads))
+    tmp_paths = []
+    try:
+        # Excel/PDF 파일 저장 (등록 템플릿은 저장하지 않음)
+        excel_path = None
+        if template is None:
+            excel_path = _save_upload(excel_content, ".xlsx")
+            tmp_paths.append(excel_path)
+        pdf_items = _save_pdf_uploads(documents, pdf_uploads, tmp_paths)
+
+        deadline = Deadline()  # 요청 전체 파싱 시간 예산 (PDF 여러 개가 공유)
+        summary = await bulk_lane.run(
+            profiler.wrap(_match_summary) if profiler else _match_summary,
+            pdf_items, excel_path, sheet_name, customer_name, threshold, deadline,
+            timings=timings, include_timings=include_timings, template=template,
+        )
+        return summary, timings
+    finally:
+        bulk_lane.release(ticket)
+        _remove_files(tmp_paths)
+
+
 @app.post("/api/match-with-summary")
 async def match_with_summary(
-    pdf_files: List[UploadFile] = File(...),
-    excel_file: UploadFile = File(...),
+    request: Request,
+    response: Response,
+    pdf_files: Optional[List[UploadFile]] = File(None),
+    document_ids: Optional[List[str]] = Form(None),
+    excel_file: Optional[UploadFile] = File(None),
+    template_id: Optional[str] = Form(None),
     customer_name: Optional[str] = Form(None),
     threshold: int = Form(75),
     sheet_name: Optional[str] = Form(None),
+    include_timings: bool = Query(False, alias="timings"),
 ):
-    """PDF + Excel 업로드 → 매칭 결과 JSON 반환 (다운로드 없이 결과만)"""
-    tmp_pdf_paths = []
-    excel_path = None
+    """PDF(또는 업로드 문서 id) + Excel(또는 등록 템플릿 id) → 매칭 결과 JSON 반환 (다운로드 없이 결과만)
 
+    document_ids의 문서가 앞 열, pdf_files가 그 다음 열에 온다.
+    단계별 소요 시간은 Server-Timing 헤더로, ?timings=true면 응답/PDF별 timings 블록으로도 반환.
+    """
+    profiler = None
     try:
-        # Excel 파일 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
-            content = await excel_file.read()
-            tmp.write(content)
-            excel_path = tmp.name
-
+        pdf_uploads = await _read_uploads(pdf_files or [])
+        documents = _resolve_documents(document_ids, pdf_uploads)
+        excel_content, template = await _resolve_excel(excel_file, template_id)
+        # 입력 검증 후 생성 (샘플러 스레드는 finally에서 항상 정지)
+        profiler = _request_profiler(request)
         sn = sheet_name if sheet_name else None
+        key = _match_flight_key(
+            profiler, "match-with-summary", documents, pdf_uploads, template.id if template else excel_content,
+            customer_name, threshold, sn, include_timings,
+        )
+        coalesced = match_flight.running(key)
+        summary, timings = await match_flight.do(
+            key, _run_match_summary, documents, pdf_uploads, excel_content, template, customer_name, threshold,
+            sn, include_timings, profiler,
+        )
+        if profiler:
+            return _profile_response(profiler, timings)
+        response.headers["Server-Timing"] = timings.server_timing_header()
+        if coalesced:
+            response.headers["X-Coalesced"] = "true"
+        return summary
 
-        # 구조 자동 탐지
-        structure = find_structure(excel_path, sn, 2)
-        insurer_name_row = structure["insurer_row"] or 4
-        product_name_row = structure["product_row"] or 5
-        premium_row = structure["premium_row"] or 6
-        start_row = structure["start_row"] or 8
-
-        all_results = []
-
-        for pdf_idx, pdf_file in enumerate(pdf_files):
-            current_amount_col = 4 + pdf_idx  # D=4, E=5, F=6, ...
-
-            # PDF 임시 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                content = await pdf_file.read()
-                tmp.write(content)
-                tmp_path = tmp.name
-                tmp_pdf_paths.append(tmp_path)
-
-            # PDF 파싱 (통합 1회 오픈)
-            pdf_info = parse_pdf_all_in_one(tmp_path)
-            insurer_code = pdf_info["insurer_code"]
-            insurer_display = pdf_info["insurer_name"]
-            product_name = pdf_info["product_name"]
-            premium = pdf_info["premium"]
-            pdf_coverages = pdf_info["coverages"]
-
-            # Excel에서 특약명 읽기
-            excel_coverages = read_excel_coverages(
-                excel_path, sn, 2, current_amount_col, start_row
-            )
+    except (AdmissionRejected, HTTPException):
+        raise
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "error": str(e), "traceback": traceback.format_exc()}
+        )
+    finally:
+        if profiler:
+            profiler.close()
 
-            # 매칭
-            result = match_coverages(pdf_coverages, excel_coverages, threshold)
-            matched = result["matched"]
-
-            all_results.append({
-                "pdf_name": pdf_file.filename,
-                "pdf_index": pdf_idx,
-                "column_letter": chr(ord('D') + pdf_idx),
-                "insurer_code": insurer_code,
-                "insurer_name": insurer_display,
-                "product_name": product_name,
-                "premium": premium,
-                "pdf_coverage_count": len(pdf_coverages),
-                "pdf_coverages": [
-                    {"특약명": c["특약명"], "가입금액": c["가입금액"]}
-                    for c in pdf_coverages
-                ],
-                "matched_count": len(matched),
-                "unmatched_excel_count": len(result["unmatched_excel"]),
-                "unmatched_pdf_count": len(result["unmatched_pdf"]),
-                "matched": [
-                    {
-                        "excel_row": m["excel_row"],
-                        "excel_특약명": m["excel_특약명"],
-                        "pdf_특약명": m["pdf_특약명"],
-                        "가입금액": m["가입금액"],
-                        "가입금액_만원": m["가입금액"] // 10000,
-                        "유사도": m["유사도"],
-                    }
-                    for m in matched
-                ],
-                "unmatched_excel": [
-                    {"특약명": u["특약명"], "row": u["row"]}
-                    for u in result["unmatched_excel"]
-                ],
-                "unmatched_pdf": [
-                    {"특약명": u["특약명"], "가입금액": u["가입금액"], "가입금액_만원": u["가입금액"] // 10000}
-                    for u in result["unmatched_pdf"]
-                ],
-            })
-
-        return {
-            "success": True,
-            "customer_name": customer_name,
-            "structure": structure,
-            "total_pdfs": len(pdf_files),
-            "results": all_results,
-        }
 
+# ══════════════════════════════════════════════
+# 매칭 결과 스트리밍 (PDF 하나 끝날 때마다 결과 항목 전송)
+# ══════════════════════════════════════════════
+# ndjson: 한 줄에 결과 항목 1개 (match-with-summary results 항목과 같은 스키마),
+#         오류 시 마지막 줄 {"success": false, "error": ...}
+# sse:    event: result (결과 항목) → event: done ({"total_pdfs", "partial"}), 오류 시 event: error
+
+_STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+
+def _stream_event(output, event, data):
+    """스트리밍 응답 1건 직렬화"""
+    payload = json.dumps(data, ensure_ascii=False)
+    if output == "sse":
+        return f"event: {event}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+async def _stream_match_summary(pdf_items, excel_path, sheet_name, threshold, output, tmp_paths, ticket,
+                                include_timings=False, template=None):
+    """PDF별 파싱+매칭 결과를 순서대로 전송 — 스트리밍이 끝나면 수용 자리 반납 + 임시 파일 삭제"""
+    try:
+        _, read_coverages = await bulk_lane.run(_excel_layout, excel_path, sheet_name, template)
+        deadline = Deadline()  # 요청 전체 파싱 시간 예산 (PDF 여러 개가 공유)
+        partial = False
+        async for entry in bulk_lane.iterate(
+            _iter_match_summary(pdf_items, read_coverages, threshold, deadline, include_timings=include_timings)
+        ):
+            partial = partial or entry["partial"]
+            yield _stream_event(output, "result", entry)
+        if output == "sse":
+            yield _stream_event(output, "done", {"total_pdfs": len(pdf_items), "partial": partial})
+    except AdmissionRejected as e:
+        # 응답 헤더는 이미 전송됨 — 재시도 시간은 이벤트로 전달
+        yield _stream_event(output, "error", {"success": False, "error": str(e), "retry_after": e.retry_after})
+    except Exception as e:
+        print(f"[WARN] Match stream failed: {e}")
+        yield _stream_event(output, "error", {"success": False, "error": str(e)})
+    finally:
+        bulk_lane.release(ticket)
+        _remove_files(tmp_paths)
+
+
+@app.post("/api/match-with-summary/stream")
+async def match_with_summary_stream(
+    pdf_files: Optional[List[UploadFile]] = File(None),
+    document_ids: Optional[List[str]] = Form(None),
+    excel_file: Optional[UploadFile] = File(None),
+    template_id: Optional[str] = Form(None),
+    threshold: int = Form(75),
+    sheet_name: Optional[str] = Form(None),
+    output: str = Form("ndjson"),
+    include_timings: bool = Query(False, alias="timings"),
+):
+    """PDF(또는 업로드 문서 id) + Excel(또는 등록 템플릿 id) → PDF별 매칭 결과를 끝나는 대로 스트리밍
+
+    output: ndjson / sse
+
+    document_ids의 문서가 앞 열, pdf_files가 그 다음 열에 온다.
+    헤더를 먼저 보내므로 Server-Timing 대신 ?timings=true면 결과 항목마다 timings 블록을 붙인다.
+    """
+    if output not in _STREAM_MEDIA_TYPES:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "error": f"output은 {', '.join(_STREAM_MEDIA_TYPES)} 중 하나여야 합니다"}
+        )
+
+    pdf_uploads = await _read_uploads(pdf_files or [])
+    documents = _resolve_documents(document_ids, pdf_uploads)
+    excel_content, template = await _resolve_excel(excel_file, template_id)
+    ticket = await bulk_lane.acquire(_match_weight(documents, pdf_uploads))
+    tmp_paths = []
+    try:
+        excel_path = None
+        if template is None:
+            excel_path = _save_upload(excel_content, ".xlsx")
+            tmp_paths.append(excel_path)
+        pdf_items = _save_pdf_uploads(documents, pdf_uploads, tmp_paths)
     except Exception as e:
+        bulk_lane.release(ticket)
+        _remove_files(tmp_paths)
         return JSONResponse(
             status_code=500,
             content={"success": False, "error": str(e), "traceback": traceback.format_exc()}
         )
+
+    sn = sheet_name if sheet_name else None
+    return StreamingResponse(
+        _stream_match_summary(
+            pdf_items, excel_path, sn, threshold, output, tmp_paths, ticket, include_timings, template
+        ),
+        media_type=_STREAM_MEDIA_TYPES[output],
+        # 프록시 버퍼링 비활성화 (항목이 도착하는 즉시 전달)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _run_match_excel(documents, pdf_uploads, excel_content, template, threshold, sheet_name, profiler=None):
+    """match 처리 (수용 대기 → 저장 → 파싱/매칭/Excel 기록) — (결과 xlsx 내용, partial, StageTimings)"""
+    timings = StageTimings()
+    with timings.stage("queue"):
+        ticket = await bulk_lane.acquire(_match_weight(documents, pdf_uploads))
+    tmp_paths = []
+    try:
+        if template is not None:
+            # 등록 템플릿: 메모리 사본에 기록 (Excel 파일 저장/복사 없음)
+            pdf_items = _save_pdf_uploads(documents, pdf_uploads, tmp_paths)
+            deadline = Deadline()
+            content, partial = await bulk_lane.run(
+                profiler.wrap(_match_template_excel) if profiler else _match_template_excel,
+                pdf_items, template, sheet_name, threshold, deadline, timings=timings,
+            )
+            return content, partial, timings
+
+        # Excel 파일 저장
+        excel_path = _save_upload(excel_content, ".xlsx")
+        output_path = excel_path.replace(".xlsx", "_result.xlsx")
+        tmp_paths.extend([excel_path, output_path])
+        shutil.copy2(excel_path, output_path)
+        pdf_items = _save_pdf_uploads(documents, pdf_uploads, tmp_paths)
+
+        deadline = Deadline()  # 요청 전체 파싱 시간 예산 (PDF 여러 개가 공유)
+        partial = await bulk_lane.run(
+            profiler.wrap(_match_excel) if profiler else _match_excel,
+            pdf_items, output_path, sheet_name, threshold, deadline, timings=timings,
+        )
+        # 합쳐진 요청끼리 같은 결과를 보내도록 메모리로 읽고 임시 파일은 바로 삭제
+        with open(output_path, "rb") as f:
+            content = f.read()
+        return content, partial, timings
     finally:
-        if excel_path and os.path.exists(excel_path):
-            os.unlink(excel_path)
-        for p in tmp_pdf_paths:
-            if os.path.exists(p):
-                os.unlink(p)
+        bulk_lane.release(ticket)
+        _remove_files(tmp_paths)
 
 
 @app.post("/api/match")
 async def match_and_download(
-    pdf_files: List[UploadFile] = File(...),
-    excel_file: UploadFile = File(...),
+    request: Request,
+    pdf_files: Optional[List[UploadFile]] = File(None),
+    document_ids: Optional[List[str]] = Form(None),
+    excel_file: Optional[UploadFile] = File(None),
+    template_id: Optional[str] = Form(None),
     customer_name: Optional[str] = Form(None),
     threshold: int = Form(75),
     sheet_name: Optional[str] = Form(None),
 ):
-    """PDF + Excel 업로드 → 매칭 결과가 기록된 Excel 파일 다운로드"""
-    tmp_pdf_paths = []
-    excel_path = None
-    output_path = None
+    """PDF(또는 업로드 문서 id) + Excel(또는 등록 템플릿 id) → 매칭 결과가 기록된 Excel 파일 다운로드
 
+    document_ids의 문서가 앞 열, pdf_files가 그 다음 열에 온다. 단계별 소요 시간은 Server-Timing 헤더.
+    """
+    profiler = None
     try:
-        # Excel 파일 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
-            content = await excel_file.read()
-            tmp.write(content)
-            excel_path = tmp.name
+        pdf_uploads = await _read_uploads(pdf_files or [])
+        documents = _resolve_documents(document_ids, pdf_uploads)
+        excel_content, template = await _resolve_excel(excel_file, template_id)
+        # 입력 검증 후 생성 (샘플러 스레드는 finally에서 항상 정지)
+        profiler = _request_profiler(request)
+        sn = sheet_name if sheet_name else None
+        key = _match_flight_key(
+            profiler, "match", documents, pdf_uploads, template.id if template else excel_content, threshold, sn
+        )
+        coalesced = match_flight.running(key)
+        content, partial, timings = await match_flight.do(
+            key, _run_match_excel, documents, pdf_uploads, excel_content, template, threshold, sn, profiler
+        )
+        if profiler:
+            return _profile_response(profiler, timings)
 
-        output_path = excel_path.replace(".xlsx", "_result.xlsx")
-        shutil.copy2(excel_path, output_path)
+        headers = {
+            **_download_headers(_result_filename(customer_name), partial),
+            "Server-Timing": timings.server_timing_header(),
+        }
+        if coalesced:
+            headers["X-Coalesced"] = "true"
+        return Response(content, media_type=XLSX_MEDIA_TYPE, headers=headers)
 
-        sn = sheet_name if sheet_name else None
+    except (AdmissionRejected, HTTPException):
+        raise
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "error": str(e), "traceback": traceback.format_exc()}
+        )
+    finally:
+        if profiler:
+            profiler.close()
 
-        # 구조 자동 탐지
-        structure = find_structure(output_path, sn, 2)
-        insurer_name_row = structure["insurer_row"] or 4
-        product_name_row = structure["product_row"] or 5
-        premium_row = structure["premium_row"] or 6
-        start_row = structure["start_row"] or 8
 
-        for pdf_idx, pdf_file in enumerate(pdf_files):
-            current_amount_col = 4 + pdf_idx
+# ══════════════════════════════════════════════
+# 비동기 작업 API (로드밸런서 타임아웃을 넘는 대량 매칭)
+# ══════════════════════════════════════════════
+# 제출 즉시 작업 id를 반환하고, 작업 워커가 PDF를 하나씩 처리하면서 진행률을 갱신한다.
+# 작업은 HTTP 연결에 묶이지 않으므로 요청 단위 시간 예산 대신 PDF별 기본 예산만 적용.
+# 실행은 bulk 레인의 수용 제어와 워커를 거친다 (동기 매칭 요청과 같은 동시 처리 한도).
 
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                content = await pdf_file.read()
-                tmp.write(content)
-                tmp_path = tmp.name
-                tmp_pdf_paths.append(tmp_path)
+job_queue = JobQueue()
+_JOB_OUTPUTS = ("json", "xlsx")
+_JOB_RETRY_AFTER_SEC = 30
 
-            # PDF 파싱 (통합 1회 오픈)
-            pdf_info = parse_pdf_all_in_one(tmp_path)
-            insurer_display = pdf_info["insurer_name"]
-            product_name = pdf_info["product_name"]
-            premium = pdf_info["premium"]
 
-            # 보험사명, 상품명 기록
-            write_insurer_info(
-                output_path, output_path,
-                insurer_display, insurer_name_row,
-                product_name, product_name_row,
-                current_amount_col, sn
-            )
+def _job_pdf_items(job):
+    """작업 폴더에 저장된 PDF (파일명, 경로) 목록"""
+    return [(item["name"], job.file_path(f"{i}.pdf")) for i, item in enumerate(job.items)]
 
-            # 보험료 기록
-            if premium:
-                write_premium(
-                    output_path, output_path,
-                    premium, premium_row,
-                    current_amount_col, sn
-                )
 
-            # 특약 추출 및 매칭
-            pdf_coverages = pdf_info["coverages"]
-            excel_coverages = read_excel_coverages(
-                output_path, sn, 2, current_amount_col, start_row
-            )
+def _run_in_bulk_lane(job, loop, fn, *args, **kwargs):
+    """작업 워커 스레드에서 bulk 레인 자리를 확보하고 fn 실행
 
-            result = match_coverages(pdf_coverages, excel_coverages, threshold)
-            matched = result["matched"]
-
-            # 매칭 결과 기록 (만원 단위)
-            if matched:
-                write_data = [{
-                    "row": m["excel_row"],
-                    "amount_col": m["amount_col"],
-                    "가입금액": m["가입금액"] // 10000
-                } for m in matched]
-                write_matched_amounts(output_path, output_path, write_data, sn)
-
-        # 결과 파일명
-        filename = "보장분석표_매칭결과.xlsx"
-        if customer_name:
-            filename = f"{customer_name}_보장분석표.xlsx"
-
-        # 한글 파일명 인코딩 (RFC 5987)
-        encoded_filename = quote(filename)
-
-        def file_iterator(path):
-            with open(path, "rb") as f:
-                while chunk := f.read(65536):
-                    yield chunk
-            # 스트리밍 완료 후 임시파일 삭제
-            if os.path.exists(path):
-                os.unlink(path)
-
-        return StreamingResponse(
-            file_iterator(output_path),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.document",
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
-                "Access-Control-Expose-Headers": "Content-Disposition",
-            }
+    작업은 클라이언트가 기다리지 않으므로 거절(429/503)되면 실패 대신
+    Retry-After만큼 쉬었다가 다시 줄을 선다.
+    """
+    weight = request_weight(os.path.getsize(path) for _, path in _job_pdf_items(job))
+    while True:
+        try:
+            return bulk_lane.run_from_thread(loop, weight, fn, *args, **kwargs)
+        except AdmissionRejected as e:
+            time.sleep(e.retry_after)
+
+
+def _run_summary_job(job, sheet_name, customer_name, threshold, loop):
+    def on_result(entry):
+        job.item_finished(
+            entry["pdf_index"], partial=entry["partial"],
+            coverage_count=entry["pdf_coverage_count"], matched_count=entry["matched_count"],
         )
 
-    except Exception as e:
-        # 오류 시 output_path 정리
-        if output_path and os.path.exists(output_path):
-            os.unlink(output_path)
+    return _run_in_bulk_lane(
+        job, loop, _match_summary,
+        _job_pdf_items(job), job.file_path("input.xlsx"), sheet_name, customer_name, threshold,
+        on_result=on_result,
+    )
+
+
+def _run_excel_job(job, sheet_name, customer_name, threshold, loop):
+    def on_result(pdf_idx, pdf_info, result):
+        job.item_finished(
+            pdf_idx, partial=pdf_info["partial"],
+            coverage_count=len(pdf_info["coverages"]), matched_count=len(result["matched"]),
+        )
+
+    output_path = job.file_path("result.xlsx")
+    shutil.copy2(job.file_path("input.xlsx"), output_path)
+    partial = _run_in_bulk_lane(
+        job, loop, _match_excel, _job_pdf_items(job), output_path, sheet_name, threshold, on_result=on_result,
+    )
+    job.result_path = output_path
+    job.result_filename = _result_filename(customer_name)
+    return {"partial": partial}
+
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(
+    pdf_files: List[UploadFile] = File(...),
+    excel_file: UploadFile = File(...),
+    customer_name: Optional[str] = Form(None),
+    threshold: int = Form(75),
+    sheet_name: Optional[str] = Form(None),
+    output: str = Form("json"),
+):
+    """PDF + Excel 매칭 작업 제출 → 작업 id 반환 (output: json=매칭 결과 JSON, xlsx=결과 Excel)"""
+    if output not in _JOB_OUTPUTS:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "error": f"output은 {', '.join(_JOB_OUTPUTS)} 중 하나여야 합니다"}
+        )
+
+    files = {"input.xlsx": await excel_file.read()}
+    for pdf_idx, pdf_file in enumerate(pdf_files):
+        files[f"{pdf_idx}.pdf"] = await pdf_file.read()
+
+    sn = sheet_name if sheet_name else None
+    run = _run_excel_job if output == "xlsx" else _run_summary_job
+    try:
+        job = job_queue.submit(
+            output, [f.filename for f in pdf_files], files,
+            functools.partial(
+                run, sheet_name=sn, customer_name=customer_name, threshold=threshold,
+                loop=asyncio.get_running_loop(),
+            ),
+        )
+    except JobQueueFull as e:
+        return JSONResponse(
+            status_code=429,
+            content={"success": False, "error": str(e)},
+            headers={"Retry-After": str(_JOB_RETRY_AFTER_SEC)},
+        )
+
+    return {
+        "success": True,
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.id}",
+        "result_url": f"/api/jobs/{job.id}/result",
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def job_status(job_id: str):
+    """작업 상태 + PDF별 진행률"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다 (만료되었거나 잘못된 id)")
+    return {"success": True, **job.to_dict()}
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def job_result(job_id: str):
+    """작업 결과 — output=json이면 매칭 결과 JSON, xlsx면 결과 Excel 파일"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다 (만료되었거나 잘못된 id)")
+    if job.status == STATUS_FAILED:
         return JSONResponse(
             status_code=500,
-            content={"success": False, "error": str(e), "traceback": traceback.format_exc()}
+            content={"success": False, "error": job.error, "traceback": job.traceback}
         )
-    finally:
-        if excel_path and os.path.exists(excel_path):
-            os.unlink(excel_path)
-        for p in tmp_pdf_paths:
-            if os.path.exists(p):
-                os.unlink(p)
-        # Note: output_path is cleaned up inside file_iterator after streaming
+    if job.status != STATUS_DONE:
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "error": "작업이 아직 끝나지 않았습니다", **job.to_dict()}
+        )
+    if job.result_path:
+        return FileResponse(
+            job.result_path,
+            media_type=XLSX_MEDIA_TYPE,
+            headers=_download_headers(job.result_filename, job.result["partial"]),
+        )
+    return job.result
 
 
 if __name__ == "__main__":
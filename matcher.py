@@ -133,8 +133,8 @@ def get_surgery_grade_amounts(pdf_coverages):
     grade_extra = {i: [] for i in range(1, 8)}  # 미래에셋 1-7종 상세
 
     for cov in pdf_coverages:
-        name = cov["특약명"]
-        amount = cov["가입금액"]
+        name = cov.name
+        amount = cov.amount
         name_simplified = simplify_pdf_name(name)
 
         # 미래에셋 1-7종 상세 분류 ([1-7종]X종수술)
@@ -216,8 +216,8 @@ def get_aggregated_amounts(pdf_coverages):
     """합산 규칙이 적용되는 특약들의 금액 계산"""
     simplified = {}
     for cov in pdf_coverages:
-        key = simplify_pdf_name(cov["특약명"])
-        simplified[key] = cov["가입금액"]
+        key = simplify_pdf_name(cov.name)
+        simplified[key] = cov.amount
 
     result = {}
 
@@ -388,11 +388,11 @@ def get_aggregated_amounts(pdf_coverages):
     fracture_diag = 0
     fracture_diag_exclude = ["5대골절", "부목", "철심"]
     for cov in pdf_coverages:
-        key = simplify_pdf_name(cov["특약명"])
+        key = simplify_pdf_name(cov.name)
         if ("골절" in key and "진단" in key and "수술" not in key) or \
            ("재해골절치료" in key):
             if not any(ex in key for ex in fracture_diag_exclude):
-                fracture_diag += cov["가입금액"]
+                fracture_diag += cov.amount
     if fracture_diag > 0:
         result["골절진단"] = fracture_diag
 
@@ -400,10 +400,10 @@ def get_aggregated_amounts(pdf_coverages):
     # 중요: simplified dict는 동일 키를 덮어쓰므로 원본 coverages에서 직접 합산
     fracture_surgery_exclude = ["5대골절", "철심"]
     for cov in pdf_coverages:
-        key = simplify_pdf_name(cov["특약명"])
+        key = simplify_pdf_name(cov.name)
         if "골절수술" in key:
             if not any(ex in key for ex in fracture_surgery_exclude):
-                result["골절수술비"] = cov["가입금액"]
+                result["골절수술비"] = cov.amount
                 break
 
     # 뇌혈관질환 진단비
@@ -534,8 +534,8 @@ def get_aggregated_amounts(pdf_coverages):
     cancer_treatment_exclude = ["소액암", "유사암", "전이암", "생활비", "진단및치료비", "통합치료비2", "통합치료비3"]
     cancer_treatment = 0
     for cov in pdf_coverages:
-        key = simplify_pdf_name(cov["특약명"])
-        amount = cov["가입금액"]
+        key = simplify_pdf_name(cov.name)
+        amount = cov.amount
         matched_kw = False
         for kw in ["암주요치료비", "하이클래스암주요치료비", "일반암주요치료",
                     "암전액본인부담", "암통합치료비"]:
@@ -600,9 +600,9 @@ def get_aggregated_amounts(pdf_coverages):
         result["일반상해사망"] = death_amount
     # 흥국생명: (무)재해사망 → 일반상해사망에 주계약 가입금액 합산
     for cov in pdf_coverages:
-        name = simplify_pdf_name(cov["특약명"])
+        name = simplify_pdf_name(cov.name)
         if "재해사망" in name and "일반상해사망" not in result:
-            result["일반상해사망"] = cov["가입금액"]
+            result["일반상해사망"] = cov.amount
             break
     # 삼성화재: "상해 사망" 5000만원 = 상해사망/재해사망에 해당
     if "일반상해사망" not in result:
@@ -622,10 +622,10 @@ def get_aggregated_amounts(pdf_coverages):
     # 미래에셋: 주계약(재해사망)만 있으면 일반사망 = 0
     has_main_contract = False
     for cov in pdf_coverages:
-        name = cov["특약명"]
+        name = cov.name
         # 흥국생명 통합보험 주계약 (일반사망 50% 포함)
         if "통합보험" in name:
-            result["일반사망"] = cov["가입금액"] // 2  # 50%
+            result["일반사망"] = cov.amount // 2  # 50%
             has_main_contract = True
             break
     # 별도 일반사망보장/종신사망 특약 우선
@@ -643,15 +643,15 @@ def get_aggregated_amounts(pdf_coverages):
     # 상해사망/재해사망 합산 (주계약 재해사망 + 재해사망 특약)
     total_death = 0
     for cov in pdf_coverages:
-        name = simplify_pdf_name(cov["특약명"])
+        name = simplify_pdf_name(cov.name)
         if "재해사망" in name or "일반상해사망" in name:
-            total_death += cov["가입금액"]
+            total_death += cov.amount
     # 흥국생명: 주계약(통합보험)에 재해사망 100% 포함시 합산
     if has_main_contract:
         for cov in pdf_coverages:
-            name = cov["특약명"]
+            name = cov.name
             if "통합보험" in name:
-                total_death += cov["가입금액"]  # 재해 원인 100%
+                total_death += cov.amount  # 재해 원인 100%
                 break
     # 삼성화재: "상해 사망" = 상해사망/재해사망
     if total_death == 0:
@@ -687,8 +687,8 @@ def get_aggregated_amounts(pdf_coverages):
     # DB손해: 상해후유장해(3-100%) — 동일 키가 두 번(1억, 1만) 있으므로 max 사용
     injury_disability = 0
     for cov in pdf_coverages:
-        key = simplify_pdf_name(cov["특약명"])
-        amount = cov["가입금액"]
+        key = simplify_pdf_name(cov.name)
+        amount = cov.amount
         if any(kw in key for kw in [
             "상해3%이상후유장해", "상해후유장해3%",
             "재해후유장해보장", "재해후유장해",
@@ -740,8 +740,8 @@ def get_aggregated_amounts(pdf_coverages):
     grade_amounts_all = {}  # {등급: 모든금액 중 max}
     has_grade_items = False
     for cov in pdf_coverages:
-        name = cov["특약명"]
-        amount = cov["가입금액"]
+        name = cov.name
+        amount = cov.amount
         if "표적항암약물" not in name or "허가치료" not in name:
             continue
         if "약물종류" in name or "개수별" in name:
@@ -779,9 +779,9 @@ def get_aggregated_amounts(pdf_coverages):
 
     # 교통사고처리지원금 (중상해보장확대만 — 6주미만 제외)
     for cov in pdf_coverages:
-        original_name = cov["특약명"]
+        original_name = cov.name
         if "교통사고처리보장" in original_name and "중상해보장확대" in original_name:
-            result["교통사고처리지원금"] = cov["가입금액"]
+            result["교통사고처리지원금"] = cov.amount
             break
     if "교통사고처리지원금" not in result:
         for key, amount in simplified.items():
@@ -791,14 +791,14 @@ def get_aggregated_amounts(pdf_coverages):
 
     # 자동차사고부상 14등급 지급액
     for cov in pdf_coverages:
-        if "14급지급액" in cov:
-            result["자동차사고부상14등급"] = cov["14급지급액"]
+        if cov.grade14 is not None:
+            result["자동차사고부상14등급"] = cov.grade14
             break
     if "자동차사고부상14등급" not in result:
         for cov in pdf_coverages:
-            original_name = cov["특약명"]
+            original_name = cov.name
             if "사고부상" in original_name and ("4~14" in original_name or "4~14급" in original_name):
-                result["자동차사고부상14등급"] = round(cov["가입금액"] / 30)
+                result["자동차사고부상14등급"] = round(cov.amount / 30)
                 break
 
     return result
@@ -966,7 +966,7 @@ def match_coverages(pdf_coverages, excel_coverages, threshold=70):
 
     aggregated = get_aggregated_amounts(pdf_coverages)
     surgery_grades = get_surgery_grade_amounts(pdf_coverages)
-    pdf_simplified = {simplify_pdf_name(c["특약명"]): c for c in pdf_coverages}
+    pdf_simplified = {simplify_pdf_name(c.name): c for c in pdf_coverages}
 
     for excel_item in excel_coverages:
         excel_name = excel_item["특약명"]
@@ -1004,8 +1004,8 @@ def match_coverages(pdf_coverages, excel_coverages, threshold=70):
                         kw_clean = re.sub(r'\s+', '', kw)
                         for pdf_key, pdf_cov in pdf_simplified.items():
                             if kw_clean in pdf_key:
-                                matched_amount = pdf_cov["가입금액"]
-                                matched_pdf_name = pdf_cov["특약명"]
+                                matched_amount = pdf_cov.amount
+                                matched_pdf_name = pdf_cov.name
                                 break
                         if matched_amount:
                             break
@@ -1022,8 +1022,8 @@ def match_coverages(pdf_coverages, excel_coverages, threshold=70):
                     kw_clean = re.sub(r'\s+', '', kw)
                     for pdf_key, pdf_cov in pdf_simplified.items():
                         if kw_clean in pdf_key:
-                            matched_amount = pdf_cov["가입금액"]
-                            matched_pdf_name = pdf_cov["특약명"]
+                            matched_amount = pdf_cov.amount
+                            matched_pdf_name = pdf_cov.name
                             break
                     if matched_amount:
                         break
@@ -1037,8 +1037,8 @@ def match_coverages(pdf_coverages, excel_coverages, threshold=70):
                         if kw_clean in pdf_key:
                             if any(ex in pdf_key for ex in exclude):
                                 continue
-                            matched_amount = pdf_cov["가입금액"]
-                            matched_pdf_name = pdf_cov["특약명"]
+                            matched_amount = pdf_cov.amount
+                            matched_pdf_name = pdf_cov.name
                             break
                     if matched_amount:
                         break
@@ -1058,7 +1058,7 @@ def match_coverages(pdf_coverages, excel_coverages, threshold=70):
     for cov in pdf_coverages:
         is_used = False
         for r in results:
-            if cov["특약명"] in r["pdf_특약명"] or simplify_pdf_name(cov["특약명"]) in r["pdf_특약명"]:
+            if cov.name in r["pdf_특약명"] or simplify_pdf_name(cov.name) in r["pdf_특약명"]:
                 is_used = True
                 break
         if not is_used:
@@ -0,0 +1,193 @@
+"""Prometheus 텍스트 형식 지표 (프로세스 내 수집, 외부 서비스 없음)
+
+용량 계획용으로 엔드포인트/보험사별 요청 수와 지연 시간, 처리 페이지 수(PyMuPDF/pdfplumber),
+PyMuPDF 폴백 횟수, 캐시 적중률, 매칭/미매칭 특약 수, 업로드 바이트를 모은다.
+
+요청 경로에서는 dict 갱신(락 1회)만 하고, 텍스트 변환과 캐시/대기열 현황 수집(collector)은
+/metrics 조회 시에만 한다.
+"""
+import bisect
+import threading
+
+PREFIX = "insurance_matcher_"
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(self._render_samples(items))
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_samples(self, items):
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (초 단위 지연 시간 등)"""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render_samples(self, items):
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """지표 목록 + 조회 시점 수집기(collector) — render()로 Prometheus 텍스트 생성"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, fn):
+        """조회 시점에 호출할 수집기 등록 — fn()은 (이름, 종류, 설명, [(labels dict, 값), ...]) 목록 반환"""
+        self._collectors.append(fn)
+        return fn
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for fn in self._collectors:
+            try:
+                families = fn()
+            except Exception as e:
+                print(f"[WARN] Metrics collector {getattr(fn, '__name__', fn)} failed: {e}")
+                continue
+            for name, kind, documentation, samples in families:
+                full_name = PREFIX + name
+                lines.append(f"# HELP {full_name} {documentation}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                for labels, value in samples:
+                    label_text = _format_labels(list(labels), list(labels.values()))
+                    lines.append(f"{full_name}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ── 요청 ──
+http_requests = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("endpoint", "method", "status"))
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 헤더까지)", ("endpoint",))
+upload_bytes = registry.counter(
+    "upload_bytes_total", "업로드 요청 본문 바이트 (Content-Length)", ("endpoint",))
+
+# ── 파싱 ──
+pdf_parses = registry.counter(
+    "pdf_parses_total", "PDF 파싱 수", ("insurer", "partial"))
+pdf_parse_duration = registry.histogram(
+    "pdf_parse_duration_seconds", "PDF 파싱 시간", ("insurer",))
+pdf_pages = registry.counter(
+    "pdf_pages_total", "엔진별 페이지 처리 횟수 (추출 패스마다 집계)", ("insurer", "engine"))
+pymupdf_fallbacks = registry.counter(
+    "pymupdf_fallbacks_total", "PyMuPDF 타임아웃/오류로 pdfplumber 폴백한 횟수", ("insurer",))
+
+# ── 매칭 ──
+match_coverages_count = registry.counter(
+    "match_coverages_total", "매칭 결과별 특약 수", ("insurer", "result"))
+match_duration = registry.histogram(
+    "match_duration_seconds", "match_coverages 실행 시간", ("insurer",),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+
+
+def observe_parse(pdf_info):
+    """parse_pdf_all_in_one 결과 1건 기록"""
+    insurer = pdf_info.get("insurer_code") or "unknown"
+    stats = pdf_info.get("stats") or {}
+    pdf_parses.inc(insurer=insurer, partial=str(bool(pdf_info.get("partial"))).lower())
+    if stats.get("elapsed_ms") is not None:
+        pdf_parse_duration.observe(stats["elapsed_ms"] / 1000, insurer=insurer)
+    for engine in ("pymupdf", "pdfplumber"):
+        pages = stats.get(f"pages_{engine}", 0)
+        if pages:
+            pdf_pages.inc(pages, insurer=insurer, engine=engine)
+    if stats.get("pymupdf_fallbacks"):
+        pymupdf_fallbacks.inc(stats["pymupdf_fallbacks"], insurer=insurer)
+
+
+def observe_match(insurer_code, result, elapsed_sec):
+    """match_coverages 결과 1건 기록"""
+    insurer = insurer_code or "unknown"
+    match_duration.observe(elapsed_sec, insurer=insurer)
+    for key in ("matched", "unmatched_pdf", "unmatched_excel"):
+        match_coverages_count.inc(len(result[key]), insurer=insurer, result=key)
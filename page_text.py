@@ -0,0 +1,70 @@
+"""페이지 텍스트 + 파생 뷰 캐시
+
+파서마다 같은 페이지에서 text.split('\\n'), text.replace(' ', ''), text.lower() 등을
+따로 만들고 있어서, 100페이지 문서면 같은 문자열 복사본이 감지/상품명/보험료/
+보험사별 파서 단계마다 반복 생성된다.
+
+PageText는 str 하위 클래스라 기존 코드(in, 정규식, 슬라이스)에 그대로 쓸 수 있고,
+파생 뷰는 처음 접근할 때 한 번만 계산해서 페이지 객체에 보관한다.
+
+  lines           — 줄 목록 (split('\\n'), 튜플)
+  stripped_lines  — 앞뒤 공백을 제거한 줄 목록
+  nospace         — 공백 제거 텍스트
+  compact         — 공백/줄바꿈 제거 텍스트
+  lowered         — 소문자 텍스트 (영문 도메인 검사용)
+  nfc             — NFC 정규화 텍스트 (자모 분리 PDF 대응, 이미 NFC면 자기 자신)
+"""
+import unicodedata
+from functools import cached_property
+
+
+class PageText(str):
+    """지연 계산 뷰가 붙은 페이지 텍스트"""
+
+    @cached_property
+    def lines(self):
+        return tuple(self.split('\n'))
+
+    @cached_property
+    def stripped_lines(self):
+        return tuple(line.strip() for line in self.lines)
+
+    @cached_property
+    def nospace(self):
+        return self.replace(' ', '')
+
+    @cached_property
+    def compact(self):
+        return self.nospace.replace('\n', '')
+
+    @cached_property
+    def lowered(self):
+        return self.lower()
+
+    @cached_property
+    def nfc(self):
+        if unicodedata.is_normalized('NFC', self):
+            return self
+        return PageText(unicodedata.normalize('NFC', self))
+
+
+EMPTY_PAGE = PageText("")
+
+
+def as_page_text(text):
+    """str/None → PageText (이미 PageText면 그대로)"""
+    if isinstance(text, PageText):
+        return text
+    return PageText(text) if text else EMPTY_PAGE
+
+
+def as_page_texts(texts):
+    """페이지 텍스트 목록 → PageText 목록 (None은 그대로 — 추출 실패 표시)"""
+    if texts is None:
+        return None
+    return [as_page_text(text) for text in texts]
+
+
+def join_pages(texts, sep="\n"):
+    """여러 페이지를 하나의 PageText로 연결 (앞 3페이지 보험사 감지 등)"""
+    return PageText(sep.join(texts))
@@ -1,7 +1,18 @@
+import os
 import pdfplumber
+import queue
 import re
 import signal
 import threading
+import time
+from collections import OrderedDict
+
+from admission import AdmissionRejected
+from boilerplate import BoilerplateIndex
+from coverage_record import Coverage, CoverageCollector
+from deadline import Deadline
+from korean_amount import find_korean_amount, parse_amount, parse_korean_amount
+from page_text import EMPTY_PAGE, as_page_text, as_page_texts, join_pages
 
 # PyMuPDF — 텍스트 추출 전용 (pdfplumber 대비 50배+ 빠름)
 try:
@@ -10,23 +21,70 @@ try:
 except ImportError:
     HAS_PYMUPDF = False
 
+# 단어 좌표 테이블 복원 (NumPy 필요) — 없으면 pdfplumber 테이블만 사용
+try:
+    from word_table import find_word_tables
+    HAS_WORD_TABLES = True
+except ImportError:
+    HAS_WORD_TABLES = False
 
-def _pymupdf_extract_texts_safe(pdf_path, timeout_sec=15):
-    """PyMuPDF 텍스트 추출 — 타임아웃 안전 래퍼.
+
+# ══════════════════════════════════════════════
+# 요청 시간 예산 (parse_pdf_all_in_one이 스레드별로 설정)
+# ══════════════════════════════════════════════
+# 단계마다 _current_deadline()으로 남은 시간을 확인한다. 예산이 끝나면 PyMuPDF 타임아웃을
+# 남은 시간으로 줄이고, pdfplumber 페이지 순회를 멈추고, 선택 단계(수술 종별 상세 등)를 생략한다.
+
+_deadline_local = threading.local()
+_NO_DEADLINE = Deadline(None)
+_OPTIONAL_STAGE_RESERVE_SEC = 2.0   # 선택 단계(pdfplumber 재오픈)는 이만큼 남아 있어야 실행
+
+
+def _current_deadline():
+    """현재 스레드의 파싱 시간 예산 (parse_pdf_all_in_one 밖에서는 무제한)"""
+    return getattr(_deadline_local, "deadline", None) or _NO_DEADLINE
+
+
+# ══════════════════════════════════════════════
+# 엔진별 처리 페이지 수 / PyMuPDF 폴백 (parse_pdf_all_in_one이 스레드별로 집계 → stats)
+# ══════════════════════════════════════════════
+
+_counters_local = threading.local()
+
+
+def _count(name, amount=1):
+    """현재 파싱의 카운터 증가 (parse_pdf_all_in_one 밖에서는 무시)"""
+    counters = getattr(_counters_local, "counters", None)
+    if counters is not None:
+        counters[name] = counters.get(name, 0) + amount
+
+
+def _pymupdf_run_safe(pdf_path, page_fn, page_indices=None, timeout_sec=15):
+    """PyMuPDF 페이지 처리 — 타임아웃 안전 래퍼.
     일부 PDF에서 PyMuPDF가 hang되는 현상 대응.
-    타임아웃 시 빈 리스트 반환 → pdfplumber 폴백.
+    page_indices가 없으면 전체 페이지, 있으면 해당 페이지만 page_fn 적용
+    (나머지 페이지는 빈 문자열). 타임아웃/오류 시 None 반환 → pdfplumber 폴백.
+    타임아웃은 요청 시간 예산의 남은 시간으로 줄어든다 (예산이 끝났으면 실행하지 않음).
     """
+    deadline = _current_deadline()
+    if not deadline.allow("pymupdf"):
+        return None
+    timeout_sec = deadline.timeout(timeout_sec)
     result_container = [None]
     error_container = [None]
 
     def _worker():
         try:
             doc = _fitz.open(pdf_path)
-            texts = []
-            for page in doc:
-                texts.append(page.get_text() or "")
+            if page_indices is None:
+                results = [page_fn(page) for page in doc]
+            else:
+                results = [""] * len(doc)
+                for i in sorted(page_indices):
+                    if i < len(doc):
+                        results[i] = page_fn(doc[i])
             doc.close()
-            result_container[0] = texts
+            result_container[0] = results
         except Exception as e:
             error_container[0] = e
 
@@ -35,80 +93,273 @@ def _pymupdf_extract_texts_safe(pdf_path, timeout_sec=15):
     t.join(timeout=timeout_sec)
 
     if t.is_alive():
-        # 타임아웃 — PyMuPDF hang
-        print(f"[WARN] PyMuPDF timed out ({timeout_sec}s) for {pdf_path}, falling back to pdfplumber")
+        # 타임아웃 — PyMuPDF hang (또는 시간 예산 소진)
+        print(f"[WARN] PyMuPDF timed out ({timeout_sec:.1f}s) for {pdf_path}, falling back to pdfplumber")
+        deadline.allow("pymupdf")
+        _count("pymupdf_fallbacks")
         return None
     if error_container[0]:
         print(f"[WARN] PyMuPDF error: {error_container[0]}, falling back to pdfplumber")
+        _count("pymupdf_fallbacks")
         return None
-    return result_container[0]
+    results = result_container[0]
+    _count("pages_pymupdf", len(results) if page_indices is None
+           else sum(1 for i in set(page_indices) if i < len(results)))
+    return results
 
 
-def detect_insurer(pdf_path):
-    """PDF에서 보험사 자동 감지"""
-    with pdfplumber.open(pdf_path) as pdf:
-        text = ""
-        for page in pdf.pages[:3]:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text
+def _pymupdf_extract_texts_safe(pdf_path, timeout_sec=15):
+    """PyMuPDF 텍스트 추출 (전체 페이지, 기본 get_text 순서)
 
-    keywords_ordered = [
-        ("삼성생명", "samsung_life"),
-        ("삼성화재", "samsung"),
-        ("메리츠화재", "meritz"),
-        ("메리츠", "meritz"),
-        ("미래에셋생명", "mirae"),
-        ("미래에셋", "mirae"),
-        ("KB손해", "kb"),
-        ("KB손보", "kb"),
-        ("KB 플러스", "kb"),
-        ("KB플러스", "kb"),
-        ("DB손해", "db"),
-        ("DB손보", "db"),
-        ("ABL", "abl"),
-        ("에이비엘", "abl"),
-        ("흥국", "heungkuk"),
-        ("한화", "hanwha"),
-        ("현대해상", "hyundai"),
-        ("롯데손해", "lotte"),
-        ("NH농협", "nh"),
-        ("동양생명", "dongyang"),
-        ("교보생명", "kyobo"),
-        ("신한라이프", "shinhan"),
-        ("라이나생명", "lina"),
-        ("라이나", "lina"),
-    ]
+    Returns:
+        (page_texts, page_heights) — 페이지 높이(pt)는 레이아웃 캐시 하단 검사용. 실패 시 None
+    """
+    pages = _pymupdf_run_safe(
+        pdf_path, lambda page: (page.get_text() or "", page.rect.height), timeout_sec=timeout_sec
+    )
+    if pages is None:
+        return None
+    return as_page_texts([text for text, _ in pages]), [height for _, height in pages]
 
-    for keyword, insurer in keywords_ordered:
-        if keyword in text:
-            return insurer
 
-    if "kbinsure" in text.lower():
-        return "kb"
+def _pymupdf_layout_text(page, y_tolerance=3):
+    """PyMuPDF 단어 좌표로 pdfplumber extract_text()와 같은 줄 구조 재구성
+
+    단어를 top 좌표로 정렬해 y_tolerance 이내면 같은 줄로 묶고,
+    줄 안에서는 x 좌표 순으로 공백 연결 (pdfminer 레이아웃 분석 없이).
+    """
+    words = page.get_text("words")
+    if not words:
+        return ""
+    words.sort(key=lambda w: (w[1], w[0]))
+
+    lines = []
+    current = []
+    prev_top = None
+    for w in words:
+        if current and w[1] - prev_top > y_tolerance:
+            lines.append(current)
+            current = []
+        current.append(w)
+        prev_top = w[1]
+    if current:
+        lines.append(current)
+
+    return "\n".join(
+        " ".join(w[4] for w in sorted(line, key=lambda w: w[0]))
+        for line in lines
+    )
+
+
+def _pymupdf_extract_layout_texts_safe(pdf_path, page_indices, timeout_sec=15):
+    """PyMuPDF 레이아웃 텍스트 추출 (지정 페이지만, 나머지는 빈 문자열)"""
+    return as_page_texts(_pymupdf_run_safe(
+        pdf_path, _pymupdf_layout_text, page_indices=page_indices, timeout_sec=timeout_sec
+    ))
+
+
+# ══════════════════════════════════════════════
+# 메모리 관리 (512MB 인스턴스 OOM 방지)
+# ══════════════════════════════════════════════
+# pdfplumber는 한 번 접근한 페이지의 레이아웃 객체(chars, lines, rects)를
+# 페이지 객체에 캐시해 두기 때문에 with 블록이 끝날 때까지 메모리가 쌓인다.
+# 페이지 처리가 끝나면 즉시 캐시를 해제하고, 동시 파싱은 메모리 예산 안에서만
+# 진행한다 (초과분은 대기열에서 기다림).
+
+PDF_MEMORY_BUDGET_MB = int(os.environ.get("PDF_MEMORY_BUDGET_MB", "320"))
+PDF_MEMORY_WAIT_SEC = float(os.environ.get("PDF_MEMORY_WAIT_SEC", "120"))
+_MIN_PARSE_RESERVATION_MB = 48
+_PARSE_MB_PER_FILE_MB = 12   # PDF 파일 1MB당 파싱 중 예상 메모리 (pdfplumber 레이아웃 객체 포함)
+_MEMORY_RETRY_AFTER_SEC = 10
+
+_rss_local = threading.local()
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+def _current_rss_mb():
+    """현재 프로세스 RSS (MB) — /proc 미지원 환경이면 None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _sample_rss():
+    """진행 중인 파싱의 최대 RSS 갱신 (페이지 처리 직후 호출)"""
+    if getattr(_rss_local, "peak", None) is None:
+        return
+    rss = _current_rss_mb()
+    if rss is not None and rss > _rss_local.peak:
+        _rss_local.peak = rss
+
+
+def _release_page(page):
+    """pdfplumber 페이지 레이아웃 캐시 해제 (해제 직전 RSS 측정)"""
+    _sample_rss()
+    close = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+    if close:
+        close()
+
+
+def _iter_pages(pages, stage="pdfplumber"):
+    """pdfplumber 페이지 순회 — 다음 페이지로 넘어가거나 루프를 벗어나면 이전 페이지 캐시 해제
+
+    요청 시간 예산이 끝나면 남은 페이지는 순회하지 않는다 (stage를 생략 단계로 기록).
+    """
+    deadline = _current_deadline()
+    for page in pages:
+        if not deadline.allow(stage):
+            print(f"[WARN] Parse time budget exhausted, skipping remaining pages ({stage})")
+            return
+        _count("pages_pdfplumber")
+        try:
+            yield page
+        finally:
+            _release_page(page)
+
+
+class ParseOverloaded(AdmissionRejected):
+    """메모리 예산 대기 시간 초과 — 수용 거절과 같이 503 + Retry-After로 응답"""
+
+    def __init__(self, message, retry_after=_MEMORY_RETRY_AFTER_SEC):
+        super().__init__(503, retry_after, message)
+
 
-    if "lina.co.kr" in text.lower():
-        return "lina"
+class _MemoryBudget:
+    """파싱 동시 실행을 예상 메모리 합계로 제한하는 대기열
+
+    예산을 넘는 요청은 다른 파싱이 끝날 때까지 기다리고,
+    wait_sec 안에 자리가 나지 않으면 ParseOverloaded.
+    """
+
+    def __init__(self, capacity_mb):
+        self.capacity_mb = capacity_mb
+        self.in_use_mb = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, amount_mb, wait_sec):
+        amount_mb = min(amount_mb, self.capacity_mb)
+        deadline = time.monotonic() + wait_sec
+        with self._cond:
+            self.waiting += 1
+            try:
+                while self.in_use_mb + amount_mb > self.capacity_mb:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ParseOverloaded(
+                            f"PDF 파싱 메모리 예산 대기 시간 초과 ({wait_sec:.0f}s, "
+                            f"사용 중 {self.in_use_mb}MB / {self.capacity_mb}MB)"
+                        )
+                    self._cond.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.in_use_mb += amount_mb
+        return amount_mb
+
+    def release(self, amount_mb):
+        with self._cond:
+            self.in_use_mb -= amount_mb
+            self._cond.notify_all()
+
+
+_memory_budget = _MemoryBudget(PDF_MEMORY_BUDGET_MB)
+
+
+def _estimate_parse_memory_mb(pdf_path):
+    """PDF 파일 크기로 파싱 중 예상 메모리 (MB) 추정"""
+    try:
+        size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+    except OSError:
+        size_mb = 0
+    return max(_MIN_PARSE_RESERVATION_MB, int(16 + size_mb * _PARSE_MB_PER_FILE_MB))
 
-    if "meritzfire.com" in text.lower() or "1566-7711" in text:
-        return "meritz"
 
+# ══════════════════════════════════════════════
+# 보험사 감지 (우선순위 키워드 표)
+# ══════════════════════════════════════════════
+# 우선순위 순서 — 앞쪽 키워드가 텍스트 어디에든 있으면 그 보험사.
+# 키워드마다 부분 문자열 검사(C 구현)를 하고 첫 일치에서 멈춘다 — 정규식 하나로
+# 모든 위치를 훑는 것보다 3페이지 크기 텍스트에서 훨씬 빠르다 (benchmarks/insurer_detection.py).
+_INSURER_KEYWORDS = [
+    ("삼성생명", "samsung_life"),
+    ("삼성화재", "samsung"),
+    ("메리츠화재", "meritz"),
+    ("메리츠", "meritz"),
+    ("미래에셋생명", "mirae"),
+    ("미래에셋", "mirae"),
+    ("KB손해", "kb"), ("KB손보", "kb"),
+    ("KB 플러스", "kb"), ("KB플러스", "kb"),
+    ("DB손해", "db"), ("DB손보", "db"),
+    ("ABL", "abl"), ("에이비엘", "abl"),
+    ("흥국", "heungkuk"), ("한화", "hanwha"),
+    ("현대해상", "hyundai"), ("롯데손해", "lotte"),
+    ("NH농협", "nh"), ("동양생명", "dongyang"),
+    ("교보생명", "kyobo"), ("신한라이프", "shinhan"),
+    ("라이나생명", "lina"), ("라이나", "lina"),
+]
+# 영문 도메인 등 — 소문자로 바꾼 텍스트에서 검사 (대소문자 무시, lower()는 한 번만)
+_INSURER_KEYWORDS_LOWER = [
+    ("kbinsure", "kb"),
+    ("lina.co.kr", "lina"),
+    ("meritzfire.com", "meritz"), ("1566-7711", "meritz"),
     # DB손해보험: PDF에 "DB손해" 키워드 없이 "idbins.com" 또는 "프로미라이프" 포함
-    if "idbins.com" in text.lower() or "프로미라이프" in text:
-        return "db"
+    ("idbins.com", "db"), ("프로미라이프", "db"),
+]
+# "삼성"만 있으면 생명 상품 키워드로 삼성생명/삼성화재 구분
+_SAMSUNG_LIFE_HINTS = ["생명보험", "건강보험", "종신보험", "The간편한", "다모은"]
 
+
+def _detect_insurer_from_text(text):
+    """이미 추출된 텍스트에서 보험사 감지 (우선순위 순서로 첫 키워드)"""
+    text = as_page_text(text).nfc
+    for keyword, insurer in _INSURER_KEYWORDS:
+        if keyword in text:
+            return insurer
+    for keyword, insurer in _INSURER_KEYWORDS_LOWER:
+        if keyword in text.lowered:
+            return insurer
     if "삼성" in text:
-        if any(kw in text for kw in ["생명보험", "건강보험", "종신보험", "The간편한", "다모은"]):
+        if any(kw in text for kw in _SAMSUNG_LIFE_HINTS):
             return "samsung_life"
         return "samsung"
-
     return None
 
 
+def _detect_insurer_provisional(doc, first_page_text):
+    """PDF 메타데이터(title/author/subject/producer 등) + 첫 페이지 텍스트로 보험사 잠정 판정
+
+    앞 3페이지 텍스트 추출 전에 판정이 필요한 곳(파이프라인 테이블 전송 시작)에서 사용.
+    최종 보험사 코드는 항상 앞 3페이지 텍스트 기준 (_detect_insurer_from_text).
+    """
+    try:
+        metadata = doc.metadata or {}
+    except Exception:
+        metadata = {}
+    meta_text = "\n".join(str(v) for v in metadata.values() if v)
+    return _detect_insurer_from_text(meta_text + "\n" + first_page_text)
+
+
+def detect_insurer(pdf_path):
+    """PDF에서 보험사 자동 감지"""
+    with pdfplumber.open(pdf_path) as pdf:
+        text = ""
+        for page in _iter_pages(pdf.pages[:3]):
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text
+
+    return _detect_insurer_from_text(text)
+
+
 def detect_product_name(pdf_path):
     """PDF에서 상품명 추출"""
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages[:10]:
+        for page in _iter_pages(pdf.pages[:10]):
             text = page.extract_text()
             if not text:
                 continue
@@ -178,7 +429,7 @@ def detect_product_name(pdf_path):
 def extract_premium(pdf_path):
     """PDF에서 보험료 추출 (원 단위)"""
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages[:7]:
+        for page in _iter_pages(pdf.pages[:7]):
             text = page.extract_text()
             if not text:
                 continue
@@ -228,16 +479,16 @@ def find_name_col_from_data(table, header_idx):
 
 def extract_coverage_kb(pdf_path):
     """KB손해보험 PDF 파싱 — 가입담보 페이지 집중 파싱"""
-    results = []
+    results = CoverageCollector()
     full_text = ""
 
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
+        for page in _iter_pages(pdf.pages):
             page_text = page.extract_text()
             if page_text:
                 full_text += page_text + "\n"
 
-        for page_num, page in enumerate(pdf.pages[:10]):
+        for page_num, page in enumerate(_iter_pages(pdf.pages[:10])):
             page_text = page.extract_text()
             if not page_text:
                 continue
@@ -249,14 +500,7 @@ def extract_coverage_kb(pdf_path):
                 continue
 
             _parse_kb_coverage_page(page_text, results)
-
-    seen = set()
-    unique_results = []
-    for r in results:
-        if r["특약명"] not in seen:
-            seen.add(r["특약명"])
-            unique_results.append(r)
-    results = unique_results
+    results = results.items
 
     _enrich_kb_injury_grade_info(results, full_text)
 
@@ -264,8 +508,8 @@ def extract_coverage_kb(pdf_path):
 
 
 def _parse_kb_coverage_page(page_text, results):
-    """KB 가입담보 페이지 텍스트에서 보장명+가입금액 추출"""
-    lines = page_text.split('\n')
+    """KB 가입담보 페이지 텍스트에서 보장명+가입금액 추출 (results: CoverageCollector, 먼저 나온 보장명 유지)"""
+    lines = as_page_text(page_text).lines
 
     i = 0
     while i < len(lines):
@@ -293,7 +537,7 @@ def _parse_kb_coverage_page(page_text, results):
         if amount_in_line:
             clean_name = _clean_kb_amount_from_name(name_part)
             if clean_name and len(clean_name) >= 2:
-                results.append({"특약명": clean_name, "가입금액": amount_in_line})
+                results.add(clean_name, amount_in_line)
             continue
 
         amount = None
@@ -314,55 +558,12 @@ def _parse_kb_coverage_page(page_text, results):
 
         if amount and name_part and len(name_part) >= 2:
             if not _is_kb_skip_line(name_part):
-                results.append({"특약명": name_part, "가입금액": amount})
+                results.add(name_part, amount)
 
 
 def _extract_kb_amount_from_text(text):
-    """텍스트에서 KB 가입금액 패턴 추출 (원 단위 반환)"""
-    match = re.search(r'(\d+천\d*백만원|\d+억\d*천?만?원|\d+천만원|\d+백만원|\d+만원)', text)
-    if match:
-        return _parse_korean_amount(match.group(1))
-    return None
-
-
-def _parse_korean_amount(text):
-    """한글 금액을 원 단위 숫자로 변환"""
-    text = text.replace(',', '').replace(' ', '')
-
-    match = re.match(r'(\d+)천(\d*)백만원', text)
-    if match:
-        thousands = int(match.group(1))
-        hundreds = int(match.group(2)) if match.group(2) else 0
-        return (thousands * 1000 + hundreds * 100) * 10000
-
-    match = re.match(r'(\d+)억(\d*천?만?)원?', text)
-    if match:
-        billions = int(match.group(1))
-        rest = match.group(2)
-        rest_val = 0
-        if rest:
-            rest_match = re.match(r'(\d+)천만', rest)
-            if rest_match:
-                rest_val = int(rest_match.group(1)) * 10000000
-            else:
-                rest_match = re.match(r'(\d+)만', rest)
-                if rest_match:
-                    rest_val = int(rest_match.group(1)) * 10000
-        return billions * 100000000 + rest_val
-
-    match = re.match(r'(\d+)천만원', text)
-    if match:
-        return int(match.group(1)) * 10000000
-
-    match = re.match(r'(\d+)백만원', text)
-    if match:
-        return int(match.group(1)) * 1000000
-
-    match = re.match(r'(\d+)만원', text)
-    if match:
-        return int(match.group(1)) * 10000
-
-    return None
+    """텍스트에서 KB 가입금액 패턴 추출 (원 단위 반환, 'N만원'처럼 원으로 끝나는 금액만)"""
+    return find_korean_amount(text, won_suffix=True)
 
 
 def _clean_kb_amount_from_name(name):
@@ -403,8 +604,8 @@ def _enrich_kb_injury_grade_info(results, full_text):
     if pattern_14:
         grade_14_amount = int(pattern_14.group(1).replace(',', '')) * 10000
         for r in results:
-            if "사고부상" in r["특약명"] and ("4~14" in r["특약명"] or "4~14급" in r["특약명"]):
-                r["14급지급액"] = grade_14_amount
+            if "사고부상" in r.name and ("4~14" in r.name or "4~14급" in r.name):
+                r.grade14 = grade_14_amount
                 break
 
 
@@ -412,55 +613,93 @@ def _enrich_kb_injury_grade_info(results, full_text):
 # 미래에셋생명 전용 파서
 # ══════════════════════════════════════════════
 
-def extract_coverage_mirae(pdf_path):
-    """미래에셋생명 PDF 파싱 — 보험계약 개요 페이지에서 추출"""
-    results = []
+_MIRAE_OVERVIEW_PAGES = range(0, 7)      # 보험계약 개요
+_MIRAE_BENEFIT_PAGES = range(0, 15)      # 주계약/선택특약 보장내역
+_MIRAE_SURGERY_PAGES = range(14, 25)     # 1-7종수술 종별 금액
 
+
+def extract_coverage_mirae(pdf_path):
+    """미래에셋생명 PDF 파싱 — pdfplumber 텍스트 (PyMuPDF 미설치/레이아웃 텍스트 실패 시)"""
     with pdfplumber.open(pdf_path) as pdf:
-        overview_text = ""
-        for page in pdf.pages[:7]:
-            page_text = page.extract_text()
-            if page_text and ("보험종류" in page_text or "보험가입금액" in page_text):
-                overview_text += page_text + "\n"
+        page_texts = [
+            as_page_text(page.extract_text())
+            for page in _iter_pages(pdf.pages[:_MIRAE_SURGERY_PAGES.stop])
+        ]
+    return _extract_coverage_mirae_from_texts(page_texts)
+
+
+def _mirae_section_pages(page_texts_fast):
+    """PyMuPDF 텍스트로 미래에셋 섹션 페이지 인덱스 결정 (공백 무시 키워드 검사)
+
+    파서가 페이지 안에서 정확한 키워드를 다시 확인하므로 여기서는 넉넉하게 고른다.
+    """
+    n_pages = len(page_texts_fast)
+    nospace = [as_page_text(t).compact for t in page_texts_fast]
+    pages = {i for i in _MIRAE_OVERVIEW_PAGES if i < n_pages}
+    pages |= {
+        i for i in _MIRAE_BENEFIT_PAGES
+        if i < n_pages and ("보장내역" in nospace[i] or "지급사유" in nospace[i])
+    }
+    pages |= {
+        i for i in _MIRAE_SURGERY_PAGES
+        if i < n_pages and "1-7종수술" in nospace[i]
+    }
+    return pages
+
+
+def _extract_coverage_mirae_fast(pdf_path, page_texts_fast):
+    """미래에셋생명 — PyMuPDF 레이아웃 텍스트로 파싱 (pdfplumber 미오픈)
 
+    섹션 페이지만 레이아웃 텍스트로 복원해 같은 파서에 넣는다.
+    결과가 없거나 레이아웃 텍스트가 비면 기존 pdfplumber 파서로 폴백.
+    """
+    pages = _mirae_section_pages(page_texts_fast)
+    layout_texts = _pymupdf_extract_layout_texts_safe(pdf_path, pages) if pages else None
+    if layout_texts is not None and not any(
+        page_texts_fast[i].strip() and not layout_texts[i].strip() for i in pages
+    ):
+        results = _extract_coverage_mirae_from_texts(layout_texts)
+        if results:
+            return results
+    if not _current_deadline().allow("pdfplumber_fallback", _OPTIONAL_STAGE_RESERVE_SEC):
+        return []
+    return extract_coverage_mirae(pdf_path)
+
+
+def _extract_coverage_mirae_from_texts(page_texts):
+    """미래에셋생명 PDF 파싱 — 보험계약 개요 페이지에서 추출 (페이지별 텍스트 입력)"""
+    overview_pages = [page_texts[i] for i in _MIRAE_OVERVIEW_PAGES if i < len(page_texts)]
+    overview_text = "".join(
+        t + "\n" for t in overview_pages
+        if t and ("보험종류" in t or "보험가입금액" in t)
+    )
     if not overview_text:
-        with pdfplumber.open(pdf_path) as pdf:
-            overview_text = ""
-            for page in pdf.pages[:7]:
-                page_text = page.extract_text()
-                if page_text:
-                    overview_text += page_text + "\n"
+        overview_text = "".join(t + "\n" for t in overview_pages if t)
 
     lines = overview_text.split('\n')
     person_name = _detect_person_name(lines)
     results = _parse_mirae_blocks(lines, person_name)
 
     if not results:
-        results = _parse_mirae_benefit_section(pdf_path)
+        results = _parse_mirae_benefit_section_from_texts(page_texts)
 
-    main_info = _detect_main_contract_benefit(pdf_path)
+    main_info = _detect_main_contract_benefit_from_texts(page_texts)
 
     if main_info:
         benefit_name = main_info["benefit_name"]
         found_main = False
         for r in results:
-            if "주계약" in r["특약명"]:
-                r["특약명"] = benefit_name
+            if "주계약" in r.name:
+                results.rename(r.name, benefit_name)
                 found_main = True
                 break
         if not found_main and main_info["amount"]:
-            results.append({
-                "특약명": benefit_name,
-                "가입금액": main_info["amount"]
-            })
+            results.add(benefit_name, main_info["amount"])
 
     # 1-7종수술 종별 세부금액 추출 (보장내역 상세 페이지에서)
-    surgery_details = _extract_mirae_surgery_grade_detail(pdf_path)
-    for r in surgery_details:
-        if not any(existing["특약명"] == r["특약명"] for existing in results):
-            results.append(r)
+    results.extend(_extract_mirae_surgery_grade_detail_from_texts(page_texts))
 
-    return results
+    return results.items
 
 
 def _detect_person_name(lines):
@@ -485,8 +724,10 @@ def _parse_mirae_blocks(lines, person_name):
       패턴 B: 특약명이 이전 줄, 고객님+금액이 다음 줄
         예: '암(유사암제외)진단특약(갱신형)무배당'
             '고객님 5,000 33 ...'
+
+    Returns: CoverageCollector
     """
-    results = []
+    results = CoverageCollector()
     if not person_name:
         return results
 
@@ -548,8 +789,7 @@ def _parse_mirae_blocks(lines, person_name):
                     if "납입면제" in clean_name:
                         name_buffer = ""
                         continue
-                    if not any(r["특약명"] == clean_name for r in results):
-                        results.append({"특약명": clean_name, "가입금액": amount})
+                    results.add(clean_name, amount)
                 name_buffer = ""
                 continue
 
@@ -558,8 +798,7 @@ def _parse_mirae_blocks(lines, person_name):
             if amount and before_person and len(before_person) >= 4:
                 inline_name = _clean_mirae_coverage_name(before_person)
                 if inline_name and len(inline_name) >= 2 and "납입면제" not in inline_name:
-                    if not any(r["특약명"] == inline_name for r in results):
-                        results.append({"특약명": inline_name, "가입금액": amount})
+                    results.add(inline_name, amount)
                 name_buffer = ""
                 continue
             name_buffer = ""
@@ -604,40 +843,46 @@ def _parse_mirae_blocks(lines, person_name):
 def _detect_main_contract_benefit(pdf_path):
     """미래에셋 PDF 보장내역 섹션에서 주계약의 실제 보장내용과 금액 감지"""
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages[:15]:
-            text = page.extract_text()
-            if not text:
-                continue
-            if "주계약 보장내역" not in text:
-                continue
+        page_texts = [
+            as_page_text(page.extract_text())
+            for page in _iter_pages(pdf.pages[:_MIRAE_BENEFIT_PAGES.stop])
+        ]
+    return _detect_main_contract_benefit_from_texts(page_texts)
 
-            lines = text.split('\n')
-            in_main_section = False
-            benefit_name = None
-            amount = None
 
-            for idx, line in enumerate(lines):
-                line_clean = re.sub(r'^#+\s*', '', line.strip()).strip()
-                if "주계약 보장내역" in line_clean:
-                    in_main_section = True
-                    continue
-                if "선택특약 보장내역" in line_clean:
-                    break
-                if not in_main_section:
-                    continue
+def _detect_main_contract_benefit_from_texts(page_texts):
+    """주계약 보장내역 감지 (페이지별 텍스트 입력, 0~14페이지)"""
+    for text in page_texts[:_MIRAE_BENEFIT_PAGES.stop]:
+        if not text:
+            continue
+        if "주계약 보장내역" not in text:
+            continue
 
-                bracket_match = re.search(r'\[([^\]]+보험금[^\]]*)\]', line_clean)
-                if bracket_match:
-                    benefit_raw = bracket_match.group(1).strip()
-                    benefit_name = _map_main_benefit_name(benefit_raw)
+        lines = as_page_text(text).lines
+        in_main_section = False
+        benefit_name = None
+        amount = None
 
-                if benefit_name and amount is None:
-                    amount_match = re.search(r'(\d[\d,]*)\s*만원', line_clean)
-                    if amount_match:
-                        amount = int(amount_match.group(1).replace(',', '')) * 10000
+        for idx, line in enumerate(lines):
+            line_clean = re.sub(r'^#+\s*', '', line.strip()).strip()
+            if "주계약 보장내역" in line_clean:
+                in_main_section = True
+                continue
+            if "선택특약 보장내역" in line_clean:
+                break
+            if not in_main_section:
+                continue
+
+            bracket_match = re.search(r'\[([^\]]+보험금[^\]]*)\]', line_clean)
+            if bracket_match:
+                benefit_raw = bracket_match.group(1).strip()
+                benefit_name = _map_main_benefit_name(benefit_raw)
+
+            if benefit_name and amount is None:
+                amount = find_korean_amount(line_clean, won_suffix=True)
 
-                if benefit_name and amount:
-                    return {"benefit_name": benefit_name, "amount": amount}
+            if benefit_name and amount:
+                return {"benefit_name": benefit_name, "amount": amount}
 
     return None
 
@@ -664,65 +909,74 @@ def _extract_mirae_surgery_grade_detail(pdf_path):
     PDF 18~19페이지 부근에서 1-7종수술분류표의 종별 금액을 찾아서
     개별 특약으로 추가. 예: 1종 10만원, 2종 20만원, ..., 7종 500만원
     """
-    grade_results = []
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            max_page = min(len(pdf.pages), 25)
-            for i in range(14, max_page):  # 15페이지부터
-                page = pdf.pages[i]
-                text = page.extract_text() or ""
-                
-                if '1-7종수술' not in text:
-                    continue
-                
-                # 패턴: X종 YY만원 (연속)
-                grade_amounts = re.findall(r'(\d)종\s+(\d[\d,]*만원)', text)
-                for grade_str, amount_str in grade_amounts:
-                    grade = int(grade_str)
-                    if 1 <= grade <= 7:
-                        amount = parse_amount(amount_str)
-                        if amount:
-                            name = f"[1-7종]{grade}종수술"
-                            # 중복 체크
-                            if not any(r["특약명"] == name for r in grade_results):
-                                grade_results.append({
-                                    "특약명": name,
-                                    "가입금액": amount
-                                })
+            page_texts = [EMPTY_PAGE] * _MIRAE_SURGERY_PAGES.start + [
+                as_page_text(page.extract_text())
+                for page in _iter_pages(pdf.pages[_MIRAE_SURGERY_PAGES.start:_MIRAE_SURGERY_PAGES.stop])
+            ]
+    except Exception:
+        return []
+    return _extract_mirae_surgery_grade_detail_from_texts(page_texts)
+
+
+def _extract_mirae_surgery_grade_detail_from_texts(page_texts):
+    """1-7종수술 종별 상세 금액 추출 (페이지별 텍스트 입력, 15페이지부터)"""
+    grade_results = CoverageCollector()
+    try:
+        for text in page_texts[_MIRAE_SURGERY_PAGES.start:_MIRAE_SURGERY_PAGES.stop]:
+            text = text or ""
+
+            if '1-7종수술' not in text:
+                continue
+
+            # 패턴: X종 YY만원 (연속)
+            grade_amounts = re.findall(r'(\d)종\s+(\d[\d,]*만원)', text)
+            for grade_str, amount_str in grade_amounts:
+                grade = int(grade_str)
+                if 1 <= grade <= 7:
+                    amount = parse_amount(amount_str)
+                    if amount:
+                        grade_results.add(f"[1-7종]{grade}종수술", amount)
     except Exception:
         pass
     
-    return grade_results
+    return grade_results.items
 
 
 def _parse_mirae_benefit_section(pdf_path):
     """미래에셋 PDF 보장내역 섹션에서 지급금액 기반 추출 (보완용)"""
-    results = []
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages[:15]:
-            text = page.extract_text()
-            if not text:
-                continue
-            if "보장내역" not in text and "지급사유" not in text:
-                continue
+        page_texts = [
+            as_page_text(page.extract_text())
+            for page in _iter_pages(pdf.pages[:_MIRAE_BENEFIT_PAGES.stop])
+        ]
+    return _parse_mirae_benefit_section_from_texts(page_texts).items
 
-            lines = text.split('\n')
-            current_name = None
 
-            for line in lines:
-                line_clean = re.sub(r'^#+\s*', '', line.strip()).strip()
-                if any(kw in line_clean for kw in ["특약", "주계약"]) and "대상" not in line_clean:
-                    current_name = _clean_mirae_coverage_name(line_clean)
+def _parse_mirae_benefit_section_from_texts(page_texts):
+    """보장내역 섹션 지급금액 기반 추출 (페이지별 텍스트 입력, 0~14페이지) — CoverageCollector 반환"""
+    results = CoverageCollector()
+    for text in page_texts[:_MIRAE_BENEFIT_PAGES.stop]:
+        if not text:
+            continue
+        if "보장내역" not in text and "지급사유" not in text:
+            continue
 
-                amount_match = re.search(r'(\d[\d,]*)\s*만원', line_clean)
-                if amount_match and current_name:
-                    val = int(amount_match.group(1).replace(',', ''))
-                    amount = val * 10000
-                    if amount > 0 and len(current_name) >= 2:
-                        if "납입면제" not in current_name:
-                            if not any(r["특약명"] == current_name for r in results):
-                                results.append({"특약명": current_name, "가입금액": amount})
-                    current_name = None
+        lines = as_page_text(text).lines
+        current_name = None
+
+        for line in lines:
+            line_clean = re.sub(r'^#+\s*', '', line.strip()).strip()
+            if any(kw in line_clean for kw in ["특약", "주계약"]) and "대상" not in line_clean:
+                current_name = _clean_mirae_coverage_name(line_clean)
+
+            amount = find_korean_amount(line_clean, won_suffix=True)
+            if amount and current_name:
+                if len(current_name) >= 2:
+                    if "납입면제" not in current_name:
+                        results.add(current_name, amount)
+                current_name = None
 
     return results
 
@@ -743,11 +997,11 @@ def _clean_mirae_coverage_name(name):
 
 def extract_coverage_samsung(pdf_path):
     """삼성생명 PDF 파싱 — 텍스트 기반 (주력)"""
-    results = []
+    results = CoverageCollector()
 
     with pdfplumber.open(pdf_path) as pdf:
         full_text = ""
-        for page in pdf.pages:
+        for page in _iter_pages(pdf.pages):
             page_text = page.extract_text()
             if page_text:
                 full_text += page_text + "\n"
@@ -775,8 +1029,7 @@ def extract_coverage_samsung(pdf_path):
                 name_nospace = name.replace(" ", "")
                 skip_words = ["합계보험료", "주보험"]
                 if not any(sk in name_nospace for sk in skip_words):
-                    if not any(r["특약명"] == name for r in results):
-                        results.append({"특약명": name, "가입금액": amount})
+                    results.add(name, amount)
             continue
 
         match_name = re.match(r'^(\d{1,4})\s+(.+)', line)
@@ -793,8 +1046,7 @@ def extract_coverage_samsung(pdf_path):
                     amount = parse_amount(amount_in_line.group(1))
                     name = name_part[:amount_in_line.start()].strip()
                     if name and amount and len(name) >= 5:
-                        if not any(r["특약명"] == name for r in results):
-                            results.append({"특약명": name, "가입금액": amount})
+                        results.add(name, amount)
                     continue
 
                 for look_ahead in range(i, min(i + 3, len(lines))):
@@ -803,8 +1055,7 @@ def extract_coverage_samsung(pdf_path):
                     if amount_match:
                         amount = parse_amount(amount_match.group(1))
                         if name_part and amount and len(name_part) >= 5:
-                            if not any(r["특약명"] == name_part for r in results):
-                                results.append({"특약명": name_part, "가입금액": amount})
+                            results.add(name_part, amount)
                         break
                 continue
 
@@ -812,8 +1063,8 @@ def extract_coverage_samsung(pdf_path):
             amount_match = re.search(r'(\d[\d,]*(?:억|천만|백만|만|천)?원)', line)
             if amount_match:
                 amount = parse_amount(amount_match.group(1))
-                if amount and not any(r["특약명"] == "주보험 재해사망" for r in results):
-                    results.append({"특약명": "주보험 재해사망", "가입금액": amount})
+                if amount:
+                    results.add("주보험 재해사망", amount)
             continue
 
         if line.startswith("재해사망보험금"):
@@ -822,23 +1073,23 @@ def extract_coverage_samsung(pdf_path):
                 amount_match = re.search(r'(\d[\d,]*(?:억|천만|백만|만|천)?원)', next_line)
                 if amount_match:
                     amount = parse_amount(amount_match.group(1))
-                    if amount and not any(r["특약명"] == "주보험 재해사망" for r in results):
-                        results.append({"특약명": "주보험 재해사망", "가입금액": amount})
+                    if amount:
+                        results.add("주보험 재해사망", amount)
                     break
             continue
 
     if not results:
-        results = extract_coverage_samsung_table(pdf_path)
+        return extract_coverage_samsung_table(pdf_path)
 
-    return results
+    return results.items
 
 
 def extract_coverage_samsung_table(pdf_path):
     """삼성생명 PDF 테이블 기반 파싱 (보완용)"""
-    results = []
+    results = CoverageCollector()
 
     with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages):
+        for page_num, page in enumerate(_iter_pages(pdf.pages)):
             text = page.extract_text()
             if not text:
                 continue
@@ -925,10 +1176,10 @@ def extract_coverage_samsung_table(pdf_path):
 
                     if raw_name and amount:
                         clean_name = re.sub(r'^\d+\s+', '', raw_name).strip()
-                        if clean_name and not any(r["특약명"] == clean_name for r in results):
-                            results.append({"특약명": clean_name, "가입금액": amount})
+                        if clean_name:
+                            results.add(clean_name, amount)
 
-    return results
+    return results.items
 
 
 # ══════════════════════════════════════════════
@@ -951,9 +1202,9 @@ def _parse_heungkuk_coverage_table(table):
     row[4] = 납입기간  
     row[5] = 보험료
     """
-    results = []
+    results = CoverageCollector()
     if not table or len(table) < 2:
-        return results
+        return results.items
     
     # 헤더 확인 — '상품명' 또는 '가입금액' 포함 여부
     header_idx = None
@@ -964,7 +1215,7 @@ def _parse_heungkuk_coverage_table(table):
             break
     
     if header_idx is None:
-        return results
+        return results.items
     
     # 가입금액 컬럼 인덱스 찾기
     amount_col = 2  # 기본값
@@ -1039,10 +1290,9 @@ def _parse_heungkuk_coverage_table(table):
                         break
         
         if name and amount:
-            if not any(r["특약명"] == name for r in results):
-                results.append({"특약명": name, "가입금액": amount})
+            results.add(name, amount)
     
-    return results
+    return results.items
 
 
 def _extract_heungkuk_surgery_grade_detail(pdf_path):
@@ -1051,51 +1301,54 @@ def _extract_heungkuk_surgery_grade_detail(pdf_path):
     보장내용 페이지(약 15~25페이지)에서 '1~5종재해수술' 관련 상세 금액을 파싱.
     패턴: '1종 10만원', '2종 25만원' 등이 연속으로 나옴.
     """
-    grade_results = []
     try:
         with pdfplumber.open(pdf_path) as pdf:
             max_page = min(len(pdf.pages), 30)
-            for i in range(14, max_page):  # 15페이지부터 (0-indexed: 14)
-                page = pdf.pages[i]
-                text = page.extract_text() or ""
-                
-                # '1~5종재해수술' 상세 설명이 있는 페이지
-                if '재해수술' not in text or '수술분류표' not in text:
-                    continue
-                
-                # 패턴: X종 YY만원 (연속으로 1~5종)
-                grade_amounts = re.findall(r'(\d)종\s+(\d[\d,]*만원)', text)
-                if len(grade_amounts) >= 3:  # 최소 3종 이상 발견시
-                    for grade_str, amount_str in grade_amounts:
-                        grade = int(grade_str)
-                        if 1 <= grade <= 5:
-                            amount = parse_amount(amount_str)
-                            if amount:
-                                name = f"[재해]{grade}종수술"
-                                grade_results.append({
-                                    "특약명": name,
-                                    "가입금액": amount
-                                })
-                    if grade_results:
-                        break  # 첫 발견 시 중단
+            page_texts = [EMPTY_PAGE] * max_page
+            for i, page in enumerate(_iter_pages(pdf.pages[14:max_page]), start=14):  # 15페이지부터 (0-indexed: 14)
+                page_texts[i] = as_page_text(page.extract_text())
     except Exception:
-        pass
+        return []
+    
+    return _extract_heungkuk_surgery_grade_detail_from_texts(page_texts)
+
+
+def _extract_heungkuk_surgery_grade_detail_from_texts(page_texts):
+    """흥국생명 1~5종 재해수술 종별 금액 — 미리 추출된 텍스트 사용 (15~30페이지)"""
+    grade_results = []
+    for text in page_texts[14:30]:
+        text = text or ""
+        
+        # '1~5종재해수술' 상세 설명이 있는 페이지
+        if '재해수술' not in text or '수술분류표' not in text:
+            continue
+        
+        # 패턴: X종 YY만원 (연속으로 1~5종)
+        grade_amounts = re.findall(r'(\d)종\s+(\d[\d,]*만원)', text)
+        if len(grade_amounts) >= 3:  # 최소 3종 이상 발견시
+            for grade_str, amount_str in grade_amounts:
+                grade = int(grade_str)
+                if 1 <= grade <= 5:
+                    amount = parse_amount(amount_str)
+                    if amount:
+                        name = f"[재해]{grade}종수술"
+                        grade_results.append(Coverage(name, amount))
+            if grade_results:
+                break  # 첫 발견 시 중단
     
     return grade_results
 
 
 def _extract_coverage_heungkuk_from_cache(page_texts, page_tables, pdf_path):
     """흥국생명 - 캐시된 테이블에서 추출 (parse_pdf_all_in_one 전용)"""
-    results = []
+    results = CoverageCollector()
     
     # 1차: 캐시된 테이블에서 추출
     for page_idx in sorted(page_tables.keys()):
         tables = page_tables[page_idx]
         for table in tables:
             page_results = _parse_heungkuk_coverage_table(table)
-            for r in page_results:
-                if not any(existing["특약명"] == r["특약명"] for existing in results):
-                    results.append(r)
+            results.extend(page_results)
     
     # 2차: 테이블 추출 실패 시 텍스트 기반 보완
     if not results:
@@ -1106,18 +1359,14 @@ def _extract_coverage_heungkuk_from_cache(page_texts, page_tables, pdf_path):
             if not any(kw in text for kw in ['가입금액', '보험료', '보장내역']):
                 continue
             text_results = _parse_heungkuk_text(text)
-            for r in text_results:
-                if not any(existing["특약명"] == r["특약명"] for existing in results):
-                    results.append(r)
+            results.extend(text_results)
     
-    # 3차: 1~5종 재해수술 종별 세부금액 추출 (보장내용 상세 페이지에서)
-    if pdf_path:
+    # 3차: 1~5종 재해수술 종별 세부금액 추출 (보장내용 상세 페이지에서) — 시간 예산이 부족하면 생략
+    if pdf_path and _current_deadline().allow("surgery_detail", _OPTIONAL_STAGE_RESERVE_SEC):
         surgery_details = _extract_heungkuk_surgery_grade_detail(pdf_path)
-        for r in surgery_details:
-            if not any(existing["특약명"] == r["특약명"] for existing in results):
-                results.append(r)
+        results.extend(surgery_details)
     
-    return results
+    return results.items
 
 
 def _extract_coverage_heungkuk_limited(pdf_path):
@@ -1125,16 +1374,17 @@ def _extract_coverage_heungkuk_limited(pdf_path):
     
     보장 테이블은 보통 페이지 4~14에 위치.
     """
-    results = []
+    results = CoverageCollector()
+    section = _CoverageSectionTracker(close_on_total=True)
     with pdfplumber.open(pdf_path) as pdf:
-        max_page = min(len(pdf.pages), 15)
-        for i in range(3, max_page):  # 페이지 4부터 (0-indexed: 3)
-            page = pdf.pages[i]
+        for page_num, page in enumerate(_iter_pages(pdf.pages[3:15]), start=3):  # 페이지 4부터 (0-indexed: 3)
             text = page.extract_text() or ""
             
             # 보장 관련 키워드가 있는 페이지만
             if not any(kw in text for kw in ['가입금액', '상품명', '보험료']):
                 continue
+            if section.skip(page_num, text):
+                break
             
             tables = page.extract_tables({
                 'vertical_strategy': 'lines',
@@ -1145,34 +1395,31 @@ def _extract_coverage_heungkuk_limited(pdf_path):
             
             for table in tables:
                 page_results = _parse_heungkuk_coverage_table(table)
-                for r in page_results:
-                    if not any(existing["특약명"] == r["특약명"] for existing in results):
-                        results.append(r)
+                results.extend(page_results)
             
             # 합계보험료가 나오면 이후 페이지는 약관이므로 중단
-            if '합계보험료' in text:
+            if section.feed(page_num, tables, text):
                 break
     
-    return results
+    return results.items
 
 
 def extract_coverage_heungkuk(pdf_path):
     """흥국생명 PDF 파싱 — 제한된 페이지만 처리 (호환 인터페이스)"""
-    results = _extract_coverage_heungkuk_limited(pdf_path)
+    results = CoverageCollector().extend(_extract_coverage_heungkuk_limited(pdf_path))
     
     # 1~5종 재해수술 종별 세부금액 추출 (보장내용 상세 페이지에서)
-    surgery_details = _extract_heungkuk_surgery_grade_detail(pdf_path)
-    for r in surgery_details:
-        if not any(existing["특약명"] == r["특약명"] for existing in results):
-            results.append(r)
+    if _current_deadline().allow("surgery_detail", _OPTIONAL_STAGE_RESERVE_SEC):
+        surgery_details = _extract_heungkuk_surgery_grade_detail(pdf_path)
+        results.extend(surgery_details)
     
-    return results
+    return results.items
 
 
 def _parse_heungkuk_text(text):
     """흥국생명 텍스트 기반 특약 추출 (테이블 추출 실패 시 보완)"""
-    results = []
-    lines = text.split('\n')
+    results = CoverageCollector()
+    lines = as_page_text(text).lines
     
     for i, line in enumerate(lines):
         line = line.strip()
@@ -1198,10 +1445,9 @@ def _parse_heungkuk_text(text):
                     "계약자", "피보험자", "상령일"
                 ]
                 if not any(sk in name_nospace for sk in skip_words):
-                    if not any(r["특약명"] == name for r in results):
-                        results.append({"특약명": name, "가입금액": amount})
+                    results.add(name, amount)
     
-    return results
+    return results.items
 
 
 # ══════════════════════════════════════════════
@@ -1219,10 +1465,10 @@ def extract_coverage_shinhan(page_texts_fast):
     예: 항암방사선치료특약 가입금액 30,000만원, 대표지급금액 3,000만원
         → 정답은 3,000만원 (대표지급금액)
     """
-    results = []
+    results = CoverageCollector()
     found_premium_total = False
     
-    for text in page_texts_fast:
+    for text in as_page_texts(page_texts_fast):
         if not text:
             continue
         # 보험료 합계가 나오면 특약 목록 종료
@@ -1233,10 +1479,10 @@ def extract_coverage_shinhan(page_texts_fast):
             if '[1]' not in text and '[2]' not in text:
                 continue
         
-        if '보험료 합계' in text or '보험료합계' in text.replace(' ', ''):
+        if '보험료 합계' in text or '보험료합계' in text.nospace:
             found_premium_total = True
         
-        lines = text.split('\n')
+        lines = text.lines
         i = 0
         while i < len(lines):
             line = lines[i].strip()
@@ -1280,29 +1526,15 @@ def extract_coverage_shinhan(page_texts_fast):
                 if len(amounts) >= 2:
                     # 가입금액[0], 대표지급금액[1] → 대표지급금액 사용
                     representative_amount = amounts[1] * 10000  # 만원 → 원
-                    results.append({
-                        "특약명": name_part.strip(),
-                        "가입금액": representative_amount
-                    })
+                    results.add(name_part.strip(), representative_amount)
                 elif len(amounts) == 1:
-                    results.append({
-                        "특약명": name_part.strip(),
-                        "가입금액": amounts[0] * 10000
-                    })
+                    results.add(name_part.strip(), amounts[0] * 10000)
                 
                 i = j
                 continue
             i += 1
     
-    # 중복 제거
-    seen = set()
-    unique_results = []
-    for r in results:
-        if r["특약명"] not in seen:
-            seen.add(r["특약명"])
-            unique_results.append(r)
-    
-    return unique_results
+    return results.items
 
 
 # ══════════════════════════════════════════════
@@ -1324,10 +1556,10 @@ def extract_coverage_lina(page_texts_fast):
     
     보장내역 상세 페이지에서 1-5종 수술 종별 금액도 추출.
     """
-    results = []
+    results = CoverageCollector()
     found_premium_total = False
     
-    for text in page_texts_fast:
+    for text in as_page_texts(page_texts_fast):
         if not text:
             continue
         if found_premium_total:
@@ -1340,7 +1572,7 @@ def extract_coverage_lina(page_texts_fast):
         if '납입보험료' in text:
             found_premium_total = True
         
-        lines = text.split('\n')
+        lines = text.lines
         i = 0
         while i < len(lines):
             line = lines[i].strip()
@@ -1391,29 +1623,16 @@ def extract_coverage_lina(page_texts_fast):
                         i += 1
                 
                 if full_name and amount:
-                    results.append({
-                        '특약명': full_name,
-                        '가입금액': amount * 10000  # 만원 → 원
-                    })
+                    results.add(full_name, amount * 10000)  # 만원 → 원
                 continue
             
             i += 1
     
     # 보장내역 상세 페이지에서 1-5종 수술 종별 금액 추출
     surgery_results = _extract_lina_surgery_grade_detail(page_texts_fast)
-    for r in surgery_results:
-        if not any(existing['특약명'] == r['특약명'] for existing in results):
-            results.append(r)
-    
-    # 중복 제거
-    seen = set()
-    unique_results = []
-    for r in results:
-        if r['특약명'] not in seen:
-            seen.add(r['특약명'])
-            unique_results.append(r)
+    results.extend(surgery_results)
     
-    return unique_results
+    return results.items
 
 
 def _extract_lina_surgery_grade_detail(page_texts_fast):
@@ -1431,13 +1650,13 @@ def _extract_lina_surgery_grade_detail(page_texts_fast):
     """
     grade_totals = {}  # {grade: total_amount}
     
-    for text in page_texts_fast:
+    for text in as_page_texts(page_texts_fast):
         if not text:
             continue
         if '수술급여금' not in text or '1종' not in text:
             continue
         
-        lines = text.split('\n')
+        lines = text.lines
         in_surgery_section = False
         surgery_name = ""
         
@@ -1480,14 +1699,19 @@ def _extract_lina_surgery_grade_detail(page_texts_fast):
     
     results = []
     for grade in sorted(grade_totals.keys()):
-        results.append({
-            '특약명': f'[수술]{grade}종수술',
-            '가입금액': grade_totals[grade]
-        })
+        results.append(Coverage(f'[수술]{grade}종수술', grade_totals[grade]))
     
     return results
 
 
+def _parse_meritz_amount(text):
+    """메리츠 가입금액 파싱 (예: '1천만원' -> 1000, '20만원' -> 20, '1억원' -> 10000)
+    단위: 만원 반환 — 억/만 단위가 없는 금액('1천원' 보험료납입지원금 등)은 무시
+    """
+    amount = parse_korean_amount(text.replace(' ', ''), scaled=True)
+    return amount // 10000 if amount else None
+
+
 def extract_coverage_meritz(page_texts_fast):
     """메리츠화재 PDF 파싱 — PyMuPDF 텍스트 기반
     
@@ -1500,75 +1724,9 @@ def extract_coverage_meritz(page_texts_fast):
     
     세부보장 하위 항목은 ┗ 로 시작.
     """
-    results = []
-    
-    amount_pattern = re.compile(
-        r'^(\d[\d,]*)([억만천백])([\d,]*)([만천]?)원?$'
-    )
-    
-    def parse_meritz_amount(text):
-        """메리츠 가입금액 파싱 (예: '1천만원' -> 1000, '20만원' -> 20, '1억원' -> 10000)
-        단위: 만원 반환
-        """
-        text = text.replace(' ', '').replace(',', '')
-        if text in ['안내참조', '세부보장참조', '세부보장', '참조']:
-            return None
-        
-        # "간병인지원" 등 금액이 아닌 텍스트
-        if not any(c.isdigit() for c in text):
-            return None
-        
-        # "1억원", "1억5천만원" 등
-        m = re.match(r'^(\d+)억(\d*)([천만]?)(\d*)([만]?)원?$', text)
-        if m:
-            total = int(m.group(1)) * 10000
-            if m.group(2):
-                sub_num = int(m.group(2))
-                sub_unit = m.group(3)
-                if sub_unit == '천':
-                    total += sub_num * 1000
-                    if m.group(4):
-                        total += int(m.group(4))
-                elif sub_unit == '만':
-                    total += sub_num
-                else:
-                    total += sub_num
-            return total
-        
-        # "1천만원", "5천만원"
-        m = re.match(r'^(\d+)천(\d*)만원?$', text)
-        if m:
-            total = int(m.group(1)) * 1000
-            if m.group(2):
-                total += int(m.group(2))
-            return total
-        
-        # "5백만원", "1백50만원"
-        m = re.match(r'^(\d+)백(\d*)만원?$', text)
-        if m:
-            total = int(m.group(1)) * 100
-            if m.group(2):
-                total += int(m.group(2))
-            return total
-
-        # "20만원", "3만원"
-        m = re.match(r'^(\d+)만원?$', text)
-        if m:
-            return int(m.group(1))
-        
-        # "1천원" (보험료납입지원금 등 — 무시)
-        m = re.match(r'^(\d+)천원?$', text)
-        if m:
-            return None  # 1000원 미만은 무시
-        
-        # "1백만원" without 만 → skip
-        m = re.match(r'^(\d+)백원?$', text)
-        if m:
-            return None
-        
-        return None
+    results = CoverageCollector()
     
-    for text in page_texts_fast:
+    for text in as_page_texts(page_texts_fast):
         if not text:
             continue
         
@@ -1590,7 +1748,7 @@ def extract_coverage_meritz(page_texts_fast):
         if '가입담보 및 보장내용' in text and '가입담보리스트' not in text:
             continue
         
-        lines = text.split('\n')
+        lines = text.lines
         i = 0
         while i < len(lines):
             line = lines[i].strip()
@@ -1660,7 +1818,7 @@ def extract_coverage_meritz(page_texts_fast):
                         else:
                             continue
                     
-                    amount = parse_meritz_amount(amount_text)
+                    amount = _parse_meritz_amount(amount_text)
                     if amount is not None and amount > 0:
                         # "갱신형" 접두사 제거하여 정규화
                         clean_name = name
@@ -1670,184 +1828,1006 @@ def extract_coverage_meritz(page_texts_fast):
                         clean_name = re.sub(r'^┗\s*', '', clean_name).strip()
                         
                         # 만원 → 원 단위 변환 (다른 보험사 파서와 통일)
-                        results.append({"특약명": clean_name, "가입금액": amount * 10000})
+                        results.add(clean_name, amount * 10000)
                     
                     i += 1
                     continue
             
             i += 1
     
-    # 중복 제거 (같은 특약명이면 첫 번째만 유지)
-    seen = set()
-    unique_results = []
-    for r in results:
-        key = r["특약명"]
-        if key not in seen:
-            seen.add(key)
-            unique_results.append(r)
-    return unique_results
-
-
-def parse_pdf_all_in_one(pdf_path):
+    return results.items
+
+
+# ══════════════════════════════════════════════
+# 레이아웃 지문 캐시 (같은 보험사·상품 양식 재사용)
+# ══════════════════════════════════════════════
+# 같은 보험사/상품의 가입제안서는 양식이 동일해서 보장 테이블이
+# 항상 같은 페이지, 같은 위치(bbox)에 있다. 첫 PDF에서 찾은 테이블 위치를
+# 지문별로 기억해 두고, 다음 PDF부터는 해당 영역만 crop해서 테이블을 추출한다.
+# 특약 수가 달라 보장 테이블이 캐시에 없는 페이지로 이어지면 그 행이 빠지므로,
+#   - 키워드 페이지 집합이 캐시할 때와 다르면 적중으로 쓰지 않고 (전체 스캔)
+#   - 마지막 테이블이 페이지 하단까지 닿아 다음 페이지로 이어질 수 있는 양식은 캐시하지 않는다.
+
+_TABLE_SETTINGS_LINES = {
+    'vertical_strategy': 'lines',
+    'horizontal_strategy': 'lines',
+    'snap_tolerance': 5,
+    'join_tolerance': 5,
+}
+_TABLE_SETTINGS_TEXT = {
+    'vertical_strategy': 'text',
+    'horizontal_strategy': 'text',
+}
+
+_LAYOUT_CACHE_MAX = 256
+_LAYOUT_CROP_MARGIN = 6      # bbox 여백 (pt)
+_LAYOUT_BOTTOM_MARGIN = 36   # 테이블 하단이 페이지 끝에서 이 안쪽이면 다음 페이지로 이어질 수 있음 (pt)
+_layout_cache = OrderedDict()  # {fingerprint: (keyword_pages, {page_index: [bbox, ...]})}
+_layout_cache_lock = threading.Lock()
+_layout_cache_counts = {"hits": 0, "misses": 0, "rejected": 0}
+
+_LAYOUT_HEADER_KEYWORDS = ('가입금액', '담보명', '특약명', '보장명', '상품명')
+
+
+def _layout_fingerprint(insurer_code, product_name, page_texts_fast):
+    """보험사코드 + 상품명 + 페이지 수 + 헤더 위치로 양식 지문 생성
+
+    헤더 위치는 앞 3페이지에서 헤더 키워드가 처음 나오는 줄 번호.
+    보험사/상품명을 모르면 지문을 만들지 않는다 (None).
+    """
+    if not insurer_code or not product_name or product_name == "상품명 미확인":
+        return None
+    header_positions = []
+    for page_idx, text in enumerate(page_texts_fast[:3]):
+        if not text:
+            continue
+        for line_idx, line in enumerate(as_page_text(text).lines):
+            if any(kw in line for kw in _LAYOUT_HEADER_KEYWORDS):
+                header_positions.append((page_idx, line_idx))
+                break
+    return (insurer_code, product_name, len(page_texts_fast), tuple(header_positions))
+
+
+def _layout_keyword_pages(page_texts_fast, coverage_keywords):
+    """테이블 후보 페이지 (앞 20페이지 중 특약 키워드가 있는 페이지)"""
+    return frozenset(
+        i for i, text in enumerate(page_texts_fast[:20])
+        if text and any(kw in text for kw in coverage_keywords)
+    )
+
+
+def _layout_cache_get(fingerprint, keyword_pages):
+    """캐시된 테이블 영역 — 키워드 페이지 집합이 캐시할 때와 다르면 None (rejected)"""
+    if fingerprint is None:
+        return None
+    with _layout_cache_lock:
+        entry = _layout_cache.get(fingerprint)
+        if entry is None:
+            result = "misses"
+        elif entry[0] != keyword_pages:
+            result = "rejected"
+        else:
+            result = "hits"
+            _layout_cache.move_to_end(fingerprint)
+        _layout_cache_counts[result] += 1
+    _count("layout_cache_hit" if result == "hits" else "layout_cache_miss")
+    return entry[1] if result == "hits" else None
+
+
+def layout_cache_stats():
+    """테이블 영역(레이아웃) 캐시 hit/miss 집계 (프로세스 누적)"""
+    with _layout_cache_lock:
+        return {**_layout_cache_counts, "entries": len(_layout_cache)}
+
+
+def _regions_reach_page_bottom(regions, page_heights):
+    """마지막 테이블 영역이 페이지 하단까지 닿고 다음 페이지가 있는지 (테이블이 이어질 수 있음)
+
+    page_heights는 PyMuPDF 텍스트 추출 때 모아 둔 페이지 높이 (PDF 재오픈 안 함).
+    """
+    last_page = max(regions)
+    if last_page + 1 >= len(page_heights):
+        return False
+    bottom = max(bbox[3] for bbox in regions[last_page])
+    return bottom >= page_heights[last_page] - _LAYOUT_BOTTOM_MARGIN
+
+
+def _layout_cache_put(fingerprint, regions, keyword_pages, page_heights):
+    if fingerprint is None or not regions:
+        return
+    if _regions_reach_page_bottom(regions, page_heights):
+        return
+    with _layout_cache_lock:
+        _layout_cache[fingerprint] = (keyword_pages, regions)
+        _layout_cache.move_to_end(fingerprint)
+        while len(_layout_cache) > _LAYOUT_CACHE_MAX:
+            _layout_cache.popitem(last=False)
+
+
+def _layout_cache_discard(fingerprint):
+    if fingerprint is None:
+        return
+    with _layout_cache_lock:
+        _layout_cache.pop(fingerprint, None)
+
+
+def _crop_region(page, bbox):
+    """캐시된 bbox를 페이지 경계 안으로 보정해서 crop
+
+    리더 수가 늘면 테이블이 아래로 길어지므로 하단은 페이지 끝까지 연다.
+    """
+    x0, top, x1, _ = bbox
+    px0, ptop, px1, pbottom = page.bbox
+    return page.crop((
+        max(px0, x0 - _LAYOUT_CROP_MARGIN),
+        max(ptop, top - _LAYOUT_CROP_MARGIN),
+        min(px1, x1 + _LAYOUT_CROP_MARGIN),
+        pbottom,
+    ))
+
+
+def _find_page_tables(page):
+    """pdfplumber 테이블 추출 (lines → text 전략 순) — (테이블 목록, bbox 목록) 반환"""
+    found = page.find_tables(_TABLE_SETTINGS_LINES)
+    if not found:
+        found = page.find_tables(_TABLE_SETTINGS_TEXT)
+    return [t.extract() for t in found], [t.bbox for t in found]
+
+
+def _has_amount_header(table):
+    """테이블 앞부분에 가입금액 헤더가 있는지 (캐시 영역 검증용)"""
+    for row in table[:6]:
+        for cell in row:
+            if cell and '가입금액' in cell.replace(" ", "").replace("\n", ""):
+                return True
+    return False
+
+
+# ── 보장 섹션 종료 감지 (테이블 기반 경로 공통) ──
+# 보장 테이블(가입금액/보장금액 헤더)이 나온 뒤 다음 중 하나면 이후 페이지는
+# 테이블 추출·파싱을 하지 않는다.
+#   - 약관 제목 페이지 (보통약관/특별약관/제1관으로 시작)
+#   - 보험료 합계(행 또는 문구)가 나온 뒤 금액 셀이 없는 페이지
+#   - 금액 셀이 없는 페이지가 _SECTION_END_EMPTY_PAGES개 연속
+# 피보험자가 여럿이면 합계 행이 섹션마다 나오므로 합계만으로는 끝내지 않는다.
+_SECTION_END_EMPTY_PAGES = 3
+_SECTION_HEADER_AMOUNT_KEYWORDS = ('가입금액', '보장금액')
+_PREMIUM_TOTAL_KEYWORDS = ('합계보험료', '보험료합계', '총보험료')
+_TERMS_HEADING_RE = re.compile(r'^(?:보통약관|특별약관|제\s*1\s*관)(?:\s|$)')
+
+
+def _is_coverage_table(table):
+    """보장 테이블인지 (앞 6행에 가입금액/보장금액 헤더)"""
+    for row in table[:6]:
+        for cell in row:
+            if cell and any(kw in cell.replace(" ", "").replace("\n", "") for kw in _SECTION_HEADER_AMOUNT_KEYWORDS):
+                return True
+    return False
+
+
+def _has_amount_cells(table):
+    """억/만 단위 금액 셀이 하나라도 있는지"""
+    return any(cell and find_korean_amount(cell) for row in table for cell in row)
+
+
+def _is_premium_total_row(row):
+    """보험료 합계 행인지 (앞 2개 셀 기준)"""
+    for cell in row[:2]:
+        if not cell:
+            continue
+        label = cell.replace(" ", "").replace("\n", "")
+        if label == "합계" or any(kw in label for kw in _PREMIUM_TOTAL_KEYWORDS):
+            return True
+    return False
+
+
+class _CoverageSectionTracker:
+    """페이지 순서대로 테이블을 받아 보장 섹션(특약 목록)이 끝났는지 판단
+
+    skip(): 테이블 추출 전 — 섹션이 이미 끝났거나 약관 제목 페이지면 True (건너뛴 페이지 기록)
+    feed(): 테이블 추출 후 — 이 페이지를 마지막으로 섹션이 끝나면 True
+    페이지 텍스트는 page_texts(PyMuPDF 텍스트)에서 찾고, 없으면 호출 시 넘긴 텍스트를 쓴다.
+    close_on_total=True면 보험료 합계가 나온 페이지에서 바로 끝낸다 (흥국생명 기존 동작).
+    """
+
+    def __init__(self, page_texts=None, close_on_total=False):
+        self.page_texts = page_texts if page_texts is not None else ()
+        self.close_on_total = close_on_total
+        self.started = False
+        self.total_seen = False
+        self.empty_run = 0
+        self.ended = False
+        self.skipped_pages = set()
+
+    def _text(self, page_index, page_text):
+        if page_text is None and page_index < len(self.page_texts):
+            page_text = self.page_texts[page_index]
+        return as_page_text(page_text)
+
+    def skip(self, page_index, page_text=None):
+        if not self.ended and self.started:
+            head = self._text(page_index, page_text).stripped_lines[:3]
+            if any(_TERMS_HEADING_RE.match(line) for line in head):
+                self.ended = True
+        if self.ended:
+            self.skipped_pages.add(page_index)
+        return self.ended
+
+    def feed(self, page_index, tables, page_text=None):
+        if self.ended:
+            return True
+        tables = [t for t in tables if t]
+        total_text = any(kw in self._text(page_index, page_text).nospace for kw in _PREMIUM_TOTAL_KEYWORDS)
+        if self.close_on_total and total_text:
+            self.ended = True
+            return True
+        has_total = total_text or any(_is_premium_total_row(row) for t in tables for row in t)
+        if any(_is_coverage_table(t) for t in tables):
+            self.started = True
+        if not self.started:
+            return False
+        if any(_has_amount_cells(t) for t in tables):
+            self.empty_run = 0
+            self.total_seen = self.total_seen or has_total
+        else:
+            self.empty_run += 1
+            if self.total_seen or self.empty_run >= _SECTION_END_EMPTY_PAGES:
+                self.ended = True
+            self.total_seen = self.total_seen or has_total
+        return self.ended
+
+
+def _extract_pdfplumber_pages(pdf_path, text_pages, table_pages, table_regions=None, section=None):
+    """pdfplumber로 필요한 페이지만 열어서 텍스트/테이블 추출
+
+    table_regions가 주어지면 (레이아웃 캐시 적중) 해당 bbox 영역만 crop해서
+    테이블을 찾는다. 캐시 영역에서 가입금액 헤더가 안 나오면 검증 실패(None 반환).
+    section(_CoverageSectionTracker)이 주어지면 보장 섹션이 끝난 뒤 페이지는 테이블 추출 생략.
+    시간 예산이 끝나면 그때까지 추출한 페이지만 반환한다.
+
+    Returns:
+        (page_texts, page_tables, found_regions) 또는 검증 실패 시 None
+    """
+    page_tables = {}
+    found_regions = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        page_texts = [EMPTY_PAGE] * len(pdf.pages)
+        indices = [i for i in sorted(set(text_pages) | set(table_pages)) if i < len(pdf.pages)]
+        for i, page in zip(indices, _iter_pages([pdf.pages[j] for j in indices], stage="tables")):
+
+            if i in text_pages:
+                page_texts[i] = as_page_text(page.extract_text())
+
+            if i not in table_pages:
+                continue
+            if section is not None and section.skip(i):
+                continue
+
+            if table_regions is not None:
+                tables = []
+                for bbox in table_regions.get(i, []):
+                    cropped_tables, _ = _find_page_tables(_crop_region(page, bbox))
+                    tables.extend(cropped_tables)
+                if not any(_has_amount_header(t) for t in tables if t):
+                    return None
+            else:
+                tables, bboxes = _find_page_tables(page)
+                regions = [
+                    bbox for table, bbox in zip(tables, bboxes)
+                    if table and _has_amount_header(table)
+                ]
+                if regions:
+                    found_regions[i] = regions
+                if section is not None:
+                    section.feed(i, tables)
+
+            if tables:
+                page_tables[i] = tables
+
+    return page_texts, page_tables, found_regions
+
+
+# ══════════════════════════════════════════════
+# 파이프라인 모드 (PyMuPDF 텍스트 ↔ pdfplumber 테이블 동시 진행)
+# ══════════════════════════════════════════════
+# 순차 모드는 PyMuPDF 전체 텍스트 추출이 끝나야 pdfplumber를 연다.
+# 파이프라인 모드는 PyMuPDF가 뒷 페이지를 읽는 동안 앞쪽 후보 페이지의
+# pdfplumber 테이블 추출을 시작해서 PDF당 지연을 max(빠른 단계, 느린 단계)에 가깝게 만든다.
+
+PDF_PIPELINE_DEFAULT = os.environ.get("PDF_PIPELINE", "0") == "1"
+_PIPELINE_QUEUE_SIZE = 4     # 후보 페이지 큐 크기 (생산자 역압)
+_PIPELINE_MAX_PAGE = 20      # 테이블 후보는 앞 20페이지까지 (뒷 페이지는 약관)
+
+
+def _streams_pdfplumber_tables(insurer_code):
+    """파이프라인에서 pdfplumber 테이블을 미리 뽑아 둘 보험사인지 (텍스트/레이아웃 전용 보험사 제외)"""
+    return insurer_code not in _NO_TABLE_INSURERS and insurer_code not in _LAYOUT_TEXT_INSURERS
+
+
+# ══════════════════════════════════════════════
+# 보일러플레이트 페이지 인덱스 (약관/안내 페이지 테이블 추출 생략)
+# ══════════════════════════════════════════════
+# 범용 테이블 파서 보험사(_streams_pdfplumber_tables)만 대상 — 범용 파서는 테이블마다
+# 독립적으로 헤더를 찾기 때문에 페이지 단독으로 특약이 안 나오면 전체 결과에도 기여하지 않는다.
+
+_boilerplate_index = BoilerplateIndex()
+
+
+def boilerplate_stats():
+    """보일러플레이트 인덱스 hit/miss 집계 (프로세스 누적)"""
+    return _boilerplate_index.stats()
+
+
+def _learn_boilerplate_pages(insurer_code, page_texts_fast, scanned_pages, page_tables):
+    """특약 추출 성공 후 테이블을 뽑아 본 페이지별로 특약이 나왔는지 인덱스에 기록"""
+    if not _streams_pdfplumber_tables(insurer_code) or not page_texts_fast:
+        return
+    empty_pages, coverage_pages = [], []
+    for i in scanned_pages:
+        if _extract_coverage_generic_from_cache([], {i: page_tables.get(i, [])}, None):
+            coverage_pages.append(i)
+        else:
+            empty_pages.append(i)
+    _boilerplate_index.observe(page_texts_fast, empty_pages, coverage_pages)
+
+
+def _pymupdf_pipelined_extract(pdf_path, coverage_keywords, timeout_sec=15):
+    """PyMuPDF 텍스트 추출(생산자 스레드)과 pdfplumber 테이블 추출(현재 스레드)을 겹쳐 실행
+
+    생산자는 앞 3페이지로 보험사를 판정한 뒤, 테이블이 필요한 보험사면
+    키워드 페이지 번호를 크기 제한 큐로 흘려보낸다. PDF 메타데이터와 첫 페이지로
+    잠정 판정이 되면 3페이지를 기다리지 않고 첫 페이지부터 보낸다. 소비자는 받는 즉시
+    pdfplumber로 해당 페이지 테이블을 추출한다. 보일러플레이트로 확정된 페이지는 보내지 않고,
+    보장 섹션이 끝나거나(_CoverageSectionTracker) 시간 예산이 끝나면 남은 페이지는 받기만 하고
+    추출하지 않는다. PyMuPDF 타임아웃은 생산자가 진행하지 못한 시간(마지막 페이지 추출/전송 이후)
+    기준이며 timeout_sec과 남은 예산 중 작은 값 — 소비자의 테이블 추출로 큐가 막힌 시간은 세지 않는다.
+    소비자가 끝나면(예외 포함) 생산자도 멈춘다.
+
+    Returns:
+        (page_texts_fast, page_heights, page_tables, found_regions, scanned_pages, skipped_pages)
+        scanned_pages는 실제로 테이블을 추출한 페이지, skipped_pages는 보일러플레이트로 제외한 페이지.
+        PyMuPDF 타임아웃/오류 시 None
+    """
+    pages_q = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+    texts = []
+    heights = []
+    streamed_pages = []
+    skipped_pages = []
+    error_container = [None]
+    done = object()
+    stop = threading.Event()
+    last_progress = [time.monotonic()]  # 생산자가 마지막으로 페이지를 추출/전송한 시각
+
+    def _put(item):
+        """큐가 비기를 기다리며 전송 (소비자가 멈추면 False)"""
+        while not stop.is_set():
+            try:
+                pages_q.put(item, timeout=0.1)
+                last_progress[0] = time.monotonic()
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producer():
+        try:
+            doc = _fitz.open(pdf_path)
+            streaming = None     # None: 보험사 판정 전, True/False: 테이블 후보 전송 여부
+            provisional = False  # 메타데이터+첫 페이지 잠정 판정으로 미리 전송할지
+            pending = []
+            for i, page in enumerate(doc):
+                if stop.is_set():
+                    break
+                text = as_page_text(page.get_text())
+                texts.append(text)
+                heights.append(page.rect.height)
+                last_progress[0] = time.monotonic()
+                if i < _PIPELINE_MAX_PAGE and any(kw in text for kw in coverage_keywords):
+                    pending.append(i)
+                if i == 0:
+                    early_code = _detect_insurer_provisional(doc, text)
+                    provisional = early_code is not None and _streams_pdfplumber_tables(early_code)
+                if streaming is None and (i >= 2 or i == len(doc) - 1):
+                    streaming = _streams_pdfplumber_tables(
+                        _detect_insurer_from_text(join_pages(texts[:3]))
+                    )
+                if streaming or (streaming is None and provisional):
+                    known = _boilerplate_index.known_pages(texts, pending) if pending else set()
+                    for page_idx in pending:
+                        if page_idx in known:
+                            skipped_pages.append(page_idx)
+                            continue
+                        streamed_pages.append(page_idx)
+                        if not _put(page_idx):
+                            break
+                    pending = []
+                elif streaming is not None:
+                    pending = []
+            doc.close()
+        except Exception as e:
+            error_container[0] = e
+        finally:
+            _put(done)
+
+    deadline = _current_deadline()
+    timeout_sec = deadline.timeout(timeout_sec)
+    t = threading.Thread(target=_producer, daemon=True)
+    t.start()
+
+    page_tables = {}
+    found_regions = {}
+    section = _CoverageSectionTracker(texts)
+    unscanned_pages = set()  # 시간 예산 소진으로 추출하지 못한 페이지
+    pdf = None
+    try:
+        while True:
+            try:
+                item = pages_q.get(timeout=1.0)
+            except queue.Empty:
+                if time.monotonic() - last_progress[0] > timeout_sec or deadline.expired():
+                    print(f"[WARN] PyMuPDF timed out ({timeout_sec:.1f}s) for {pdf_path}, falling back to pdfplumber")
+                    deadline.allow("pymupdf")
+                    _count("pymupdf_fallbacks")
+                    return None
+                continue
+            if item is done:
+                break
+            if section.skip(item):
+                continue
+            if not deadline.allow("tables"):
+                unscanned_pages.add(item)
+                continue
+            if pdf is None:
+                pdf = pdfplumber.open(pdf_path)
+            if item >= len(pdf.pages):
+                continue
+            page = pdf.pages[item]
+            _count("pages_pdfplumber")
+            tables, bboxes = _find_page_tables(page)
+            _release_page(page)
+            section.feed(item, tables)
+            if tables:
+                page_tables[item] = tables
+            regions = [bbox for table, bbox in zip(tables, bboxes) if table and _has_amount_header(table)]
+            if regions:
+                found_regions[item] = regions
+    finally:
+        stop.set()
+        if pdf is not None:
+            pdf.close()
+
+    if error_container[0]:
+        print(f"[WARN] PyMuPDF error: {error_container[0]}, falling back to pdfplumber")
+        _count("pymupdf_fallbacks")
+        return None
+    _count("pages_pymupdf", len(texts))
+    scanned_pages = [
+        i for i in streamed_pages if i not in section.skipped_pages and i not in unscanned_pages
+    ]
+    return texts, heights, page_tables, found_regions, scanned_pages, skipped_pages
+
+
+def _extract_coverages_by_insurer(insurer_code, page_texts_fast, page_texts, page_tables, pdf_path):
+    """보험사별 특약 추출 분기"""
+    if insurer_code == "shinhan":
+        # 신한라이프: PyMuPDF 텍스트 기반 전용 파서 (대표지급금액 사용)
+        return extract_coverage_shinhan(page_texts_fast)
+    if insurer_code == "lina":
+        # 라이나생명: PyMuPDF 텍스트 기반 전용 파서
+        return extract_coverage_lina(page_texts_fast)
+    if insurer_code == "meritz":
+        # 메리츠화재: PyMuPDF 텍스트 기반 전용 파서
+        return extract_coverage_meritz(page_texts_fast)
+    if insurer_code == "samsung_life":
+        return _extract_coverage_samsung_from_texts(page_texts, pdf_path)
+    if insurer_code == "mirae":
+        if HAS_PYMUPDF and page_texts_fast:
+            return _extract_coverage_mirae_fast(pdf_path, page_texts_fast)
+        return extract_coverage_mirae(pdf_path)
+    if insurer_code == "kb":
+        return _extract_coverage_kb_from_texts(
+            # KB 파서는 page_texts 리스트 필요 — pdfplumber 텍스트 사용
+            page_texts if any(page_texts) else page_texts_fast, pdf_path
+        )
+    if insurer_code == "heungkuk":
+        # 흥국생명 전용 파서 — 테이블 기반 (실제 PDF 구조에 맞춤)
+        coverages = _extract_coverage_heungkuk_from_cache(
+            page_texts if any(page_texts) else page_texts_fast,
+            page_tables, pdf_path
+        )
+        # 캐시 결과 없으면 pdfplumber로 페이지 5~14만 처리 (전체 PDF 재오픈 금지)
+        if not coverages and _current_deadline().allow("pdfplumber_fallback", _OPTIONAL_STAGE_RESERVE_SEC):
+            coverages = _extract_coverage_heungkuk_limited(pdf_path)
+        return coverages
+    # 범용 파서 — 테이블 캐시 사용 (PDF 재오픈 안 함)
+    return _extract_coverage_generic_from_cache(page_texts, page_tables, pdf_path)
+
+
+# 테이블이 필요 없는 보험사 (텍스트 전용 파서) — 단어 좌표 테이블 복원 대상 아님
+_NO_TABLE_INSURERS = ("shinhan", "lina", "meritz", "mirae", "kb", "samsung_life")
+
+# 단어 좌표 테이블 경로는 보험사별 pdfplumber 결과와의 동등성이 확인되기 전까지 옵트인
+# (PDF_WORD_TABLES=1). 꺼져 있으면 기존 pdfplumber 테이블 경로만 사용.
+PDF_WORD_TABLES = os.environ.get("PDF_WORD_TABLES", "0") == "1"
+
+
+def _use_word_tables(insurer_code):
+    """단어 좌표 테이블 경로 사용 여부 (NumPy + 옵트인 + 테이블 기반 보험사)"""
+    return HAS_WORD_TABLES and PDF_WORD_TABLES and insurer_code not in _NO_TABLE_INSURERS
+
+
+def _pymupdf_extract_word_tables_safe(pdf_path, page_indices, regions=None, timeout_sec=15, section=None):
+    """PyMuPDF 단어 좌표로 테이블 복원 (지정 페이지만, 페이지 번호 순)
+
+    regions(레이아웃 캐시)가 주어지면 해당 bbox 영역 단어만 사용 (하단은 페이지 끝까지).
+    section(_CoverageSectionTracker)이 주어지면 보장 섹션이 끝난 뒤 페이지는 건너뛴다.
+
+    Returns:
+        {page_index: [(rows, bbox), ...]} 또는 타임아웃/오류 시 None
+    """
+    def _page_tables(page):
+        if section is not None and section.skip(page.number):
+            return []
+        found = []
+        for bbox in (regions.get(page.number, []) if regions else [None]):
+            clip = None
+            if bbox is not None:
+                clip = _fitz.Rect(
+                    bbox[0] - _LAYOUT_CROP_MARGIN, bbox[1] - _LAYOUT_CROP_MARGIN,
+                    bbox[2] + _LAYOUT_CROP_MARGIN, page.rect.y1,
+                ) & page.rect
+            found.extend(find_word_tables(page.get_text("words", clip=clip)))
+        if section is not None:
+            section.feed(page.number, [rows for rows, _ in found])
+        return found
+
+    results = _pymupdf_run_safe(pdf_path, _page_tables, page_indices=page_indices, timeout_sec=timeout_sec)
+    if results is None:
+        return None
+    return {i: results[i] for i in sorted(page_indices) if i < len(results) and results[i]}
+
+
+def _extract_coverages_from_word_tables(insurer_code, pdf_path, page_texts_fast, word_tables):
+    """단어 좌표로 복원한 테이블로 특약 추출 (pdfplumber 미사용)
+
+    Returns:
+        (coverages, found_regions) — found_regions는 가입금액 헤더가 있는 테이블 bbox.
+        가입금액 헤더 테이블이 하나도 없으면 복원 실패로 보고 ([], {}) — pdfplumber로 폴백
+    """
+    page_tables = {i: [rows for rows, _ in found] for i, found in word_tables.items()}
+    found_regions = {}
+    for i, found in word_tables.items():
+        regions = [bbox for rows, bbox in found if _has_amount_header(rows)]
+        if regions:
+            found_regions[i] = regions
+    if not found_regions:
+        return [], {}
+
+    if insurer_code == "heungkuk":
+        collector = CoverageCollector()
+        for page_idx in sorted(page_tables):
+            for table in page_tables[page_idx]:
+                collector.extend(_parse_heungkuk_coverage_table(table))
+        if collector and _current_deadline().allow("surgery_detail"):
+            surgery_pages = _heungkuk_surgery_pages(page_texts_fast)
+            if surgery_pages:
+                layout_texts = _pymupdf_extract_layout_texts_safe(pdf_path, surgery_pages) or []
+                collector.extend(_extract_heungkuk_surgery_grade_detail_from_texts(layout_texts))
+        coverages = collector.items
+    else:
+        coverages = _extract_coverage_generic_from_cache([], page_tables, pdf_path)
+    return coverages, found_regions
+
+
+# PyMuPDF 레이아웃 텍스트만으로 파싱 가능한 보험사 (pdfplumber는 패리티 검사 실패 시에만)
+_LAYOUT_TEXT_INSURERS = ("kb", "samsung_life", "heungkuk")
+
+_HEUNGKUK_SECTION_PREFIX = re.compile(r'^(?:주계약|선택특약|필수특약|의무특약)\s+')
+_HEUNGKUK_LAYOUT_ROW = re.compile(r'^(.+?)\s+(\d[\d,]*만원)(?:\s|$)')
+_HEUNGKUK_TEXT_SKIP_WORDS = [
+    "합계보험료", "주보험", "납입면제",
+    "보장보험료", "적립보험료", "실납입보험료",
+    "계약자", "피보험자", "상령일"
+]
+
+
+def _extract_heungkuk_from_layout_texts(layout_texts, pages):
+    """흥국생명 — 레이아웃 텍스트 줄에서 특약 추출 + 패리티 검사
+
+    테이블 행이 '구분 특약명 가입금액 보험기간 ...' 한 줄로 복원되므로
+    구분 열(주계약/선택특약)만 떼고 가입금액(만원) 앞을 특약명으로 쓴다
+    (테이블 셀과 같은 이름 — (무) 접두사 유지). 금액이 있는 행 중 특약으로
+    추출되지 않은 행이 있으면 줄 복원이 어긋난 것으로 보고 None 반환.
+    """
+    results = CoverageCollector()
+    unparsed_rows = 0
+    for i in sorted(pages):
+        text = layout_texts[i]
+        for line in text.lines:
+            line = _HEUNGKUK_SECTION_PREFIX.sub('', line.strip())
+            match = _HEUNGKUK_LAYOUT_ROW.match(line)
+            if not match:
+                continue
+            name = match.group(1).strip()
+            if any(sk in name.replace(" ", "") for sk in _HEUNGKUK_TEXT_SKIP_WORDS):
+                continue
+            amount = parse_amount(match.group(2))
+            if len(name) < 4 or not amount:
+                unparsed_rows += 1
+                continue
+            results.add(name, amount)
+        # 합계보험료가 나오면 이후 페이지는 약관이므로 중단
+        if '합계보험료' in text:
+            break
+
+    if not results or unparsed_rows:
+        return None
+
+    results.extend(_extract_heungkuk_surgery_grade_detail_from_texts(layout_texts))
+    return results.items
+
+
+def _heungkuk_surgery_pages(page_texts_fast):
+    """흥국생명 재해수술 종별 상세 페이지 인덱스 (15~30페이지)"""
+    return {
+        i for i in range(14, min(30, len(page_texts_fast)))
+        if '재해수술' in page_texts_fast[i] and '수술분류표' in page_texts_fast[i]
+    }
+
+
+# 레이아웃 텍스트 패리티 검사용 — 금액 토큰(공백 제거 후)과 보장 행 시작
+_LAYOUT_AMOUNT_TOKEN = re.compile(r'\d[\d,]*(?:억|천만|백만|만|천)?원')
+_LAYOUT_ROW_START = {
+    "kb": re.compile(r'^\d{1,3}\s+\S'),
+    "samsung_life": re.compile(r'^\d{1,4}\s+\S'),
+    "heungkuk": _HEUNGKUK_SECTION_PREFIX,
+}
+
+
+def _layout_text_parity(insurer_code, page_texts_fast, layout_texts, pages):
+    """레이아웃 텍스트가 기본 텍스트와 같은 내용·행 구조인지 검사 (페이지별)
+
+      - 텍스트가 있는 페이지는 레이아웃 텍스트도 있어야 함
+      - 헤더 키워드 수, 금액 토큰 수가 기본 텍스트와 같아야 함 (단어 누락/중복 없음)
+      - 보장 행(번호/구분 열로 시작하는 줄)마다 금액 토큰은 1개 이하
+        (2개 이상이면 y_tolerance 안에서 두 행이 한 줄로 합쳐진 것)
+
+    Returns:
+        보장 행 수 (금액이 있는 행) — 검사 실패 시 None
+    """
+    row_start = _LAYOUT_ROW_START[insurer_code]
+    rows = 0
+    for i in pages:
+        fast, layout = page_texts_fast[i], layout_texts[i]
+        if not fast.strip():
+            continue
+        if not layout.strip():
+            return None
+        fast_compact = re.sub(r'\s+', '', fast)
+        layout_compact = re.sub(r'\s+', '', layout)
+        if any(fast_compact.count(kw) != layout_compact.count(kw) for kw in _LAYOUT_HEADER_KEYWORDS):
+            return None
+        if len(_LAYOUT_AMOUNT_TOKEN.findall(fast_compact)) != len(_LAYOUT_AMOUNT_TOKEN.findall(layout_compact)):
+            return None
+        for line in layout.lines:
+            line = line.strip()
+            if not row_start.match(line):
+                continue
+            amounts = len(_LAYOUT_AMOUNT_TOKEN.findall(line.replace(" ", "")))
+            if amounts > 1:
+                return None
+            rows += amounts
+    return rows
+
+
+def _extract_coverages_from_layout_texts(insurer_code, pdf_path, page_texts_fast):
+    """KB/삼성생명/흥국생명 — PyMuPDF 레이아웃 텍스트만으로 특약 추출
+
+    pdfplumber extract_text() 대신 PyMuPDF 단어 좌표로 줄을 복원해서
+    기존 파서에 그대로 넣는다. 패리티 검사(_layout_text_parity) 실패, 또는
+    추출된 특약이 금액 있는 보장 행 수보다 적으면 None → pdfplumber 경로.
+    """
+    n_pages = len(page_texts_fast)
+    surgery_pages = set()
+    if insurer_code == "kb":
+        pages = set(range(min(10, n_pages)))
+    elif insurer_code == "samsung_life":
+        pages = set(range(4, min(8, n_pages)))
+    elif insurer_code == "heungkuk":
+        pages = {
+            i for i in range(min(15, n_pages))
+            if any(kw in page_texts_fast[i] for kw in ['가입금액', '상품명', '보험료'])
+        }
+        if _current_deadline().allow("surgery_detail"):
+            surgery_pages = _heungkuk_surgery_pages(page_texts_fast)
+    else:
+        return None
+
+    if not pages:
+        return None
+    layout_texts = _pymupdf_extract_layout_texts_safe(pdf_path, pages | surgery_pages)
+    if layout_texts is None:
+        return None
+    expected_rows = _layout_text_parity(insurer_code, page_texts_fast, layout_texts, pages)
+    if expected_rows is None:
+        return None
+
+    if insurer_code == "kb":
+        coverages = _extract_coverage_kb_from_texts(layout_texts, pdf_path)
+    elif insurer_code == "samsung_life":
+        coverages = _extract_coverage_samsung_from_texts(layout_texts, pdf_path, table_fallback=False)
+    else:
+        coverages = _extract_heungkuk_from_layout_texts(layout_texts, pages)
+    if not coverages or len(coverages) < expected_rows:
+        return None
+    return coverages
+
+
+def parse_pdf_all_in_one(pdf_path, pipelined=None, deadline=None):
+    """PDF 파싱 — 메모리 예산 확보 후 실행하고 최대 RSS를 stats에 기록
+
+    동시 파싱의 예상 메모리 합계가 PDF_MEMORY_BUDGET_MB를 넘으면 대기열에서 기다린다.
+    deadline(Deadline)을 넘기면 요청 전체의 시간 예산을 공유하고 (PDF 여러 개), 없으면
+    PARSE_TIME_BUDGET_SEC 예산으로 새로 시작한다 (메모리 대기 시간 포함). 메모리 대기는
+    PDF_MEMORY_WAIT_SEC과 남은 예산 중 작은 값까지만 하고 넘으면 ParseOverloaded.
+    예산이 끝나면 남은 단계를 생략하고 지금까지의 결과를 partial=True로 반환한다.
+    """
+    deadline = deadline.child() if deadline is not None else Deadline()
+    reserved_mb = _estimate_parse_memory_mb(pdf_path)
+    wait_start = time.monotonic()
+    # 메모리 대기도 시간 예산 안에서만 (예산보다 오래 기다리면 파싱할 시간이 남지 않음)
+    reserved_mb = _memory_budget.acquire(reserved_mb, deadline.timeout(PDF_MEMORY_WAIT_SEC))
+    memory_wait_ms = (time.monotonic() - wait_start) * 1000
+    _rss_local.peak = _current_rss_mb() or 0.0
+    _deadline_local.deadline = deadline
+    _counters_local.counters = counters = {}
+    try:
+        result = _parse_pdf_all_in_one(pdf_path, pipelined)
+        _sample_rss()
+        result["partial"] = deadline.partial
+        result["stats"] = {
+            "peak_rss_mb": round(_rss_local.peak, 1),
+            "memory_reserved_mb": reserved_mb,
+            "memory_wait_ms": round(memory_wait_ms, 1),
+            "boilerplate_pages_skipped": result.pop("boilerplate_pages_skipped", 0),
+            "page_count": result.pop("page_count", 0),
+            "time_budget_sec": deadline.budget_sec,
+            "elapsed_ms": deadline.elapsed_ms(),
+            "timings": dict(deadline.timings),
+            "skipped_stages": list(deadline.skipped),
+            "pages_pymupdf": counters.get("pages_pymupdf", 0),
+            "pages_pdfplumber": counters.get("pages_pdfplumber", 0),
+            "pymupdf_fallbacks": counters.get("pymupdf_fallbacks", 0),
+            "layout_cache_hits": counters.get("layout_cache_hit", 0),
+            "layout_cache_misses": counters.get("layout_cache_miss", 0),
+        }
+        return result
+    finally:
+        _deadline_local.deadline = None
+        _counters_local.counters = None
+        _rss_local.peak = None
+        _memory_budget.release(reserved_mb)
+
+
+def _parse_pdf_all_in_one(pdf_path, pipelined=None):
     """PDF를 최적화하여 파싱 (하이브리드: PyMuPDF 텍스트감지 + pdfplumber 테이블)
     
     전략:
     1. PyMuPDF로 전체 텍스트를 0.2초에 추출 (키워드 페이지 식별 + 보험사/상품명/보험료 감지)
-    2. pdfplumber는 키워드 페이지만 열어서 테이블 추출 (비-키워드 페이지 완전 스킵)
-    3. 텍스트 기반 파서(삼성생명, KB)에 필요한 페이지만 pdfplumber 텍스트 추출
+    2. 테이블 기반 보험사는 PDF_WORD_TABLES=1이면 PyMuPDF 단어 좌표로 테이블을 복원해서 먼저 파싱,
+       꺼져 있거나 실패 시 pdfplumber로 키워드 페이지만 열어서 테이블 추출 (비-키워드 페이지 완전 스킵)
+    3. 텍스트 기반 파서(삼성생명, KB, 흥국)는 PyMuPDF 단어 좌표로 줄을 복원해서 파싱,
+       패리티 검사 실패 시에만 필요한 페이지를 pdfplumber 텍스트로 추출
+    4. 레이아웃 지문 캐시 적중 시 키워드 스캔 없이 알려진 테이블 영역만 crop해서 추출
+       (검증 실패 시 전체 파이프라인으로 폴백)
+    5. pipelined=True면 PyMuPDF 텍스트 추출 중에 후보 페이지를 큐로 받아 pdfplumber
+       테이블 추출을 동시에 진행 (None이면 환경변수 PDF_PIPELINE=1일 때만 — 기본은 순차 모드)
+    6. 단계별 소요 시간은 시간 예산(_current_deadline)에 기록하고, 예산이 끝난 뒤의 결과
+       (partial)는 레이아웃 캐시/보일러플레이트 인덱스에 반영하지 않는다
     """
+    deadline = _current_deadline()
+    if pipelined is None:
+        pipelined = PDF_PIPELINE_DEFAULT
     coverage_keywords = [
         '특약', '담보', '가입금액', '보장내용',
         '보장내역', '가입담보', '보장항목'
     ]
     page_texts_fast = []     # PyMuPDF 텍스트 (빠른 감지용)
+    page_heights = []        # PyMuPDF 페이지 높이 (레이아웃 캐시 하단 검사용)
     page_texts = []          # pdfplumber 텍스트 (파서 호환용, 필요 페이지만)
     page_tables = {}         # {page_index: tables}
+    coverages = None
+    pipeline_tables = None   # 파이프라인 모드에서 미리 추출된 pdfplumber 테이블
+    boilerplate_skipped = 0  # 보일러플레이트 인덱스로 테이블 추출을 생략한 페이지 수
 
     # ── 1단계: PyMuPDF로 빠른 전체 텍스트 추출 (타임아웃 안전) ──
     pymupdf_ok = False
-    if HAS_PYMUPDF:
-        extracted = _pymupdf_extract_texts_safe(pdf_path, timeout_sec=15)
-        if extracted is not None:
-            page_texts_fast = extracted
-            pymupdf_ok = True
+    with deadline.stage("text"):
+        if HAS_PYMUPDF and pipelined:
+            piped = _pymupdf_pipelined_extract(pdf_path, coverage_keywords, timeout_sec=15)
+            if piped is not None:
+                (page_texts_fast, page_heights, pipeline_tables, pipeline_regions,
+                 scanned_pages, skipped_pages) = piped
+                boilerplate_skipped = len(skipped_pages)
+                pymupdf_ok = True
+        elif HAS_PYMUPDF:
+            extracted = _pymupdf_extract_texts_safe(pdf_path, timeout_sec=15)
+            if extracted is not None:
+                page_texts_fast, page_heights = extracted
+                pymupdf_ok = True
 
     if pymupdf_ok:
-        # 키워드 페이지 식별
-        keyword_page_set = set()
-        for i, text in enumerate(page_texts_fast):
-            if text and any(kw in text for kw in coverage_keywords):
-                keyword_page_set.add(i)
+        with deadline.stage("detect"):
+            # 보험사 감지 (PyMuPDF 텍스트로)
+            combined_3 = join_pages(page_texts_fast[:3])
+            insurer_code = _detect_insurer_from_text(combined_3)
 
-        # 보험사 감지 (PyMuPDF 텍스트로)
-        combined_3 = "\n".join(page_texts_fast[:3])
-        insurer_code = _detect_insurer_from_text(combined_3)
+            # 상품명 추출 (PyMuPDF 텍스트로 — 줄 분리가 달라도 정규식 동작)
+            product_name = _detect_product_name_from_text(page_texts_fast[:10])
 
-        # 상품명 추출 (PyMuPDF 텍스트로 — 줄 분리가 달라도 정규식 동작)
-        product_name = _detect_product_name_from_text(page_texts_fast[:10])
+            # 보험료 추출 (PyMuPDF 텍스트로)
+            premium = _extract_premium_from_texts(page_texts_fast[:10])
 
-        # 보험료 추출 (PyMuPDF 텍스트로)
-        premium = _extract_premium_from_texts(page_texts_fast[:10])
+        # KB/삼성생명/흥국생명: PyMuPDF 레이아웃 텍스트로 먼저 시도 (pdfplumber 미오픈)
+        if insurer_code in _LAYOUT_TEXT_INSURERS:
+            with deadline.stage("layout_text"):
+                coverages = _extract_coverages_from_layout_texts(insurer_code, pdf_path, page_texts_fast)
 
-        # 보험사별로 pdfplumber에서 필요한 페이지 결정
+        # 보험사별로 pdfplumber에서 필요한 페이지 결정 (레이아웃 텍스트 패리티 실패 시)
         needs_pdfplumber_text = set()
-        if insurer_code == "shinhan":
-            # 신한라이프: PyMuPDF 텍스트만으로 충분 (pdfplumber 불필요)
-            pass
-        elif insurer_code == "lina":
-            # 라이나생명: PyMuPDF 텍스트만으로 충분 (pdfplumber 불필요)
-            pass
-        elif insurer_code == "meritz":
-            # 메리츠화재: PyMuPDF 텍스트만으로 충분 (pdfplumber 불필요)
-            pass
-        elif insurer_code == "samsung_life":
+        if insurer_code == "samsung_life":
             for pg in range(4, min(8, len(page_texts_fast))):
                 needs_pdfplumber_text.add(pg)
         elif insurer_code == "kb":
             for pg in range(min(10, len(page_texts_fast))):
                 needs_pdfplumber_text.add(pg)
-        elif insurer_code == "mirae":
-            pass
-        elif insurer_code == "heungkuk":
-            # 흥국생명: 보장 테이블 페이지만 (최대 15페이지까지만 탐색)
-            for pg in sorted(keyword_page_set):
-                if pg < 15:
-                    needs_pdfplumber_text.add(pg)
-
-        # 키워드 페이지도 최대 20페이지까지만 테이블 추출 (뒷 페이지는 약관)
-        limited_keyword_set = {p for p in keyword_page_set if p < 20}
-
-        pages_to_process = limited_keyword_set | needs_pdfplumber_text
-        if pages_to_process:
-            with pdfplumber.open(pdf_path) as pdf:
-                page_texts = [""] * len(pdf.pages)
-                for i in sorted(pages_to_process):
-                    if i >= len(pdf.pages):
-                        continue
-                    page = pdf.pages[i]
-
-                    if i in needs_pdfplumber_text:
-                        text = page.extract_text()
-                        page_texts[i] = text or ""
-
-                    if i in limited_keyword_set:
-                        tables = page.extract_tables({
-                            'vertical_strategy': 'lines',
-                            'horizontal_strategy': 'lines',
-                            'snap_tolerance': 5,
-                            'join_tolerance': 5,
-                        })
-                        if not tables:
-                            tables = page.extract_tables({
-                                'vertical_strategy': 'text',
-                                'horizontal_strategy': 'text',
-                            })
-                        if tables:
-                            page_tables[i] = tables
-        else:
-            page_texts = [""] * len(page_texts_fast)
+        # 신한라이프/라이나생명/메리츠화재/미래에셋: PyMuPDF 텍스트만으로 충분 (pdfplumber 불필요)
+
+        fingerprint = _layout_fingerprint(insurer_code, product_name, page_texts_fast)
+        layout_pages = _layout_keyword_pages(page_texts_fast, coverage_keywords) if fingerprint else None
+
+        # 파이프라인 모드: 텍스트 추출과 동시에 뽑아 둔 pdfplumber 테이블 사용
+        if coverages is None and pipeline_tables:
+            page_texts = [EMPTY_PAGE] * len(page_texts_fast)
+            page_tables = pipeline_tables
+            with deadline.stage("coverages"):
+                coverages = _extract_coverages_by_insurer(
+                    insurer_code, page_texts_fast, page_texts, page_tables, pdf_path
+                )
+            if coverages and not deadline.partial:
+                _layout_cache_put(fingerprint, pipeline_regions, layout_pages, page_heights)
+                _learn_boilerplate_pages(insurer_code, page_texts_fast, scanned_pages, pipeline_tables)
+            elif not coverages:
+                page_texts, page_tables, coverages = [], {}, None
+
+        # ── 레이아웃 캐시 적중: 키워드 스캔·전체 페이지 테이블 탐지 생략 ──
+        cached_regions = _layout_cache_get(fingerprint, layout_pages) if coverages is None else None
+        if cached_regions and _use_word_tables(insurer_code):
+            with deadline.stage("word_tables"):
+                word_tables = _pymupdf_extract_word_tables_safe(pdf_path, set(cached_regions), cached_regions)
+                hit_regions = {}
+                if word_tables:
+                    coverages, hit_regions = _extract_coverages_from_word_tables(
+                        insurer_code, pdf_path, page_texts_fast, word_tables
+                    )
+            # 캐시된 페이지마다 가입금액 헤더 테이블이 복원돼야 적중으로 인정
+            # 실패 → 캐시 폐기 후 전체 스캔 (시간 예산 소진이면 캐시 영역으로 pdfplumber만 시도)
+            if not coverages or set(hit_regions) != set(cached_regions):
+                coverages = None
+                if not deadline.partial:
+                    _layout_cache_discard(fingerprint)
+                    cached_regions = None
+        if cached_regions and coverages is None:
+            with deadline.stage("tables"):
+                extracted_pages = _extract_pdfplumber_pages(
+                    pdf_path, needs_pdfplumber_text, set(cached_regions), cached_regions
+                )
+            if extracted_pages is not None:
+                page_texts, page_tables, _ = extracted_pages
+                with deadline.stage("coverages"):
+                    coverages = _extract_coverages_by_insurer(
+                        insurer_code, page_texts_fast, page_texts, page_tables, pdf_path
+                    )
+            if not coverages:
+                # 검증 실패 → 캐시 폐기 후 전체 파이프라인 (시간 예산 소진이면 캐시는 유지)
+                if not deadline.partial:
+                    _layout_cache_discard(fingerprint)
+                page_texts, page_tables, coverages = [], {}, None
+
+        if coverages is None:
+            # 키워드 페이지 식별
+            keyword_page_set = set()
+            for i, text in enumerate(page_texts_fast):
+                if text and any(kw in text for kw in coverage_keywords):
+                    keyword_page_set.add(i)
 
-    else:
+            if insurer_code == "heungkuk":
+                # 흥국생명: 보장 테이블 페이지만 (최대 15페이지까지만 탐색)
+                for pg in sorted(keyword_page_set):
+                    if pg < 15:
+                        needs_pdfplumber_text.add(pg)
+
+            # 키워드 페이지도 최대 20페이지까지만 테이블 추출 (뒷 페이지는 약관)
+            # 텍스트 전용 파서 보험사는 테이블을 쓰지 않으므로 추출 생략
+            limited_keyword_set = {p for p in keyword_page_set if p < 20}
+            if insurer_code in _NO_TABLE_INSURERS:
+                limited_keyword_set = set()
+            elif _streams_pdfplumber_tables(insurer_code) and limited_keyword_set:
+                # 보일러플레이트로 확정된 페이지(약관/안내)는 테이블 추출 생략
+                known_pages = _boilerplate_index.known_pages(page_texts_fast, limited_keyword_set)
+                limited_keyword_set -= known_pages
+                boilerplate_skipped = len(known_pages)
+
+            # 테이블 기반 보험사: PyMuPDF 단어 좌표 테이블로 먼저 시도
+            if _use_word_tables(insurer_code) and limited_keyword_set:
+                section = _CoverageSectionTracker(page_texts_fast)
+                with deadline.stage("word_tables"):
+                    word_tables = _pymupdf_extract_word_tables_safe(
+                        pdf_path, limited_keyword_set, section=section
+                    )
+                    if word_tables:
+                        coverages, found_regions = _extract_coverages_from_word_tables(
+                            insurer_code, pdf_path, page_texts_fast, word_tables
+                        )
+                if word_tables:
+                    if coverages and not deadline.partial:
+                        _layout_cache_put(fingerprint, found_regions, layout_pages, page_heights)
+                        _learn_boilerplate_pages(
+                            insurer_code, page_texts_fast, limited_keyword_set - section.skipped_pages,
+                            {i: [rows for rows, _ in found] for i, found in word_tables.items()},
+                        )
+                    elif not coverages:
+                        coverages = None
+
+            # 실패 시 pdfplumber 테이블 (전체 페이지 탐지)
+            if coverages is None:
+                section = _CoverageSectionTracker(page_texts_fast)
+                if limited_keyword_set | needs_pdfplumber_text:
+                    with deadline.stage("tables"):
+                        page_texts, page_tables, found_regions = _extract_pdfplumber_pages(
+                            pdf_path, needs_pdfplumber_text, limited_keyword_set, section=section
+                        )
+                else:
+                    page_texts = [EMPTY_PAGE] * len(page_texts_fast)
+                    found_regions = {}
+
+                with deadline.stage("coverages"):
+                    coverages = _extract_coverages_by_insurer(
+                        insurer_code, page_texts_fast, page_texts, page_tables, pdf_path
+                    )
+                if coverages and found_regions and not deadline.partial:
+                    _layout_cache_put(fingerprint, found_regions, layout_pages, page_heights)
+                if coverages and not deadline.partial:
+                    _learn_boilerplate_pages(
+                        insurer_code, page_texts_fast, limited_keyword_set - section.skipped_pages, page_tables
+                    )
+
+    elif deadline.allow("pdfplumber_full"):
         # PyMuPDF 없거나 hang → pdfplumber 전체 처리 (최대 20페이지)
         keyword_page_set = set()
-        with pdfplumber.open(pdf_path) as pdf:
-            max_pages = min(len(pdf.pages), 20)  # 보장 테이블은 보통 앞 20페이지 안에 있음
-            for i in range(max_pages):
-                page = pdf.pages[i]
-                text = page.extract_text()
-                page_texts.append(text or "")
+        with deadline.stage("tables"), pdfplumber.open(pdf_path) as pdf:
+            # 보장 테이블은 보통 앞 20페이지 안에 있음
+            for i, page in enumerate(_iter_pages(pdf.pages[:20], stage="pdfplumber_full")):
+                text = as_page_text(page.extract_text())
+                page_texts.append(text)
                 if text and any(kw in text for kw in coverage_keywords):
                     keyword_page_set.add(i)
-                    tables = page.extract_tables({
-                        'vertical_strategy': 'lines',
-                        'horizontal_strategy': 'lines',
-                        'snap_tolerance': 5,
-                        'join_tolerance': 5,
-                    })
-                    if not tables:
-                        tables = page.extract_tables({
-                            'vertical_strategy': 'text',
-                            'horizontal_strategy': 'text',
-                        })
+                    tables, _ = _find_page_tables(page)
                     if tables:
                         page_tables[i] = tables
 
-        combined_3 = "\n".join(page_texts[:3])
+        combined_3 = join_pages(page_texts[:3])
         insurer_code = _detect_insurer_from_text(combined_3)
         product_name = _detect_product_name_from_text(page_texts[:10])
         premium = _extract_premium_from_texts(page_texts[:10])
+        with deadline.stage("coverages"):
+            coverages = _extract_coverages_by_insurer(
+                insurer_code, page_texts_fast, page_texts, page_tables, pdf_path
+            )
 
-    # ── 특약 추출 (보험사별 분기) ──
-    if insurer_code == "shinhan":
-        # 신한라이프: PyMuPDF 텍스트 기반 전용 파서 (대표지급금액 사용)
-        coverages = extract_coverage_shinhan(page_texts_fast)
-    elif insurer_code == "lina":
-        # 라이나생명: PyMuPDF 텍스트 기반 전용 파서
-        coverages = extract_coverage_lina(page_texts_fast)
-    elif insurer_code == "meritz":
-        # 메리츠화재: PyMuPDF 텍스트 기반 전용 파서
-        coverages = extract_coverage_meritz(page_texts_fast)
-    elif insurer_code == "samsung_life":
-        coverages = _extract_coverage_samsung_from_texts(page_texts, pdf_path)
-    elif insurer_code == "mirae":
-        coverages = extract_coverage_mirae(pdf_path)
-    elif insurer_code == "kb":
-        coverages = _extract_coverage_kb_from_texts(
-            # KB 파서는 page_texts 리스트 필요 — pdfplumber 텍스트 사용
-            page_texts if any(page_texts) else page_texts_fast, pdf_path
-        )
-    elif insurer_code == "heungkuk":
-        # 흥국생명 전용 파서 — 테이블 기반 (실제 PDF 구조에 맞춤)
-        coverages = _extract_coverage_heungkuk_from_cache(
-            page_texts if any(page_texts) else page_texts_fast,
-            page_tables, pdf_path
-        )
-        # 캐시 결과 없으면 pdfplumber로 페이지 5~14만 처리 (전체 PDF 재오픈 금지)
-        if not coverages:
-            coverages = _extract_coverage_heungkuk_limited(pdf_path)
     else:
-        # 범용 파서 — 테이블 캐시 사용 (PDF 재오픈 안 함)
-        coverages = _extract_coverage_generic_from_cache(page_texts, page_tables, pdf_path)
+        # 텍스트 추출 중 시간 예산 소진 — 빈 결과 (partial)
+        insurer_code, product_name, premium, coverages = None, None, None, []
 
     insurer_name_map = {
         "meritz": "메리츠화재", "samsung": "삼성화재",
@@ -1867,190 +2847,192 @@ def parse_pdf_all_in_one(pdf_path):
         "product_name": product_name,
         "premium": premium,
         "coverages": coverages,
+        "boilerplate_pages_skipped": boilerplate_skipped,
+        "page_count": len(page_texts_fast) or len(page_texts),
     }
 
 
-def _detect_insurer_from_text(text):
-    """이미 추출된 텍스트에서 보험사 감지"""
-    keywords_ordered = [
-        ("삼성생명", "samsung_life"),
-        ("삼성화재", "samsung"),
-        ("메리츠화재", "meritz"),
-        ("메리츠", "meritz"),
-        ("미래에셋생명", "mirae"),
-        ("미래에셋", "mirae"),
-        ("KB손해", "kb"), ("KB손보", "kb"),
-        ("KB 플러스", "kb"), ("KB플러스", "kb"),
-        ("DB손해", "db"), ("DB손보", "db"),
-        ("ABL", "abl"), ("에이비엘", "abl"),
-        ("흥국", "heungkuk"), ("한화", "hanwha"),
-        ("현대해상", "hyundai"), ("롯데손해", "lotte"),
-        ("NH농협", "nh"), ("동양생명", "dongyang"),
-        ("교보생명", "kyobo"), ("신한라이프", "shinhan"),
-        ("라이나생명", "lina"), ("라이나", "lina"),
-    ]
-    for keyword, insurer in keywords_ordered:
-        if keyword in text:
-            return insurer
-    if "kbinsure" in text.lower():
-        return "kb"
-    if "lina.co.kr" in text.lower():
-        return "lina"
-    if "meritzfire.com" in text.lower() or "1566-7711" in text:
-        return "meritz"
-    # DB손해보험: PDF에 "DB손해" 키워드 없이 "idbins.com" 또는 "프로미라이프" 포함
-    if "idbins.com" in text.lower() or "프로미라이프" in text:
-        return "db"
-    if "삼성" in text:
-        if any(kw in text for kw in ["생명보험", "건강보험", "종신보험", "The간편한", "다모은"]):
-            return "samsung_life"
-        return "samsung"
+# ── 상품명 패턴 (줄 단위, 우선순위 순) ──
+# 상품명 후보 줄: 모든 패턴이 '보험' / 'M-케어' / '삼성화재' 중 하나를 요구
+_PRODUCT_LINE_RE = re.compile(r'^.*(?:보험|M-케어|삼성화재).*$', re.M)
+_PRODUCT_LABEL_RE = re.compile(r'보험상품명\s+(.+)')
+_PRODUCT_KB_PLUS_RE = re.compile(r'(KB\s*플러스\s*[^\(\n]+보험)')
+_PRODUCT_KB_RE = re.compile(r'(KB\s*[^\(\n]*보험[^\(\n]*)\(무배당\)')
+_PRODUCT_MIRAE_RE = re.compile(r'(M-케어\s*건강[^\(]*)')
+_PRODUCT_MU_YU_RE = re.compile(r'^\(무\)\s*|^\(유\)\s*')
+_PRODUCT_SAMSUNG_FIRE_RE = re.compile(r'(?:무배당)?삼성화재\s+(.+?)(?:\([\d.]+\))')
+_PRODUCT_SAMSUNG_RE = re.compile(r'^삼성\s+(.+보험)')
+_PRODUCT_MERITZ_RE = re.compile(r'(메리츠\s*[^\(\n]*보험[^\(\n]*)')
+_PRODUCT_SHINHAN_RE = re.compile(r'(신한통합[^\(\n]*보험[^\(\n]*?)(?:\s*원\(ONE\)|\(무배당)')
+_PRODUCT_SHINHAN_STRIP_RE = re.compile(r'\(무배당.*\)|\(갱신형\)|\(생명보험\)')
+_PRODUCT_LINA_RE = re.compile(r'무배당(새로담는[^\(\n]*보험)')
+_PRODUCT_DB_RE = re.compile(r'(?:건강할때\s*가입하는\s*)?([^\n]*(?:종합보험|건강보험|보장보험|질병보험)[^\n]*\d{4})')
+_PRODUCT_DB_SUFFIX_RE = re.compile(r'\s*(종합보험|건강보험|보장보험|질병보험)\d*$')
+_PRODUCT_HYUNDAI_RE = re.compile(r'(?:무배당)?현대해상(.+?종합보험|.+?보험)(?:\([^)]*\))')
+_PRODUCT_HEUNGKUK_PRODUCT_RE = re.compile(r'(?:\(무\)\s*|\(무배당\)\s*|무배당\s+)(흥국\s*[^\(\n]*보험[^\(\n]*)')
+_PRODUCT_HEUNGKUK_RE = re.compile(r'(흥국\s*(?:생명)?\s*[^\(\n]*보험[^\(\n]*)')
+_NO_DIVIDEND_TAIL_RE = re.compile(r'\(무배당\).*')
+_HEUNGKUK_TAIL_RE = re.compile(r'\(무배당\).*|\(무\).*')
+
+
+def _detect_product_name_from_line(line):
+    """상품명 후보 줄 하나에서 상품명 추출 (패턴 우선순위 순, 없으면 None)"""
+    # 보험상품명 라벨이 있는 줄 (흥국생명 등)
+    product_label_match = _PRODUCT_LABEL_RE.search(line)
+    if product_label_match:
+        name = product_label_match.group(1).strip()
+        # (무) 접두사 제거
+        name = re.sub(r'^\(무\)\s*', '', name).strip()
+        if len(name) > 4:
+            return name[:50] if len(name) > 50 else name
+
+    kb_match = _PRODUCT_KB_PLUS_RE.search(line)
+    if kb_match:
+        name = kb_match.group(1).strip()
+        name = _NO_DIVIDEND_TAIL_RE.sub('', name).strip()
+        return name[:30] if len(name) > 30 else name
+
+    kb_match2 = _PRODUCT_KB_RE.search(line)
+    if kb_match2:
+        name = kb_match2.group(1).strip()
+        return name[:30] if len(name) > 30 else name
+
+    mirae_match = _PRODUCT_MIRAE_RE.search(line)
+    if mirae_match:
+        name = mirae_match.group(1).strip()
+        return name[:30] if len(name) > 30 else name
+
+    if line.startswith(('(무)', '(유)')):
+        name = _PRODUCT_MU_YU_RE.sub('', line)
+        # 상품명에 '보험' 포함 필수 (표지의 짧은 줄 제외)
+        if '보험' in name:
+            name = name.strip()
+            return name[:50] if len(name) > 50 else name
+        # '보험' 없으면 스킵 (표지 줄일 수 있음)
+
+    # 삼성화재: "무배당삼성화재 건강보험 천만안심(2601.13)..." 패턴
+    samsung_match2 = _PRODUCT_SAMSUNG_FIRE_RE.search(line)
+    if samsung_match2:
+        name = samsung_match2.group(1).strip()
+        return name[:30] if len(name) > 30 else name
+
+    # 삼성: "삼성 뉴골드보험(무배당)" 패턴 (레거시)
+    samsung_match = _PRODUCT_SAMSUNG_RE.match(line)
+    if samsung_match:
+        name = samsung_match.group(1).strip()
+        name = re.sub(r'\(\d{4}\).*', '', name).strip()
+        return name[:30] if len(name) > 30 else name
+
+    meritz_match = _PRODUCT_MERITZ_RE.search(line)
+    if meritz_match:
+        name = meritz_match.group(1).strip()
+        name = _NO_DIVIDEND_TAIL_RE.sub('', name).strip()
+        return name[:30] if len(name) > 30 else name
+
+    # 신한라이프: "신한통합건강보험 원(ONE)(무배당, 갱신형)" 패턴
+    shinhan_match = _PRODUCT_SHINHAN_RE.search(line)
+    if shinhan_match:
+        name = shinhan_match.group(1).strip()
+        return name[:30] if len(name) > 30 else name
+    # 신한라이프 상품명 라벨: "상품명\n신한통합건강보험..."
+    if '신한통합' in line and '보험' in line:
+        name = _PRODUCT_SHINHAN_STRIP_RE.sub('', line).strip()
+        name = re.sub(r'\s*원\(ONE\)', '', name).strip()
+        if len(name) > 4 and '보험' in name:
+            return name[:30] if len(name) > 30 else name
+
+    # 라이나생명: "무배당새로담는건강보험(해약환급금미지급형Ⅱ)" 패턴
+    lina_match = _PRODUCT_LINA_RE.search(line)
+    if lina_match:
+        name = lina_match.group(1).strip()
+        # (해약환급금...) 부분 제거
+        name = re.sub(r'\(해약환급금.*', '', name).strip()
+        if len(name) > 4:
+            return name[:30] if len(name) > 30 else name
+
+    # DB손해보험: "무배당 프로미라이프\n건강할때 가입하는 청춘어람플러스 종합보험2601" 패턴
+    db_match = _PRODUCT_DB_RE.search(line)
+    if db_match and 'idbins' not in line.lower() and '프로미라이프' not in line:
+        name = db_match.group(1).strip()
+        name = _NO_DIVIDEND_TAIL_RE.sub('', name).strip()
+        # "종합보험2601" 등에서 "종합보험" + 숫자코드 제거 → 핵심 상품명만 추출
+        name = _PRODUCT_DB_SUFFIX_RE.sub('', name).strip()
+        if len(name) > 2:
+            return name[:30] if len(name) > 30 else name
+
+    # 현대해상: "무배당현대해상퍼펙트플러스종합보험(연만기갱신형)(Hi2601)" 패턴
+    hyundai_match = _PRODUCT_HYUNDAI_RE.search(line)
+    if hyundai_match:
+        name = hyundai_match.group(1).strip()
+        # "보험" 등 접미사 제거하고 핵심 상품명만 추출
+        name = re.sub(r'종합보험$|보험$', '', name).strip()
+        if len(name) >= 2:
+            return name[:30] if len(name) > 30 else name
+
+    # 흥국생명 상품명 감지
+    # 1) "(무)흥국 XXX보험" 또는 "무배당 흥국 XXX보험" 패턴 (상품명 확실)
+    heungkuk_product = _PRODUCT_HEUNGKUK_PRODUCT_RE.search(line)
+    if heungkuk_product:
+        name = heungkuk_product.group(1).strip()
+        name = _HEUNGKUK_TAIL_RE.sub('', name).strip()
+        if len(name) > 4:
+            return name[:30] if len(name) > 30 else name
+    # 2) "흥국 XXX보험" (회사명만 있는 줄 제외)
+    heungkuk_match = _PRODUCT_HEUNGKUK_RE.search(line)
+    if heungkuk_match:
+        name = heungkuk_match.group(1).strip()
+        name = _HEUNGKUK_TAIL_RE.sub('', name).strip()
+        # 흥국생명보험(주), 흥국생명보험주식회사 같은 회사명 제외
+        name_nospace = name.replace(" ", "")
+        if ('보험(주)' in name or '보험주식회사' in name_nospace or
+            name_nospace in ['흥국생명보험', '흥국생명'] or
+            '제안서' in name):
+            return None
+        if len(name) > 4:
+            return name[:30] if len(name) > 30 else name
     return None
 
 
 def _detect_product_name_from_text(page_texts):
-    """이미 추출된 페이지 텍스트에서 상품명 추출"""
+    """이미 추출된 페이지 텍스트에서 상품명 추출
+
+    페이지마다 상품명 후보 줄('보험'/'M-케어'/'삼성화재' 포함)만 한 번에 골라
+    줄 순서대로 패턴을 적용한다 — 첫 번째로 상품명이 나온 줄에서 종료.
+    """
     for text in page_texts:
         if not text:
             continue
-        for line in text.split('\n'):
-            line = line.strip()
-
-            # 보험상품명 라벨이 있는 줄 (흥국생명 등)
-            product_label_match = re.search(r'보험상품명\s+(.+)', line)
-            if product_label_match:
-                name = product_label_match.group(1).strip()
-                # (무) 접두사 제거
-                name = re.sub(r'^\(무\)\s*', '', name).strip()
-                if len(name) > 4:
-                    return name[:50] if len(name) > 50 else name
-
-            kb_match = re.search(r'(KB\s*플러스\s*[^\(\n]+보험)', line)
-            if kb_match:
-                name = kb_match.group(1).strip()
-                name = re.sub(r'\(무배당\).*', '', name).strip()
-                return name[:30] if len(name) > 30 else name
-
-            kb_match2 = re.search(r'(KB\s*[^\(\n]*보험[^\(\n]*)\(무배당\)', line)
-            if kb_match2:
-                name = kb_match2.group(1).strip()
-                return name[:30] if len(name) > 30 else name
-
-            mirae_match = re.search(r'(M-케어\s*건강[^\(]*)', line)
-            if mirae_match:
-                name = mirae_match.group(1).strip()
-                return name[:30] if len(name) > 30 else name
-
-            if re.match(r'^\(무\)|^\(유\)', line):
-                name = re.sub(r'^\(무\)\s*|^\(유\)\s*', '', line)
-                # 상품명에 '보험' 포함 필수 (표지의 짧은 줄 제외)
-                if '보험' in name:
-                    name = name.strip()
-                    return name[:50] if len(name) > 50 else name
-                # '보험' 없으면 스킵 (표지 줄일 수 있음)
-
-            # 삼성화재: "무배당삼성화재 건강보험 천만안심(2601.13)..." 패턴
-            samsung_match2 = re.search(r'(?:무배당)?삼성화재\s+(.+?)(?:\([\d.]+\))', line)
-            if samsung_match2:
-                name = samsung_match2.group(1).strip()
-                return name[:30] if len(name) > 30 else name
-
-            # 삼성: "삼성 뉴골드보험(무배당)" 패턴 (레거시)
-            samsung_match = re.match(r'^삼성\s+(.+보험)', line)
-            if samsung_match:
-                name = samsung_match.group(1).strip()
-                name = re.sub(r'\(\d{4}\).*', '', name).strip()
-                return name[:30] if len(name) > 30 else name
-
-            meritz_match = re.search(r'(메리츠\s*[^\(\n]*보험[^\(\n]*)', line)
-            if meritz_match:
-                name = meritz_match.group(1).strip()
-                name = re.sub(r'\(무배당\).*', '', name).strip()
-                return name[:30] if len(name) > 30 else name
-
-            # 신한라이프: "신한통합건강보험 원(ONE)(무배당, 갱신형)" 패턴
-            shinhan_match = re.search(r'(신한통합[^\(\n]*보험[^\(\n]*?)(?:\s*원\(ONE\)|\(무배당)', line)
-            if shinhan_match:
-                name = shinhan_match.group(1).strip()
-                return name[:30] if len(name) > 30 else name
-            # 신한라이프 상품명 라벨: "상품명\n신한통합건강보험..."
-            if '신한통합' in line and '보험' in line:
-                name = re.sub(r'\(무배당.*\)|\(갱신형\)|\(생명보험\)', '', line).strip()
-                name = re.sub(r'\s*원\(ONE\)', '', name).strip()
-                if len(name) > 4 and '보험' in name:
-                    return name[:30] if len(name) > 30 else name
-
-            # 라이나생명: "무배당새로담는건강보험(해약환급금미지급형Ⅱ)" 패턴
-            lina_match = re.search(r'무배당(새로담는[^\(\n]*보험)', line)
-            if lina_match:
-                name = lina_match.group(1).strip()
-                # (해약환급금...) 부분 제거
-                name = re.sub(r'\(해약환급금.*', '', name).strip()
-                if len(name) > 4:
-                    return name[:30] if len(name) > 30 else name
-
-            # DB손해보험: "무배당 프로미라이프\n건강할때 가입하는 청춘어람플러스 종합보험2601" 패턴
-            db_match = re.search(r'(?:건강할때\s*가입하는\s*)?([^\n]*(?:종합보험|건강보험|보장보험|질병보험)[^\n]*\d{4})', line)
-            if db_match and 'idbins' not in line.lower() and '프로미라이프' not in line:
-                name = db_match.group(1).strip()
-                name = re.sub(r'\(무배당\).*', '', name).strip()
-                # "종합보험2601" 등에서 "종합보험" + 숫자코드 제거 → 핵심 상품명만 추출
-                name = re.sub(r'\s*(종합보험|건강보험|보장보험|질병보험)\d*$', '', name).strip()
-                if len(name) > 2:
-                    return name[:30] if len(name) > 30 else name
-
-            # 현대해상: "무배당현대해상퍼펙트플러스종합보험(연만기갱신형)(Hi2601)" 패턴
-            hyundai_match = re.search(r'(?:무배당)?현대해상(.+?종합보험|.+?보험)(?:\([^)]*\))', line)
-            if hyundai_match:
-                name = hyundai_match.group(1).strip()
-                # "보험" 등 접미사 제거하고 핵심 상품명만 추출
-                name = re.sub(r'종합보험$|보험$', '', name).strip()
-                if len(name) >= 2:
-                    return name[:30] if len(name) > 30 else name
-
-            # 흥국생명 상품명 감지
-            # 1) "(무)흥국 XXX보험" 또는 "무배당 흥국 XXX보험" 패턴 (상품명 확실)
-            heungkuk_product = re.search(r'(?:\(무\)\s*|\(무배당\)\s*|무배당\s+)(흥국\s*[^\(\n]*보험[^\(\n]*)', line)
-            if heungkuk_product:
-                name = heungkuk_product.group(1).strip()
-                name = re.sub(r'\(무배당\).*|\(무\).*', '', name).strip()
-                if len(name) > 4:
-                    return name[:30] if len(name) > 30 else name
-            # 2) "흥국 XXX보험" (회사명만 있는 줄 제외)
-            heungkuk_match = re.search(r'(흥국\s*(?:생명)?\s*[^\(\n]*보험[^\(\n]*)', line)
-            if heungkuk_match:
-                name = heungkuk_match.group(1).strip()
-                name = re.sub(r'\(무배당\).*|\(무\).*', '', name).strip()
-                # 흥국생명보험(주), 흥국생명보험주식회사 같은 회사명 제외
-                name_nospace = name.replace(" ", "")
-                if ('보험(주)' in name or '보험주식회사' in name_nospace or
-                    name_nospace in ['흥국생명보험', '흥국생명'] or
-                    '제안서' in name):
-                    continue
-                if len(name) > 4:
-                    return name[:30] if len(name) > 30 else name
+        for line_match in _PRODUCT_LINE_RE.finditer(text):
+            name = _detect_product_name_from_line(line_match.group(0).strip())
+            if name is not None:
+                return name
 
     return "상품명 미확인"
 
 
+# ── 보험료 패턴 (우선순위 순) ──
+# 패턴마다 첫 글자가 리터럴이라 개별 search가 접두어 고속 탐색을 쓴다.
+# (하나의 lookahead 교대 패턴으로 합치면 모든 위치에서 분기를 시도해 오히려 3~5배 느림)
+_PREMIUM_RES = [re.compile(p) for p in [
+    r'실납입보험료\s*([\d,]+)\s*원',
+    r'1회차보험료\(할인후\)\s*([\d,]+)\s*원',
+    r'할인후초회보험료\s*([\d,]+)\s*원',
+    r'보장보험료\s*합계\s*([\d,]+)\s*원',
+    r'합\s*계\s*보\s*험\s*료\s*([\d,]+)\s*원',
+    r'합계보험료\s*([\d,]+)\s*원',
+    r'보험료\s*합계\s*([\d,]+)원',  # 신한라이프: "보험료 합계\n90,906원"
+    r'합\s*계\s*([\d,]+)',
+    r'보험료\s*[:\s]?\s*([\d,]+)\s*원',
+]]
+
+
 def _extract_premium_from_texts(page_texts):
-    """이미 추출된 페이지 텍스트에서 보험료 추출"""
-    patterns = [
-        r'실납입보험료\s*([\d,]+)\s*원',
-        r'1회차보험료\(할인후\)\s*([\d,]+)\s*원',
-        r'할인후초회보험료\s*([\d,]+)\s*원',
-        r'보장보험료\s*합계\s*([\d,]+)\s*원',
-        r'합\s*계\s*보\s*험\s*료\s*([\d,]+)\s*원',
-        r'합계보험료\s*([\d,]+)\s*원',
-        r'보험료\s*합계\s*([\d,]+)원',  # 신한라이프: "보험료 합계\n90,906원"
-        r'합\s*계\s*([\d,]+)',
-        r'보험료\s*[:\s]?\s*([\d,]+)\s*원',
-    ]
+    """이미 추출된 페이지 텍스트에서 보험료 추출 (보험료가 나온 첫 페이지에서 종료)"""
     for text in page_texts:
         if not text:
             continue
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _PREMIUM_RES:
+            match = pattern.search(text)
             if match:
                 val = int(match.group(1).replace(',', ''))
                 if val >= 1000:
@@ -2058,14 +3040,16 @@ def _extract_premium_from_texts(page_texts):
     return None
 
 
-def _extract_coverage_samsung_from_texts(page_texts, pdf_path):
-    """삼성생명 - 미리 추출된 텍스트로 특약 파싱 (페이지 제한)"""
-    results = []
+def _extract_coverage_samsung_from_texts(page_texts, pdf_path, table_fallback=True):
+    """삼성생명 - 미리 추출된 텍스트로 특약 파싱 (페이지 제한)
+
+    table_fallback=False면 결과가 없어도 pdfplumber 테이블 파싱을 하지 않는다
+    (PyMuPDF 레이아웃 텍스트 시도 시 — 호출부가 폴백 경로를 결정).
+    """
+    results = CoverageCollector()
     # 5~8페이지에 특약 정보가 집중 (인덱스 4~7)
     relevant_texts = page_texts[4:8] if len(page_texts) > 4 else page_texts
-    full_text = "\n".join(relevant_texts)
-
-    lines = full_text.split('\n')
+    lines = [line for text in relevant_texts for line in as_page_text(text).lines]
     i = 0
     while i < len(lines):
         line = lines[i].strip()
@@ -2084,8 +3068,7 @@ def _extract_coverage_samsung_from_texts(page_texts, pdf_path):
             if name and amount and len(name) >= 5:
                 name_nospace = name.replace(" ", "")
                 if not any(sk in name_nospace for sk in ["합계보험료", "주보험"]):
-                    if not any(r["특약명"] == name for r in results):
-                        results.append({"특약명": name, "가입금액": amount})
+                    results.add(name, amount)
             continue
 
         match_name = re.match(r'^(\d{1,4})\s+(.+)', line)
@@ -2100,8 +3083,7 @@ def _extract_coverage_samsung_from_texts(page_texts, pdf_path):
                     amount = parse_amount(amount_in_line.group(1))
                     name = name_part[:amount_in_line.start()].strip()
                     if name and amount and len(name) >= 5:
-                        if not any(r["특약명"] == name for r in results):
-                            results.append({"특약명": name, "가입금액": amount})
+                        results.add(name, amount)
                     continue
 
                 for look_ahead in range(i, min(i + 3, len(lines))):
@@ -2110,8 +3092,7 @@ def _extract_coverage_samsung_from_texts(page_texts, pdf_path):
                     if amount_match:
                         amount = parse_amount(amount_match.group(1))
                         if name_part and amount and len(name_part) >= 5:
-                            if not any(r["특약명"] == name_part for r in results):
-                                results.append({"특약명": name_part, "가입금액": amount})
+                            results.add(name_part, amount)
                         break
                 continue
 
@@ -2119,20 +3100,22 @@ def _extract_coverage_samsung_from_texts(page_texts, pdf_path):
             amount_match = re.search(r'(\d[\d,]*(?:억|천만|백만|만|천)?원)', line)
             if amount_match:
                 amount = parse_amount(amount_match.group(1))
-                if amount and not any(r["특약명"] == "주보험 재해사망" for r in results):
-                    results.append({"특약명": "주보험 재해사망", "가입금액": amount})
+                if amount:
+                    results.add("주보험 재해사망", amount)
             continue
 
     # 텍스트 기반으로 결과 없으면 테이블 파싱 시도 (원본 함수 사용)
-    if not results:
-        results = extract_coverage_samsung_table(pdf_path)
+    if not results and table_fallback and _current_deadline().allow(
+        "pdfplumber_fallback", _OPTIONAL_STAGE_RESERVE_SEC
+    ):
+        return extract_coverage_samsung_table(pdf_path)
 
-    return results
+    return results.items
 
 
 def _extract_coverage_kb_from_texts(page_texts, pdf_path):
     """KB손해보험 - 미리 추출된 텍스트로 특약 파싱"""
-    results = []
+    results = CoverageCollector()
     full_text = "\n".join(page_texts)
 
     for page_text in page_texts[:10]:
@@ -2144,14 +3127,7 @@ def _extract_coverage_kb_from_texts(page_texts, pdf_path):
         if not is_coverage_page:
             continue
         _parse_kb_coverage_page(page_text, results)
-
-    seen = set()
-    unique_results = []
-    for r in results:
-        if r["특약명"] not in seen:
-            seen.add(r["특약명"])
-            unique_results.append(r)
-    results = unique_results
+    results = results.items
 
     _enrich_kb_injury_grade_info(results, full_text)
     return results
@@ -2165,7 +3141,7 @@ def extract_coverage_from_pdf(pdf_path):
 
 def _extract_coverage_generic_from_cache(page_texts, page_tables, pdf_path):
     """범용 파서 — 미리 추출된 텍스트+테이블 캐시 사용 (PDF 재오픈 없음)"""
-    results = []
+    results = CoverageCollector()
     sub_prefix_pattern = re.compile(r'^┗?\s*\d+\s+')
 
     header_keywords = [
@@ -2175,7 +3151,11 @@ def _extract_coverage_generic_from_cache(page_texts, page_tables, pdf_path):
     ]
     amount_keywords = ["가입금액", "보험가입금액", "보장금액"]
 
-    for page_idx, tables in page_tables.items():
+    section = _CoverageSectionTracker(page_texts)
+    for page_idx, tables in sorted(page_tables.items()):
+        if section.skip(page_idx):
+            break
+        section.feed(page_idx, tables)
         for table in tables:
             if not table or len(table) < 2:
                 continue
@@ -2267,19 +3247,19 @@ def _extract_coverage_generic_from_cache(page_texts, page_tables, pdf_path):
                                 break
 
                 if name and amount:
-                    if not any(r["특약명"] == name for r in results):
-                        results.append({"특약명": name, "가입금액": amount})
+                    results.add(name, amount)
 
-    return results
+    return results.items
 
 
 def extract_coverage_generic(pdf_path):
     """범용 PDF 파싱 (메리츠 등)"""
-    results = []
+    results = CoverageCollector()
     sub_prefix_pattern = re.compile(r'^┗?\s*\d+\s+')
 
+    section = _CoverageSectionTracker()
     with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages):
+        for page_num, page in enumerate(_iter_pages(pdf.pages)):
             text = page.extract_text()
             if not text:
                 continue
@@ -2289,6 +3269,8 @@ def extract_coverage_generic(pdf_path):
                 "보장내역", "가입담보", "보장항목"
             ]):
                 continue
+            if section.skip(page_num, text):
+                break
 
             tables = page.extract_tables({
                 "vertical_strategy": "lines",
@@ -2302,6 +3284,7 @@ def extract_coverage_generic(pdf_path):
                     "vertical_strategy": "text",
                     "horizontal_strategy": "text",
                 })
+            section.feed(page_num, tables, text)
 
             for table in tables:
                 if not table or len(table) < 2:
@@ -2399,45 +3382,6 @@ def extract_coverage_generic(pdf_path):
                                     break
 
                     if name and amount:
-                        if not any(r["특약명"] == name for r in results):
-                            results.append({"특약명": name, "가입금액": amount})
+                        results.add(name, amount)
 
-    return results
-
-
-def parse_amount(text):
-    """금액 텍스트를 숫자(원 단위)로 변환"""
-    if not text:
-        return None
-    text = text.replace(" ", "").replace(",", "")
-
-    if re.search(r'[가-힣]{2,}', text) and "원" not in text and "만" not in text and "억" not in text:
-        return None
-
-    match = re.search(r'(\d+)(억원|억)', text)
-    if match:
-        return int(match.group(1)) * 100000000
-
-    match = re.search(r'(\d+)(천만원)', text)
-    if match:
-        return int(match.group(1)) * 10000000
-
-    match = re.search(r'(\d+)(백만원|백만)', text)
-    if match:
-        return int(match.group(1)) * 1000000
-
-    match = re.search(r'(\d+)(만원|만)', text)
-    if match:
-        return int(match.group(1)) * 10000
-
-    match = re.search(r'(\d+)(천원)', text)
-    if match:
-        return int(match.group(1)) * 1000
-
-    match = re.search(r'(\d+)(원)?$', text)
-    if match:
-        num = int(match.group(1))
-        if num >= 10000:
-            return num
-
-    return None
+    return results.items
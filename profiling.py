@@ -0,0 +1,175 @@
+"""운영 중 프로파일링 (관리자 토큰 필요)
+
+고객 PDF는 밖으로 가져올 수 없어서 느린 PDF를 로컬에서 재현하기 어렵다. 운영 트래픽에서
+pdf_parser.py/matcher.py의 어느 함수가 시간을 쓰는지 서버 안에서 바로 본다.
+
+  - RequestProfiler: 요청 1건 프로파일 (X-Profile 헤더 또는 ?profile=)
+      pstats    — cProfile 결과 (누적 시간 상위 PROFILE_TOP_N개 함수)
+      collapsed — 요청을 처리하는 워커 스레드만 샘플링한 collapsed stack
+  - StackSampler: 워커 전체 스택 샘플링 (/debug/profile?seconds=N)
+      collapsed — `a.py:f;b.py:g 12` (flamegraph.pl, speedscope 입력)
+      top       — 함수별 self/total 샘플 수
+
+관리자 토큰(ADMIN_TOKEN)이 설정되지 않으면 전부 비활성화된다.
+"""
+import cProfile
+import functools
+import hmac
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+PROFILE_MAX_SEC = float(os.environ.get("PROFILE_MAX_SEC", "60"))
+PROFILE_SAMPLE_INTERVAL_SEC = float(os.environ.get("PROFILE_SAMPLE_INTERVAL_SEC", "0.005"))
+PROFILE_TOP_N = 60
+
+REQUEST_FORMATS = ("pstats", "collapsed")
+SAMPLER_FORMATS = ("collapsed", "top")
+
+# 일감을 기다리는 스레드(스레드풀 워커, 이벤트 루프, Event/Condition 대기)의 리프 프레임
+_IDLE_LEAVES = {"thread.py:_worker", "selectors.py:select", "threading.py:wait", "queue.py:get"}
+
+
+def admin_enabled():
+    return bool(ADMIN_TOKEN)
+
+
+def check_admin_token(token):
+    """관리자 토큰 확인 (ADMIN_TOKEN 미설정이면 항상 False)"""
+    return admin_enabled() and hmac.compare_digest((token or "").encode(), ADMIN_TOKEN.encode())
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _stack_key(frame):
+    """프레임 → 루트부터 리프까지 `a;b;c`"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class StackSampler:
+    """주기적으로 sys._current_frames()를 읽어 스택별 샘플 수를 센다
+
+    all_threads면 샘플러 자신을 뺀 모든 스레드(일감 대기 중인 스레드 제외),
+    아니면 add_thread()로 등록한 스레드만.
+    """
+
+    def __init__(self, interval_sec=PROFILE_SAMPLE_INTERVAL_SEC, all_threads=True):
+        self.interval_sec = interval_sec
+        self.thread_ids = None if all_threads else set()
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_thread(self, thread_id):
+        if self.thread_ids is not None:
+            self.thread_ids.add(thread_id)
+
+    def remove_thread(self, thread_id):
+        if self.thread_ids is not None:
+            self.thread_ids.discard(thread_id)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="profile-sampler")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_sec):
+            targets = self.thread_ids
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (targets is not None and thread_id not in targets):
+                    continue
+                if targets is None and _frame_label(frame) in _IDLE_LEAVES:
+                    continue
+                self.stacks[_stack_key(frame)] += 1
+            self.samples += 1
+
+    def collapsed(self):
+        """collapsed stack 텍스트 (샘플 수 내림차순)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, limit=PROFILE_TOP_N):
+        """함수별 self(리프)/total(스택에 포함) 샘플 수"""
+        self_counts, total_counts = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            labels = stack.split(";")
+            self_counts[labels[-1]] += count
+            for label in set(labels):
+                total_counts[label] += count
+        lines = [f"# {self.samples} samples, interval {self.interval_sec * 1000:g}ms",
+                 f"{'self':>8} {'total':>8}  function"]
+        for label, total in total_counts.most_common(limit):
+            lines.append(f"{self_counts[label]:>8} {total:>8}  {label}")
+        return "\n".join(lines) + "\n"
+
+    def render(self, output_format):
+        return self.collapsed() if output_format == "collapsed" else self.top()
+
+
+class RequestProfiler:
+    """요청 1건 프로파일 — wrap(fn)으로 감싼 함수 실행 구간만 측정 (워커 스레드)"""
+
+    def __init__(self, output_format):
+        self.output_format = output_format
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+        if output_format == "pstats":
+            self._profile = cProfile.Profile()
+            self._sampler = None
+        else:
+            self._profile = None
+            self._sampler = StackSampler(all_threads=False).start()
+
+    def wrap(self, fn):
+        @functools.wraps(fn)
+        def _profiled(*args, **kwargs):
+            if self._profile is not None:
+                # cProfile은 호출한 스레드만 측정 — 같은 요청의 워커 호출은 순차 실행
+                with self._lock:
+                    self._profile.enable()
+                    try:
+                        return fn(*args, **kwargs)
+                    finally:
+                        self._profile.disable()
+            thread_id = threading.get_ident()
+            self._sampler.add_thread(thread_id)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._sampler.remove_thread(thread_id)
+        return _profiled
+
+    def render(self):
+        """프로파일 결과 텍스트 (샘플러는 여기서 정지)"""
+        elapsed_ms = (time.monotonic() - self.started_at) * 1000
+        if self._profile is None:
+            self._sampler.stop()
+            return self._sampler.collapsed()
+        out = io.StringIO()
+        out.write(f"# request {elapsed_ms:.1f}ms\n")
+        stats = pstats.Stats(self._profile, stream=out)
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        return out.getvalue()
+
+    def close(self):
+        if self._sampler is not None:
+            self._sampler.stop()
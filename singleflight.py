@@ -0,0 +1,135 @@
+"""동일 작업 합치기 (single-flight)
+
+프론트엔드는 같은 업로드로 /api/parse-pdf와 /api/match-with-summary를 거의 동시에 호출하고,
+더블클릭은 같은 /api/match를 두 번 보낸다. 같은 키의 작업이 이미 진행 중이면 새로 실행하지 않고
+진행 중인 작업의 결과(또는 예외)를 함께 받는다.
+
+  - SingleFlight: 워커 스레드용 (PDF 내용 해시 → parse_pdf_all_in_one 결과)
+  - AsyncSingleFlight: 이벤트 루프용 (업로드 내용 해시 + 파라미터 → 엔드포인트 결과)
+
+끝난 작업의 결과는 보관하지 않는다 (캐시가 아님). 실행/공유 횟수는 stats()로 노출한다.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+
+
+def content_key(*parts):
+    """bytes/문자열/JSON 직렬화 가능한 값들로 작업 키 생성 (sha256)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray)):
+            data = hashlib.sha256(part).digest()
+        elif isinstance(part, str):
+            data = part.encode()
+        else:
+            data = json.dumps(part, ensure_ascii=False, sort_keys=True, default=str).encode()
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """파일 내용 sha256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """스레드 간 동일 작업 합치기 — 먼저 온 스레드가 실행하고 나머지는 결과를 기다린다"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """fn(*args, **kwargs) 결과 — 같은 key가 진행 중이면 그 결과를 공유 (key가 None이면 그냥 실행)"""
+        if key is None:
+            return fn(*args, **kwargs)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            in_flight = len(self._calls)
+        return {"executed": self.executed, "shared": self.shared, "in_flight": in_flight}
+
+
+def _forget_when_done(tasks, key):
+    """태스크 완료 콜백 — 키 제거 + 아무도 기다리지 않는 예외 회수 (경고 방지)"""
+    def _forget(task):
+        if tasks.get(key) is task:
+            del tasks[key]
+        if not task.cancelled():
+            task.exception()
+    return _forget
+
+
+class AsyncSingleFlight:
+    """코루틴 동일 작업 합치기
+
+    작업은 별도 태스크로 실행하므로 먼저 요청한 클라이언트가 연결을 끊어도
+    기다리는 다른 요청은 결과를 받는다.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key, fn, *args, **kwargs):
+        """await fn(*args, **kwargs) 결과 — 같은 key가 진행 중이면 그 결과를 공유 (key가 None이면 그냥 실행)"""
+        if key is None:
+            return await fn(*args, **kwargs)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(_forget_when_done(self._tasks, key))
+            self.executed += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def running(self, key):
+        """key 작업이 진행 중인지 (do() 직전에 확인하면 결과를 공유받을지 알 수 있다)"""
+        return key is not None and key in self._tasks
+
+    def stats(self):
+        return {"executed": self.executed, "shared": self.shared, "in_flight": len(self._tasks)}
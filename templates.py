@@ -0,0 +1,173 @@
+"""보장분석표 Excel 템플릿 등록 (템플릿 id로 매칭)
+
+/api/match 호출마다 같은 보장분석표 워크북을 올리고, 디스크 저장 → shutil.copy2 →
+find_structure → PDF마다 read_excel_coverages / write_* (매번 load_workbook + save)를 반복한다.
+
+템플릿은 워크북을 한 번 등록해서
+  - 시트별 구조(insurer_row, product_row, premium_row, start_row)와 특약 행 목록을 미리 계산하고
+  - 매칭 결과 파일은 보관된 워크북 내용으로 메모리에서 열어(디스크 복사 없음) 한 번에 기록/저장한다.
+
+템플릿 id는 워크북 내용 해시라서 같은 파일을 다시 등록하면 같은 id가 나온다.
+워크북은 TEMPLATE_DIR에 저장되어 재시작 후에도 유지된다 (구조는 처음 사용할 때 다시 계산).
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+
+import openpyxl
+
+from excel_handler import sheet_coverages, sheet_structure
+
+TEMPLATE_DIR = os.environ.get("TEMPLATE_DIR", os.path.join(tempfile.gettempdir(), "insurance_matcher_templates"))
+TEMPLATE_MAX_COUNT = int(os.environ.get("TEMPLATE_MAX_COUNT", "100"))
+_DEFAULT_START_ROW = 8
+
+
+class TemplateRegistryFull(Exception):
+    """등록된 템플릿이 TEMPLATE_MAX_COUNT개 이상"""
+
+
+class TemplateSheet:
+    """템플릿 시트 1개의 미리 계산한 구조 + 특약 행"""
+
+    def __init__(self, structure, coverage_rows):
+        self.structure = structure
+        self.start_row = structure["start_row"] or _DEFAULT_START_ROW
+        self.coverage_rows = coverage_rows   # [(행 번호, 특약명)]
+
+    def coverages(self, amount_col):
+        """read_excel_coverages와 같은 형식의 특약 목록 (amount_col: 이 PDF의 가입금액 열)"""
+        return [{"row": row, "특약명": name, "amount_col": amount_col} for row, name in self.coverage_rows]
+
+    def to_dict(self):
+        return {
+            "structure": self.structure,
+            "coverage_rows": [{"row": row, "특약명": name} for row, name in self.coverage_rows],
+        }
+
+
+class Template:
+    """등록된 보장분석표 워크북"""
+
+    def __init__(self, template_id, filename, content, created_at=None):
+        self.id = template_id
+        self.filename = filename
+        self.content = content
+        self.created_at = created_at or time.time()
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    def open_workbook(self):
+        """보관된 워크북을 메모리에서 새로 연다 (결과 파일마다 독립된 사본)"""
+        return openpyxl.load_workbook(io.BytesIO(self.content))
+
+    def sheet(self, sheet_name=None):
+        """시트 구조 + 특약 행 (처음 요청할 때 계산해서 보관, sheet_name이 없으면 활성 시트)"""
+        with self._lock:
+            sheet = self._sheets.get(sheet_name)
+            if sheet is None:
+                wb = self.open_workbook()
+                try:
+                    ws = wb[sheet_name] if sheet_name else wb.active
+                    structure = sheet_structure(ws, 2)
+                    start_row = structure["start_row"] or _DEFAULT_START_ROW
+                    coverage_rows = [(c["row"], c["특약명"]) for c in sheet_coverages(ws, 2, 4, start_row)]
+                finally:
+                    wb.close()
+                sheet = self._sheets[sheet_name] = TemplateSheet(structure, coverage_rows)
+            return sheet
+
+    def to_dict(self, sheet_name=None):
+        return {
+            "template_id": self.id,
+            "filename": self.filename,
+            "size": len(self.content),
+            "created_at": self.created_at,
+            "sheet_name": sheet_name,
+            **self.sheet(sheet_name).to_dict(),
+        }
+
+
+class TemplateRegistry:
+    """템플릿 id → Template (TEMPLATE_DIR에 워크북 + 메타데이터 저장)"""
+
+    def __init__(self, root=TEMPLATE_DIR, max_count=TEMPLATE_MAX_COUNT):
+        self.root = root
+        self.max_count = max_count
+        self._templates = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _paths(self, template_id):
+        base = os.path.join(self.root, template_id)
+        return base + ".xlsx", base + ".json"
+
+    def _load(self):
+        """저장된 템플릿 다시 읽기 (읽을 수 없는 항목은 건너뜀)"""
+        if not os.path.isdir(self.root):
+            return
+        for name in os.listdir(self.root):
+            if not name.endswith(".json"):
+                continue
+            template_id = name[:-len(".json")]
+            xlsx_path, meta_path = self._paths(template_id)
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(xlsx_path, "rb") as f:
+                    content = f.read()
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Template {template_id} could not be loaded: {e}")
+                continue
+            self._templates[template_id] = Template(template_id, meta["filename"], content, meta["created_at"])
+
+    def register(self, filename, content, sheet_name=None):
+        """워크북 등록 (같은 내용이면 기존 템플릿) — 구조를 바로 계산해서 잘못된 파일은 여기서 실패"""
+        template_id = hashlib.sha256(content).hexdigest()[:32]
+        with self._lock:
+            template = self._templates.get(template_id)
+        if template is None:
+            template = Template(template_id, filename, content)
+            template.sheet(sheet_name)
+            with self._lock:
+                if len(self._templates) >= self.max_count:
+                    raise TemplateRegistryFull(f"등록된 템플릿이 너무 많습니다 ({len(self._templates)}개)")
+                self._templates[template_id] = template
+            self._save(template)
+        else:
+            template.sheet(sheet_name)
+        return template
+
+    def _save(self, template):
+        xlsx_path, meta_path = self._paths(template.id)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(xlsx_path, "wb") as f:
+                f.write(template.content)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"filename": template.filename, "created_at": template.created_at}, f, ensure_ascii=False)
+        except OSError as e:
+            # 저장 실패 시에도 이번 프로세스에서는 사용 가능
+            print(f"[WARN] Template {template.id} could not be saved: {e}")
+
+    def get(self, template_id):
+        with self._lock:
+            return self._templates.get(template_id)
+
+    def delete(self, template_id):
+        with self._lock:
+            template = self._templates.pop(template_id, None)
+        if template is None:
+            return False
+        for path in self._paths(template_id):
+            if os.path.exists(path):
+                os.unlink(path)
+        return True
+
+    def stats(self):
+        with self._lock:
+            return {"count": len(self._templates), "max_count": self.max_count}
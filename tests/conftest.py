@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 평면 모듈 구조 — 저장소 루트를 import 경로에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
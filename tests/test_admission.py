@@ -0,0 +1,111 @@
+"""AdmissionController 수용 제어 테스트"""
+import asyncio
+
+import pytest
+
+from admission import AdmissionController, AdmissionRejected, request_weight
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_request_weight():
+    assert request_weight([]) == 0
+    assert request_weight([None, 0]) == 2
+    assert request_weight([10 * 1024 * 1024]) == pytest.approx(1 + 10 / 5)
+
+
+def test_admits_within_capacity_and_caps_weight():
+    async def scenario():
+        controller = AdmissionController(capacity=4, max_queue=2, max_wait_sec=1)
+        ticket = await controller.acquire(10)
+        assert ticket[0] == 4
+        assert controller.stats()["in_use"] == 4
+        controller.release(ticket)
+        assert controller.stats()["in_use"] == 0
+        assert controller.stats()["active"] == 0
+    _run(scenario())
+
+
+def test_queue_full_is_429():
+    async def scenario():
+        controller = AdmissionController(capacity=1, max_queue=1, max_wait_sec=5)
+        ticket = await controller.acquire(1)
+        waiter = asyncio.ensure_future(controller.acquire(1))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire(1)
+        assert exc.value.status_code == 429
+        assert exc.value.retry_after >= 1
+        controller.release(ticket)
+        controller.release(await waiter)
+    _run(scenario())
+
+
+def test_wait_timeout_is_503():
+    async def scenario():
+        controller = AdmissionController(capacity=1, max_queue=4, max_wait_sec=0.05)
+        ticket = await controller.acquire(1)
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire(1)
+        assert exc.value.status_code == 503
+        assert controller.stats()["queue_depth"] == 0
+        assert controller.stats()["rejected_timeout"] == 1
+        controller.release(ticket)
+    _run(scenario())
+
+
+def test_release_wakes_waiters_in_order():
+    async def scenario():
+        controller = AdmissionController(capacity=2, max_queue=4, max_wait_sec=5)
+        ticket = await controller.acquire(2)
+        order = []
+
+        async def request(name, weight):
+            t = await controller.acquire(weight)
+            order.append(name)
+            return t
+
+        big = asyncio.ensure_future(request("big", 2))
+        await asyncio.sleep(0)
+        small = asyncio.ensure_future(request("small", 1))
+        await asyncio.sleep(0)
+        controller.release(ticket)
+        controller.release(await big)
+        controller.release(await small)
+        assert order == ["big", "small"]
+    _run(scenario())
+
+
+def test_timed_out_head_wakes_smaller_waiter_behind_it():
+    async def scenario():
+        controller = AdmissionController(capacity=4, max_queue=4, max_wait_sec=0.05)
+        ticket = await controller.acquire(3)
+        head = asyncio.ensure_future(controller.acquire(4))
+        await asyncio.sleep(0.01)
+        small = asyncio.ensure_future(controller.acquire(1))
+        with pytest.raises(AdmissionRejected):
+            await head
+        small_ticket = await small
+        assert small_ticket[0] == 1
+        assert controller.stats()["in_use"] == 4
+        controller.release(small_ticket)
+        controller.release(ticket)
+    _run(scenario())
+
+
+def test_cancelled_head_wakes_smaller_waiter_behind_it():
+    async def scenario():
+        controller = AdmissionController(capacity=4, max_queue=4, max_wait_sec=5)
+        ticket = await controller.acquire(3)
+        head = asyncio.ensure_future(controller.acquire(4))
+        await asyncio.sleep(0)
+        small = asyncio.ensure_future(controller.acquire(1))
+        await asyncio.sleep(0)
+        head.cancel()
+        small_ticket = await asyncio.wait_for(small, 1)
+        assert controller.stats()["queue_depth"] == 0
+        controller.release(small_ticket)
+        controller.release(ticket)
+    _run(scenario())
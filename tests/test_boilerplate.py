@@ -0,0 +1,85 @@
+"""BoilerplateIndex 학습/확정/학습 취소/저장 테스트"""
+import json
+
+import boilerplate
+from boilerplate import BoilerplateIndex, page_fingerprint
+
+PAGES = ["약관 요약\n가입금액 안내", "보장명 가입금액\n암진단비 1,000만원", "유의사항"]
+
+
+def _index(tmp_path=None, **kwargs):
+    path = str(tmp_path / "index.json") if tmp_path is not None else ""
+    return BoilerplateIndex(path=path, **{"min_seen": 2, "recheck_rate": 0, **kwargs})
+
+
+def test_fingerprint_ignores_whitespace():
+    assert page_fingerprint("약관 요약\n가입금액") == page_fingerprint("약관요약  가입금액")
+    assert page_fingerprint("약관 요약") != page_fingerprint("약관 요약 2")
+
+
+def test_promoted_after_min_seen_observations():
+    index = _index()
+    index.observe(PAGES, [0], [1])
+    assert index.known_pages(PAGES, [0, 1, 2]) == set()
+    index.observe(PAGES, [0], [1])
+    assert index.known_pages(PAGES, [0, 1, 2]) == {0}
+    stats = index.stats()
+    assert stats["learned"] == 1
+    assert stats["known_pages"] == 1 and stats["coverage_pages"] == 1
+
+
+def test_coverage_page_is_never_learned():
+    index = _index()
+    index.observe(PAGES, [], [1])
+    for _ in range(3):
+        index.observe(PAGES, [1], [])
+    assert index.known_pages(PAGES, [1]) == set()
+
+
+def test_coverages_on_known_page_unlearn_it():
+    index = _index()
+    index.observe(PAGES, [0], [])
+    index.observe(PAGES, [0], [])
+    assert index.known_pages(PAGES, [0]) == {0}
+    index.observe(PAGES, [], [0])
+    assert index.known_pages(PAGES, [0]) == set()
+    assert index.stats()["unlearned"] == 1
+
+
+def test_recheck_returns_known_page_for_extraction():
+    index = _index(recheck_rate=1.0)
+    index.observe(PAGES, [0], [])
+    index.observe(PAGES, [0], [])
+    assert index.known_pages(PAGES, [0]) == set()
+    assert index.stats()["rechecks"] == 1
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = _index(tmp_path)
+    index.observe(PAGES, [0], [1])
+    index.observe(PAGES, [0], [1])   # 확정 시 바로 저장
+    data = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+    assert data["version"] == boilerplate._INDEX_VERSION
+
+    reloaded = _index(tmp_path)
+    assert reloaded.known_pages(PAGES, [0, 1]) == {0}
+    reloaded.observe(PAGES, [1], [])
+    assert reloaded.known_pages(PAGES, [1]) == set()
+
+
+def test_load_ignores_other_version_and_corrupt_file(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text(json.dumps({"version": 0, "pages": [[page_fingerprint(PAGES[0]), 5]]}), encoding="utf-8")
+    assert _index(tmp_path).known_pages(PAGES, [0]) == set()
+    path.write_text("{", encoding="utf-8")
+    assert _index(tmp_path).known_pages(PAGES, [0]) == set()
+
+
+def test_file_write_happens_outside_index_lock(tmp_path, monkeypatch):
+    index = _index(tmp_path)
+    held = []
+    write = index._write
+    monkeypatch.setattr(index, "_write", lambda data: (held.append(index._lock.locked()), write(data)))
+    index.observe(PAGES, [0], [])
+    index.observe(PAGES, [0], [])
+    assert held and not any(held)
@@ -0,0 +1,83 @@
+"""CoverageCollector 병합 정책(first/max), rename 테스트"""
+import pytest
+
+from coverage_record import POLICY_FIRST, POLICY_MAX, Coverage, CoverageCollector, coverages_to_dicts
+
+
+def _pairs(collector):
+    return [(c.name, c.amount) for c in collector]
+
+
+def test_first_keeps_first_item():
+    collector = CoverageCollector()
+    assert collector.policy == POLICY_FIRST
+    assert collector.add("암진단비", 10000000)
+    assert collector.add("뇌출혈진단비", 5000000)
+    assert not collector.add("암진단비", 30000000)
+    assert _pairs(collector) == [("암진단비", 10000000), ("뇌출혈진단비", 5000000)]
+    assert len(collector) == 2
+    assert "암진단비" in collector
+    assert "상해사망" not in collector
+
+
+def test_max_keeps_larger_amount_in_first_position():
+    collector = CoverageCollector(POLICY_MAX)
+    collector.add("암진단비", 10000000)
+    collector.add("뇌출혈진단비", 5000000)
+    assert not collector.add("암진단비", 30000000, grade14=200000)
+    assert not collector.add("암진단비", 20000000)
+    assert _pairs(collector) == [("암진단비", 30000000), ("뇌출혈진단비", 5000000)]
+    assert collector.get("암진단비").grade14 == 200000
+
+
+def test_max_treats_missing_amount_as_zero():
+    collector = CoverageCollector(POLICY_MAX)
+    collector.add("질병입원일당", None)
+    collector.add("질병입원일당", 20000)
+    collector.add("질병입원일당", None)
+    assert _pairs(collector) == [("질병입원일당", 20000)]
+
+
+@pytest.mark.parametrize("policy, expected", [
+    (POLICY_FIRST, [("암진단비", 10000000), ("상해사망", 100000000)]),
+    (POLICY_MAX, [("암진단비", 30000000), ("상해사망", 100000000)]),
+])
+def test_extend_applies_policy(policy, expected):
+    collector = CoverageCollector(policy)
+    collector.extend([Coverage("암진단비", 10000000), Coverage("상해사망", 100000000), Coverage("암진단비", 30000000)])
+    assert _pairs(collector) == expected
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        CoverageCollector("last")
+
+
+def test_rename_updates_index():
+    collector = CoverageCollector()
+    collector.add("암진단비", 10000000)
+    collector.add("뇌출혈진단비", 5000000)
+    assert collector.rename("암진단비", "일반암진단비")
+    assert "암진단비" not in collector
+    assert collector.get("일반암진단비").amount == 10000000
+    assert _pairs(collector) == [("일반암진단비", 10000000), ("뇌출혈진단비", 5000000)]
+    # 바뀐 이름으로 중복 검사
+    assert not collector.add("일반암진단비", 1)
+    assert collector.add("암진단비", 20000000)
+
+
+def test_rename_refuses_missing_or_existing_name():
+    collector = CoverageCollector()
+    collector.add("암진단비", 10000000)
+    collector.add("뇌출혈진단비", 5000000)
+    assert not collector.rename("상해사망", "질병사망")
+    assert not collector.rename("암진단비", "뇌출혈진단비")
+    assert _pairs(collector) == [("암진단비", 10000000), ("뇌출혈진단비", 5000000)]
+
+
+def test_to_dicts():
+    items = [Coverage("암진단비", 10000000), Coverage("자동차사고부상", 300000, grade14=200000)]
+    assert coverages_to_dicts(items) == [
+        {"특약명": "암진단비", "가입금액": 10000000},
+        {"특약명": "자동차사고부상", "가입금액": 300000, "14급지급액": 200000},
+    ]
@@ -0,0 +1,61 @@
+"""Deadline 시간 예산 테스트"""
+import time
+
+import pytest
+
+from deadline import Deadline
+
+
+def test_unlimited_budget():
+    deadline = Deadline(0)
+    assert deadline.remaining() is None
+    assert not deadline.expired()
+    assert deadline.timeout(15) == 15
+    assert deadline.allow("tables", reserve_sec=1000)
+    assert not deadline.partial
+
+
+def test_timeout_is_capped_by_remaining():
+    deadline = Deadline(5)
+    assert 4 < deadline.timeout(15) <= 5
+    assert deadline.timeout(1) == 1
+
+
+def test_allow_records_skipped_stage_once():
+    deadline = Deadline(1)
+    assert deadline.allow("tables")
+    assert not deadline.allow("tables", reserve_sec=10)
+    assert not deadline.allow("tables", reserve_sec=10)
+    assert deadline.skipped == ["tables"]
+    assert deadline.partial
+
+
+def test_expired():
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+    assert not deadline.allow("pymupdf")
+
+
+def test_child_shares_expiry_but_not_skipped_stages():
+    parent = Deadline(10)
+    child = parent.child()
+    assert child.expires_at == parent.expires_at
+    assert not child.allow("tables", reserve_sec=100)
+    assert child.partial
+    assert not parent.partial
+
+
+def test_memory_wait_is_capped_by_time_budget(monkeypatch):
+    import pdf_parser
+
+    budget = pdf_parser._MemoryBudget(100)
+    budget.acquire(100, 0)
+    monkeypatch.setattr(pdf_parser, "_memory_budget", budget)
+    monkeypatch.setattr(pdf_parser, "PDF_MEMORY_WAIT_SEC", 120)
+    start = time.monotonic()
+    with pytest.raises(pdf_parser.ParseOverloaded):
+        pdf_parser.parse_pdf_all_in_one("missing.pdf", deadline=Deadline(0.2))
+    assert time.monotonic() - start < 2
+    assert budget.waiting == 0
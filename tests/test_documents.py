@@ -0,0 +1,64 @@
+"""DocumentStore 보관/재사용/만료 테스트"""
+import time
+
+import pytest
+
+from documents import DocumentNotFound, DocumentStore
+
+
+def _pdf_info(partial=False):
+    return {
+        "insurer_code": "kb", "insurer_name": "KB손해보험", "product_name": "KB 건강보험",
+        "premium": 50000, "coverages": [], "partial": partial,
+    }
+
+
+def test_put_get_delete():
+    store = DocumentStore()
+    document = store.put("a.pdf", _pdf_info(), "d1", 100)
+    assert store.get(document.id) is document
+    assert document.to_dict()["insurer_code"] == "kb"
+    assert store.delete(document.id)
+    assert store.get(document.id) is None
+    assert not store.delete(document.id)
+
+
+def test_find_parsed_reuses_complete_results_only():
+    store = DocumentStore()
+    complete = store.put("a.pdf", _pdf_info(), "d1", 100)
+    store.put("b.pdf", _pdf_info(partial=True), "d2", 100)
+    assert store.find_parsed("d1") is complete.pdf_info
+    assert store.find_parsed("d2") is None
+    assert store.stats()["reused"] == 1
+    store.delete(complete.id)
+    assert store.find_parsed("d1") is None
+
+
+def test_get_many_keeps_order_and_reports_missing():
+    store = DocumentStore()
+    a = store.put("a.pdf", _pdf_info(), "d1", 100)
+    b = store.put("b.pdf", _pdf_info(), "d2", 100)
+    assert store.get_many([b.id, a.id]) == [b, a]
+    with pytest.raises(DocumentNotFound) as exc:
+        store.get_many([a.id, "nope", "gone"])
+    assert exc.value.missing == ["nope", "gone"]
+
+
+def test_max_count_evicts_least_recently_used():
+    store = DocumentStore(max_count=2)
+    a = store.put("a.pdf", _pdf_info(), "d1", 100)
+    b = store.put("b.pdf", _pdf_info(), "d2", 100)
+    store.get(a.id)
+    c = store.put("c.pdf", _pdf_info(), "d3", 100)
+    assert store.get(b.id) is None
+    assert store.get(a.id) is a and store.get(c.id) is c
+    assert store.find_parsed("d2") is None
+
+
+def test_ttl_expiry():
+    store = DocumentStore(ttl_sec=0.01)
+    document = store.put("a.pdf", _pdf_info(), "d1", 100)
+    time.sleep(0.02)
+    assert store.get(document.id) is None
+    assert store.find_parsed("d1") is None
+    assert store.stats()["count"] == 0
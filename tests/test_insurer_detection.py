@@ -0,0 +1,39 @@
+"""보험사 감지 회귀 테스트 — 키워드 표 통합 전 구현(benchmarks/insurer_detection.py)과 비교"""
+import unicodedata
+
+import pytest
+
+from benchmarks.insurer_detection import legacy_detect_insurer_from_text, mismatches
+from pdf_parser import _detect_insurer_from_text, _detect_insurer_provisional
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("메리츠화재 삼성생명", "samsung_life"),      # 우선순위가 위치보다 앞선다
+    ("KB손해보험 한화", "kb"),
+    ("문의 WWW.KBINSURE.CO.KR", "kb"),
+    ("LINA.co.kr 고객센터", "lina"),
+    ("고객센터 1566-7711", "meritz"),
+    ("프로미라이프 건강보험", "db"),
+    ("삼성 건강보험", "samsung_life"),
+    ("삼성 자동차보험", "samsung"),
+    ("가입설계서", None),
+])
+def test_priority_and_fallbacks(text, expected):
+    assert _detect_insurer_from_text(text) == expected
+    assert legacy_detect_insurer_from_text(text) == expected
+
+
+def test_random_keyword_mixes_match_legacy():
+    assert mismatches(20000) == []
+
+
+def test_decomposed_hangul_is_normalized():
+    assert _detect_insurer_from_text(unicodedata.normalize("NFD", "흥국생명")) == "heungkuk"
+
+
+def test_provisional_uses_metadata():
+    class _Doc:
+        metadata = {"title": "무배당 건강보험", "author": "라이나생명", "producer": None}
+
+    assert _detect_insurer_provisional(_Doc(), "보험가입제안서") == "lina"
+    assert _detect_insurer_provisional(object(), "보험가입제안서") is None
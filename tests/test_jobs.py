@@ -0,0 +1,91 @@
+"""JobQueue 작업 제출/상태/결과/만료 테스트"""
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from admission import LANE_BULK, Lane
+from jobs import STATUS_DONE, STATUS_FAILED, STATUS_QUEUED, JobQueue, JobQueueFull
+
+
+def _wait(job, timeout=5):
+    end = time.monotonic() + timeout
+    while job.status not in (STATUS_DONE, STATUS_FAILED):
+        assert time.monotonic() < end, "작업이 끝나지 않음"
+        time.sleep(0.01)
+    return job
+
+
+def test_submit_saves_files_and_reports_progress(tmp_path):
+    jobs = JobQueue(workers=1, root=str(tmp_path))
+
+    def run(job):
+        with open(job.file_path("0.pdf"), "rb") as f:
+            content = f.read()
+        job.item_finished(0, size=len(content))
+        job.item_finished(1, size=0)
+        return {"ok": True}
+
+    job = _wait(jobs.submit("json", ["a.pdf", "b.pdf"], {"0.pdf": b"%PDF"}, run))
+    assert jobs.get(job.id) is job
+    assert job.result == {"ok": True}
+    status = job.to_dict()
+    assert status["status"] == STATUS_DONE
+    assert status["progress"]["done"] == 2
+    assert status["progress"]["items"][0] == {"name": "a.pdf", "status": STATUS_DONE, "size": 4}
+    assert jobs.stats()[STATUS_DONE] == 1
+
+
+def test_failed_job_keeps_error():
+    jobs = JobQueue(workers=1)
+
+    def run(job):
+        raise ValueError("엑셀 시트 없음")
+
+    job = _wait(jobs.submit("json", ["a.pdf"], {}, run))
+    assert job.status == STATUS_FAILED
+    assert job.error == "엑셀 시트 없음"
+    assert "ValueError" in job.traceback
+
+
+def test_submit_rejected_when_pending_full():
+    jobs = JobQueue(workers=1, max_pending=1)
+    release = threading.Event()
+    running = jobs.submit("json", [], {}, lambda job: release.wait(5))
+    while running.status == STATUS_QUEUED:
+        time.sleep(0.01)
+    queued = jobs.submit("json", [], {}, lambda job: None)
+    with pytest.raises(JobQueueFull):
+        jobs.submit("json", [], {}, lambda job: None)
+    release.set()
+    _wait(queued)
+
+
+def test_finished_jobs_expire_with_workdir():
+    jobs = JobQueue(workers=1, ttl_sec=0.05)
+    job = _wait(jobs.submit("json", ["a.pdf"], {"0.pdf": b"%PDF"}, lambda job: {}))
+    assert os.path.isdir(job.workdir)
+    time.sleep(0.1)
+    assert jobs.get(job.id) is None
+    assert not os.path.exists(job.workdir)
+
+
+def test_run_from_thread_holds_lane_ticket():
+    lane = Lane(LANE_BULK)
+    seen = []
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+
+        def work():
+            seen.append(lane.admission.stats()["in_use"])
+            return "done"
+
+        result = await loop.run_in_executor(None, lane.run_from_thread, loop, 2, work)
+        assert result == "done"
+        assert lane.admission.stats()["in_use"] == 0
+
+    asyncio.run(scenario())
+    assert seen == [2]
@@ -0,0 +1,107 @@
+"""korean_amount 회귀 테스트 — 통합 전 보험사별 정규식(benchmarks/amount_parser.py)과 비교"""
+import pytest
+
+from benchmarks.amount_parser import (
+    legacy_extract_kb_amount, legacy_parse_amount, legacy_parse_korean_amount, legacy_parse_meritz_amount,
+)
+from korean_amount import find_korean_amount, parse_amount, parse_korean_amount
+
+
+def _kb_amount(text):
+    return parse_korean_amount(text.replace(' ', ''), scaled=True)
+
+
+def _meritz_amount(text):
+    amount = parse_korean_amount(text.replace(' ', ''), scaled=True)
+    return amount // 10000 if amount else None
+
+
+# 기존 파서와 결과가 같아야 하는 입력 (단일 단위)
+@pytest.mark.parametrize("text", [
+    "1억원", "1억", "5천만원", "3,000만원", "5백만원", "300만원", "20만원", "20만", "1만원",
+    "5천원", "50,000원", "100,000", "2,000", "10", "세부보장참조", "안내참조", "간병인지원",
+    "1천만원", "", "  1,000 만원 ", "80세만기", "20년납", "3천", "2,000천",
+])
+def test_parse_amount_matches_legacy(text):
+    assert parse_amount(text) == legacy_parse_amount(text)
+
+
+@pytest.mark.parametrize("text", ["1억원", "5천만원", "3,000만원", "5백만원", "300만원", "20만원", "1천만원"])
+def test_kb_amount_matches_legacy(text):
+    assert _kb_amount(text) == legacy_parse_korean_amount(text)
+
+
+@pytest.mark.parametrize("text", [
+    "1억원", "1억", "5천만원", "5천만", "5백만원", "300만원", "20만", "세부보장참조", "안내참조", "참조", "간병인지원",
+])
+def test_meritz_amount_matches_legacy(text):
+    assert _meritz_amount(text) == legacy_parse_meritz_amount(text)
+
+
+@pytest.mark.parametrize("line", [
+    "질병사망 1억원", "상해입원일당 2만원", "유사암진단비 1천만원", "수술비 5백만원", "보장내용 세부보장참조",
+])
+def test_kb_line_amount_matches_legacy(line):
+    assert find_korean_amount(line, won_suffix=True) == legacy_extract_kb_amount(line)
+
+
+# 기존 파서가 가장 큰 단위에서 멈추던 복합 금액은 전체 금액
+@pytest.mark.parametrize("text, expected", [
+    ("1억5천만원", 150000000),
+    ("2억5천만원", 250000000),
+    ("1억2천", 120000000),
+    ("1천5백만원", 15000000),
+    ("1백50만원", 1500000),
+])
+def test_compound_amounts(text, expected):
+    assert parse_amount(text) == expected
+    assert parse_korean_amount(text, scaled=True) == expected
+
+
+def test_kb_compound_line_amount():
+    assert legacy_extract_kb_amount("뇌출혈진단비 1억2천만원 100세만기") == 120000000
+    assert find_korean_amount("뇌출혈진단비 1억2천만원 100세만기", won_suffix=True) == 120000000
+    # 콤마 표기: 기존 KB 정규식은 '000만원'만 잡았다
+    assert find_korean_amount("암진단비 3,000만원 20년납", won_suffix=True) == 30000000
+
+
+# 단위 묶음 사이 공백
+@pytest.mark.parametrize("text, expected", [
+    ("1억 5천만원", 150000000),
+    ("1억 5천만", 150000000),
+    ("3천 5백만원", 35000000),
+    ("1억 2천", 120000000),
+    ("5천 만원", 50000000),
+])
+def test_spaces_between_unit_groups(text, expected):
+    assert find_korean_amount(text) == expected
+    assert parse_korean_amount(text) == expected
+
+
+def test_space_does_not_join_unitless_number():
+    assert find_korean_amount("1억 20년") == 100000000
+    assert find_korean_amount("20만 30") == 200000
+    assert parse_korean_amount("1억 20년") is None
+
+
+def test_won_suffix():
+    assert find_korean_amount("1억 5천만원 20년납", won_suffix=True) == 150000000
+    assert find_korean_amount("가입금액 20만 20년납", won_suffix=True) is None
+    assert find_korean_amount("가입금액 20만원", won_suffix=True) == 200000
+
+
+# 억/만 없는 천은 '원'이 붙어야 금액 (셀의 '3천'은 금액 아님)
+@pytest.mark.parametrize("text, expected", [
+    ("3천", None),
+    ("3천원", 3000),
+    ("3천만", 30000000),
+    ("3천만원", 30000000),
+])
+def test_bare_thousand(text, expected):
+    assert parse_amount(text) == expected
+
+
+def test_scaled_requires_eok_or_man():
+    assert parse_korean_amount("50000") == 50000
+    assert parse_korean_amount("50000", scaled=True) is None
+    assert parse_korean_amount("5천원", scaled=True) is None
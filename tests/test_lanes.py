@@ -0,0 +1,81 @@
+"""우선순위 레인(interactive/bulk) 테스트 — 자리·워커 분리, 거절 응답"""
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import admission
+import main
+from admission import LANE_BULK, LANE_INTERACTIVE, AdmissionRejected, Lane
+
+
+@pytest.fixture
+def lanes(monkeypatch):
+    settings = {"capacity": 1, "workers": 1, "max_queue": 1, "max_wait_sec": 0.2}
+    monkeypatch.setattr(admission, "LANE_SETTINGS", {LANE_INTERACTIVE: settings, LANE_BULK: settings})
+    return Lane(LANE_INTERACTIVE), Lane(LANE_BULK)
+
+
+def test_run_uses_lane_worker_thread(lanes):
+    interactive, bulk = lanes
+
+    async def scenario():
+        return await interactive.run(lambda: threading.current_thread().name), \
+            await bulk.run(lambda: threading.current_thread().name)
+
+    names = asyncio.run(scenario())
+    assert names[0].startswith("lane-interactive") and names[1].startswith("lane-bulk")
+
+
+def test_full_bulk_lane_does_not_block_interactive(lanes):
+    interactive, bulk = lanes
+
+    async def scenario():
+        release = threading.Event()
+        bulk_ticket = await bulk.acquire(1)
+        busy = asyncio.ensure_future(bulk.run(release.wait, 5))   # bulk 워커도 점유
+        with pytest.raises(AdmissionRejected):
+            await bulk.acquire(1)                                  # bulk 자리 대기 → 시간 초과
+        ticket = await asyncio.wait_for(interactive.acquire(1), 0.1)
+        assert await asyncio.wait_for(interactive.run(lambda: "ok"), 1) == "ok"
+        interactive.release(ticket)
+        release.set()
+        await busy
+        bulk.release(bulk_ticket)
+        return bulk.stats(), interactive.stats()
+
+    bulk_stats, interactive_stats = asyncio.run(scenario())
+    assert bulk_stats["rejected_timeout"] == 1 and bulk_stats["in_use"] == 0
+    assert interactive_stats["admitted"] == 1 and interactive_stats["max_wait_ms"] < 100
+
+
+def test_iterate_advances_on_lane_worker(lanes):
+    _, bulk = lanes
+    threads = []
+
+    def items():
+        for i in range(3):
+            threads.append(threading.current_thread().name)
+            yield i
+
+    async def scenario():
+        return [item async for item in bulk.iterate(items())]
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+    assert all(name.startswith("lane-bulk") for name in threads)
+
+
+def test_rejection_returns_retry_after(monkeypatch):
+    async def reject(weight):
+        raise AdmissionRejected(429, 7, "요청이 너무 많습니다 (대기 8건)")
+
+    monkeypatch.setattr(main.interactive_lane, "acquire", reject)
+    with TestClient(main.app) as client:
+        response = client.post("/api/parse-pdf", files={"pdf_file": ("a.pdf", b"%PDF-1.4")})
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "7"
+        assert response.json() == {"success": False, "error": "요청이 너무 많습니다 (대기 8건)"}
+        lanes = client.get("/api/admission").json()["lanes"]
+        assert set(lanes) == {LANE_INTERACTIVE, LANE_BULK}
+        assert lanes[LANE_INTERACTIVE]["workers"] == main.interactive_lane.workers
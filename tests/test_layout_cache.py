@@ -0,0 +1,64 @@
+"""레이아웃(테이블 영역) 캐시 지문·검증 테스트"""
+import pytest
+
+import pdf_parser
+from pdf_parser import (
+    _layout_cache_discard,
+    _layout_cache_get,
+    _layout_cache_put,
+    _layout_fingerprint,
+    _layout_keyword_pages,
+    _regions_reach_page_bottom,
+)
+
+PAGES = ["표지\n보험계약자 홍길동", "안내\n\n담보명 가입금액\n암진단비 1,000만원", "약관"]
+HEIGHTS = [842.0, 842.0, 842.0]
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache(monkeypatch):
+    monkeypatch.setattr(pdf_parser, "_layout_cache", pdf_parser.OrderedDict())
+    monkeypatch.setattr(pdf_parser, "_layout_cache_counts", {"hits": 0, "misses": 0, "rejected": 0})
+
+
+def test_fingerprint_uses_header_line_positions():
+    fp = _layout_fingerprint("hanwha", "무배당 건강보험", PAGES)
+    assert fp == ("hanwha", "무배당 건강보험", 3, ((1, 2),))
+    shifted = [PAGES[0], "안내\n담보명 가입금액\n암진단비 1,000만원", PAGES[2]]
+    assert _layout_fingerprint("hanwha", "무배당 건강보험", shifted) != fp
+    assert _layout_fingerprint("hanwha", "무배당 건강보험", PAGES + ["부록"]) != fp
+
+
+def test_no_fingerprint_without_insurer_or_product():
+    assert _layout_fingerprint(None, "무배당 건강보험", PAGES) is None
+    assert _layout_fingerprint("hanwha", "상품명 미확인", PAGES) is None
+
+
+def test_keyword_pages_limited_to_first_20():
+    pages = ["가입금액"] * 25
+    assert _layout_keyword_pages(pages, ["가입금액"]) == frozenset(range(20))
+
+
+def test_hit_miss_and_rejected_by_keyword_pages():
+    fp = _layout_fingerprint("hanwha", "무배당 건강보험", PAGES)
+    regions = {1: [(40, 100, 550, 400)]}
+    assert _layout_cache_get(fp, frozenset({1})) is None
+    _layout_cache_put(fp, regions, frozenset({1}), HEIGHTS)
+    assert _layout_cache_get(fp, frozenset({1})) == regions
+    assert _layout_cache_get(fp, frozenset({1, 2})) is None
+    assert pdf_parser.layout_cache_stats() == {"hits": 1, "misses": 1, "rejected": 1, "entries": 1}
+    _layout_cache_discard(fp)
+    assert _layout_cache_get(fp, frozenset({1})) is None
+
+
+def test_table_reaching_page_bottom_is_not_cached():
+    fp = _layout_fingerprint("hanwha", "무배당 건강보험", PAGES)
+    regions = {1: [(40, 100, 550, 830)]}
+    assert _regions_reach_page_bottom(regions, HEIGHTS)
+    _layout_cache_put(fp, regions, frozenset({1}), HEIGHTS)
+    assert pdf_parser.layout_cache_stats()["entries"] == 0
+
+
+def test_table_at_bottom_of_last_page_is_cached():
+    regions = {2: [(40, 100, 550, 830)]}
+    assert not _regions_reach_page_bottom(regions, HEIGHTS)
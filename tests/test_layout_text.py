@@ -0,0 +1,56 @@
+"""PyMuPDF 단어 좌표 → 레이아웃 텍스트 줄 복원 + 패리티 검사 테스트"""
+from page_text import as_page_text
+from pdf_parser import _layout_text_parity, _pymupdf_layout_text
+
+
+class _FakePage:
+    """get_text("words")만 흉내 — (x0, y0, x1, y1, text, block, line, word)"""
+
+    def __init__(self, words):
+        self._words = words
+
+    def get_text(self, kind):
+        assert kind == "words"
+        return [(x, y, x + 10 * len(t), y + 10, t, 0, 0, n) for n, (x, y, t) in enumerate(self._words)]
+
+
+def test_words_within_tolerance_share_a_line_in_x_order():
+    page = _FakePage([(200, 101, "1,000만원"), (50, 100, "1"), (80, 102.5, "암진단비")])
+    assert _pymupdf_layout_text(page) == "1 암진단비 1,000만원"
+
+
+def test_rows_farther_than_tolerance_split():
+    page = _FakePage([(50, 100, "1"), (80, 100, "암진단비"), (50, 104, "2"), (80, 104, "뇌출혈진단비")])
+    assert _pymupdf_layout_text(page) == "1 암진단비\n2 뇌출혈진단비"
+    assert _pymupdf_layout_text(page, y_tolerance=5) == "1 2 암진단비 뇌출혈진단비"
+
+
+def test_tolerance_chains_from_previous_word():
+    # 줄 묶음 기준은 직전 단어 top — 조금씩 내려가는 단어는 한 줄로 이어진다
+    page = _FakePage([(50, 100, "a"), (60, 103, "b"), (70, 106, "c"), (80, 110, "d")])
+    assert _pymupdf_layout_text(page) == "a b c\nd"
+
+
+def test_empty_page():
+    assert _pymupdf_layout_text(_FakePage([])) == ""
+
+
+FAST = [as_page_text("가입담보\n1\n암진단비\n1,000만원\n2\n뇌출혈진단비\n500만원")]
+
+
+def test_parity_counts_amount_rows():
+    layout = [as_page_text("가입담보\n1 암진단비 1,000만원\n2 뇌출혈진단비 500만원")]
+    assert _layout_text_parity("kb", FAST, layout, {0}) == 2
+
+
+def test_parity_fails_on_merged_rows():
+    layout = [as_page_text("가입담보\n1 암진단비 1,000만원 2 뇌출혈진단비 500만원")]
+    assert _layout_text_parity("kb", FAST, layout, {0}) is None
+
+
+def test_parity_fails_on_lost_amount_or_header():
+    assert _layout_text_parity("kb", FAST, [as_page_text("가입담보\n1 암진단비 1,000만원")], {0}) is None
+    assert _layout_text_parity(
+        "kb", [as_page_text("가입금액 1,000만원")], [as_page_text("1,000만원")], {0}
+    ) is None
+    assert _layout_text_parity("kb", FAST, [as_page_text("")], {0}) is None
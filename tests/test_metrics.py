@@ -0,0 +1,102 @@
+"""Prometheus 텍스트 형식 (HELP/TYPE, 라벨 이스케이프, 히스토그램 누적 버킷) + /metrics"""
+import re
+
+from fastapi.testclient import TestClient
+
+import main
+import metrics
+from metrics import Registry
+
+# 샘플 줄: 이름{라벨} 값
+_SAMPLE = re.compile(r'^[a-z_:][a-z0-9_:]*(\{([a-z_]+="(\\.|[^"\\])*",?)*\})? (-?[0-9.e+-]+|\+Inf)$')
+
+
+def _samples(text, name):
+    return [line for line in text.splitlines() if line.startswith(name + "{") or line.startswith(name + " ")]
+
+
+def test_counter_help_type_and_escaped_labels():
+    registry = Registry()
+    counter = registry.counter("demo_total", "데모 카운터", ("insurer",))
+    counter.inc(insurer='a"b\\c\nd')
+    counter.inc(2, insurer='a"b\\c\nd')
+    text = registry.render()
+    assert text.splitlines()[:2] == [
+        "# HELP insurance_matcher_demo_total 데모 카운터",
+        "# TYPE insurance_matcher_demo_total counter",
+    ]
+    assert 'insurance_matcher_demo_total{insurer="a\\"b\\\\c\\nd"} 3' in text.splitlines()
+    assert text.endswith("\n")
+
+
+def test_histogram_buckets_are_cumulative_with_sum_and_count():
+    registry = Registry()
+    histogram = registry.histogram("demo_seconds", "데모", ("endpoint",), buckets=(1.0, 0.1))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, endpoint="/x")
+    lines = registry.render().splitlines()
+    assert lines[1] == "# TYPE insurance_matcher_demo_seconds histogram"
+    assert lines[2:] == [
+        'insurance_matcher_demo_seconds_bucket{endpoint="/x",le="0.1"} 2',
+        'insurance_matcher_demo_seconds_bucket{endpoint="/x",le="1.0"} 3',
+        'insurance_matcher_demo_seconds_bucket{endpoint="/x",le="+Inf"} 4',
+        'insurance_matcher_demo_seconds_sum{endpoint="/x"} 3.65',
+        'insurance_matcher_demo_seconds_count{endpoint="/x"} 4',
+    ]
+
+
+def test_failing_collector_is_skipped(capsys):
+    registry = Registry()
+
+    @registry.collector
+    def broken():
+        raise RuntimeError("boom")
+
+    @registry.collector
+    def gauges():
+        return [("demo_entries", "gauge", "데모 항목 수", [({}, 7)])]
+
+    text = registry.render()
+    assert "[WARN] Metrics collector broken failed: boom" in capsys.readouterr().out
+    assert text.splitlines() == [
+        "# HELP insurance_matcher_demo_entries 데모 항목 수",
+        "# TYPE insurance_matcher_demo_entries gauge",
+        "insurance_matcher_demo_entries 7",
+    ]
+
+
+def test_observe_parse_counts_pages_and_fallbacks():
+    metrics.observe_parse({
+        "insurer_code": "metrics_test", "partial": True,
+        "stats": {"elapsed_ms": 250.0, "pages_pymupdf": 5, "pages_pdfplumber": 2, "pymupdf_fallbacks": 1},
+    })
+    lines = metrics.registry.render().splitlines()
+    assert 'insurance_matcher_pdf_parses_total{insurer="metrics_test",partial="true"} 1' in lines
+    assert 'insurance_matcher_pdf_pages_total{insurer="metrics_test",engine="pymupdf"} 5' in lines
+    assert 'insurance_matcher_pdf_pages_total{insurer="metrics_test",engine="pdfplumber"} 2' in lines
+    assert 'insurance_matcher_pymupdf_fallbacks_total{insurer="metrics_test"} 1' in lines
+    assert 'insurance_matcher_pdf_parse_duration_seconds_bucket{insurer="metrics_test",le="0.25"} 1' in lines
+
+
+def test_metrics_endpoint_exposition():
+    with TestClient(main.app) as client:
+        client.get("/api/jobs/missing-job")
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == main.PROMETHEUS_CONTENT_TYPE
+    text = response.text
+    lines = text.splitlines()
+    # 모든 지표 이름마다 HELP/TYPE가 한 번씩, 샘플 줄은 형식에 맞아야 한다
+    helps = [line.split()[2] for line in lines if line.startswith("# HELP ")]
+    types = [line.split()[2] for line in lines if line.startswith("# TYPE ")]
+    assert helps == types and len(set(helps)) == len(helps)
+    for line in lines:
+        assert line.startswith("# ") or _SAMPLE.match(line), line
+    # 경로는 라우트 템플릿으로 묶는다
+    assert any(line.startswith('insurance_matcher_http_requests_total{endpoint="/api/jobs/{job_id}",method="GET",status="404"}')
+               for line in lines)
+    cache_lines = _samples(text, "insurance_matcher_layout_cache_lookups_total")
+    assert [line.split("{")[1].split("}")[0] for line in cache_lines] == [
+        'result="hit"', 'result="miss"', 'result="rejected"']
+    for family in ("lane_queue_depth", "singleflight_calls_total", "documents", "templates", "jobs"):
+        assert f"# TYPE insurance_matcher_{family} " in text
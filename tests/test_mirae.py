@@ -0,0 +1,59 @@
+"""미래에셋생명 PyMuPDF 텍스트 파서 테스트 (섹션 페이지 선택, 주계약 이름 변경, 폴백)"""
+import pdf_parser
+from page_text import as_page_texts
+
+OVERVIEW = (
+    "피보험자 홍길동(남자 40세)\n보험종류\n보험가입금액 (만원)\n{}"
+    "뇌혈관질환진단특약 홍길동 1,000 20년 전기납"
+)
+MAIN_BENEFIT = "주계약 보장내역\n[재해사망보험금] 재해로 사망시\n1,000만원 지급\n선택특약 보장내역"
+
+
+def _names(coverages):
+    return [c.name for c in coverages]
+
+
+def test_section_pages_ignore_whitespace():
+    texts = ["표지"] * 20
+    texts[9] = "주계약 보장\n내역"
+    texts[12] = "약관"
+    texts[17] = "1-7종 수술"
+    texts[18] = "1-7종\n수술 안내"
+    assert pdf_parser._mirae_section_pages(texts) == set(range(7)) | {9, 17, 18}
+
+
+def test_main_contract_row_takes_benefit_name():
+    texts = ["", OVERVIEW.format("M-케어건강보험 주계약 홍길동 2,000 20년 전기납\n"), MAIN_BENEFIT]
+    coverages = pdf_parser._extract_coverage_mirae_from_texts(texts)
+    assert [(c.name, c.amount) for c in coverages] == [
+        ("주계약(재해사망)", 20000000), ("뇌혈관질환진단특약", 10000000),
+    ]
+
+
+def test_rename_does_not_overwrite_existing_name():
+    rows = "M-케어건강보험 주계약 홍길동 2,000 20년 전기납\n주계약(재해사망) 홍길동 1,000 20년 전기납\n"
+    coverages = pdf_parser._extract_coverage_mirae_from_texts(["", OVERVIEW.format(rows), MAIN_BENEFIT])
+    names = _names(coverages)
+    assert names == ["M-케어건강보험 주계약", "주계약(재해사망)", "뇌혈관질환진단특약"]
+    assert coverages[1].amount == 10000000
+
+
+def test_benefit_added_when_no_main_contract_row():
+    coverages = pdf_parser._extract_coverage_mirae_from_texts(["", OVERVIEW.format(""), MAIN_BENEFIT])
+    assert _names(coverages) == ["뇌혈관질환진단특약", "주계약(재해사망)"]
+
+
+def test_fast_path_falls_back_to_pdfplumber(monkeypatch):
+    texts = as_page_texts(["", OVERVIEW.format(""), MAIN_BENEFIT])
+    fallback = []
+    monkeypatch.setattr(pdf_parser, "extract_coverage_mirae", lambda path: fallback.append(path) or ["폴백"])
+
+    monkeypatch.setattr(pdf_parser, "_pymupdf_extract_layout_texts_safe", lambda path, pages: texts)
+    assert _names(pdf_parser._extract_coverage_mirae_fast("m.pdf", texts))[0] == "뇌혈관질환진단특약"
+    assert fallback == []
+
+    # 텍스트가 있는 페이지의 레이아웃 텍스트가 비면 pdfplumber 파서로
+    monkeypatch.setattr(pdf_parser, "_pymupdf_extract_layout_texts_safe",
+                        lambda path, pages: as_page_texts([""] * len(texts)))
+    assert pdf_parser._extract_coverage_mirae_fast("m.pdf", texts) == ["폴백"]
+    assert fallback == ["m.pdf"]
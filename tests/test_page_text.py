@@ -0,0 +1,45 @@
+"""PageText 파생 뷰 테스트"""
+import unicodedata
+
+from page_text import EMPTY_PAGE, PageText, as_page_text, as_page_texts, join_pages
+
+
+def test_views():
+    page = PageText(" 보험료 합계 \n KB Insure \n")
+    assert page.lines == (" 보험료 합계 ", " KB Insure ", "")
+    assert page.stripped_lines == ("보험료 합계", "KB Insure", "")
+    assert page.nospace == "보험료합계\nKBInsure\n"
+    assert page.compact == "보험료합계KBInsure"
+    assert page.lowered == " 보험료 합계 \n kb insure \n"
+
+
+def test_views_are_computed_once():
+    page = PageText("a b\nc")
+    assert page.lines is page.lines
+    assert page.compact is page.compact
+    assert page.nfc is page
+
+
+def test_nfc_normalizes_decomposed_hangul():
+    decomposed = PageText(unicodedata.normalize("NFD", "가입금액"))
+    assert decomposed != "가입금액"
+    assert decomposed.nfc == "가입금액"
+    assert isinstance(decomposed.nfc, PageText)
+    assert decomposed.nfc.compact == "가입금액"
+
+
+def test_behaves_like_str():
+    page = as_page_text("가입금액 1,000만원")
+    assert "1,000만원" in page
+    assert page.split()[0] == "가입금액"
+    assert type(page + "!") is str
+
+
+def test_conversions():
+    page = PageText("x")
+    assert as_page_text(page) is page
+    assert as_page_text(None) is EMPTY_PAGE and as_page_text("") is EMPTY_PAGE
+    assert as_page_texts(None) is None
+    assert as_page_texts(["a", None]) == ["a", ""]
+    joined = join_pages(["a", "b"])
+    assert isinstance(joined, PageText) and joined.lines == ("a", "b")
@@ -0,0 +1,97 @@
+"""파이프라인 모드(PyMuPDF 생산자 ↔ pdfplumber 소비자) 테스트 — 가짜 PDF로 실행"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import pdf_parser
+
+TABLE = [["보장명", "가입금액"], ["암진단비", "1,000만원"]]
+
+
+class _FakePage:
+    def __init__(self, text, gate=None):
+        self.text = text
+        self.gate = gate
+        self.rect = SimpleNamespace(height=842.0)
+
+    def get_text(self):
+        if self.gate is not None:
+            self.gate.wait(5)
+        return self.text
+
+
+class _FakeDoc:
+    metadata = {}
+
+    def __init__(self, pages, reads):
+        self.pages = pages
+        self.reads = reads
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __iter__(self):
+        for page in self.pages:
+            self.reads.append(page)
+            yield page
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    """pages: [_FakePage] → PyMuPDF/pdfplumber가 이 페이지를 읽는다. 읽은 페이지는 reads에 기록"""
+    state = SimpleNamespace(pages=[], reads=[], tables=lambda page: ([TABLE], [(40, 100, 500, 300)]))
+    monkeypatch.setattr(pdf_parser, "_fitz", SimpleNamespace(open=lambda path: _FakeDoc(state.pages, state.reads)))
+    monkeypatch.setattr(pdf_parser, "pdfplumber", SimpleNamespace(
+        open=lambda path: SimpleNamespace(pages=state.pages, close=lambda: None)
+    ))
+    monkeypatch.setattr(pdf_parser, "_find_page_tables", lambda page: state.tables(page))
+    monkeypatch.setattr(pdf_parser, "_release_page", lambda page: None)
+    monkeypatch.setattr(pdf_parser, "_streams_pdfplumber_tables", lambda code: True)
+    monkeypatch.setattr(pdf_parser, "_boilerplate_index", SimpleNamespace(known_pages=lambda texts, pages: set()))
+    return state
+
+
+def test_pipelined_extract_collects_texts_and_tables(fake_pdf):
+    fake_pdf.pages = [_FakePage("표지"), _FakePage("가입금액 안내"), _FakePage("약관"), _FakePage("가입금액 계속")]
+    texts, heights, tables, regions, scanned, skipped = pdf_parser._pymupdf_pipelined_extract(
+        "x.pdf", ["가입금액"]
+    )
+    assert [str(t) for t in texts] == ["표지", "가입금액 안내", "약관", "가입금액 계속"]
+    assert heights == [842.0] * 4
+    assert sorted(tables) == [1, 3]
+    assert regions == {1: [(40, 100, 500, 300)], 3: [(40, 100, 500, 300)]}
+    assert scanned == [1, 3] and skipped == []
+
+
+def test_stalled_producer_times_out(fake_pdf):
+    gate = threading.Event()
+    fake_pdf.pages = [_FakePage("가입금액"), _FakePage("멈춤", gate=gate), _FakePage("가입금액")]
+    start = time.monotonic()
+    try:
+        assert pdf_parser._pymupdf_pipelined_extract("x.pdf", ["가입금액"], timeout_sec=0.2) is None
+        assert time.monotonic() - start < 3
+    finally:
+        gate.set()
+
+
+def test_consumer_error_stops_producer(fake_pdf):
+    fake_pdf.pages = [_FakePage("가입금액 %d" % i) for i in range(50)]
+
+    def boom(page):
+        raise RuntimeError("테이블 추출 실패")
+
+    fake_pdf.tables = boom
+    threads_before = threading.active_count()
+    with pytest.raises(RuntimeError):
+        pdf_parser._pymupdf_pipelined_extract("x.pdf", ["가입금액"])
+    end = time.monotonic() + 2
+    while threading.active_count() > threads_before and time.monotonic() < end:
+        time.sleep(0.01)
+    # 생산자 스레드가 끝났고, 큐(_PIPELINE_QUEUE_SIZE)가 찬 뒤로는 더 읽지 않았다
+    assert threading.active_count() == threads_before
+    assert len(fake_pdf.reads) < 50
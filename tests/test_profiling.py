@@ -0,0 +1,128 @@
+"""관리자 토큰 게이트 (/debug/profile, 요청별 X-Profile/?profile=) + 샘플러 출력"""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import profiling
+from profiling import StackSampler, check_admin_token
+
+TOKEN = "s3cret-token"
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+
+    def fake_parse(pdf_path, deadline=None):
+        calls.append(pdf_path)
+        return {
+            "insurer_code": "kb", "insurer_name": "KB손해보험", "product_name": "", "premium": 0,
+            "coverages": [], "partial": False, "stats": {"elapsed_ms": 1.0, "page_count": 1},
+        }
+
+    monkeypatch.setattr(main, "parse_pdf_all_in_one", fake_parse)
+    return calls
+
+
+def _post_pdf(client, body, **kwargs):
+    return client.post("/api/parse-pdf", files={"pdf_file": ("p.pdf", body)}, **kwargs)
+
+
+def test_check_admin_token(monkeypatch):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", "")
+    assert not check_admin_token("")
+    assert not check_admin_token(None)
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+    assert check_admin_token(TOKEN)
+    assert not check_admin_token(None)
+    assert not check_admin_token(TOKEN + "x")
+
+
+def test_debug_profile_hidden_without_admin_token(monkeypatch):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", "")
+    with TestClient(main.app) as client:
+        response = client.get("/debug/profile?seconds=0.01", headers={"X-Admin-Token": ""})
+    assert response.status_code == 404
+
+
+def test_debug_profile_requires_matching_token(monkeypatch):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+    with TestClient(main.app) as client:
+        assert client.get("/debug/profile?seconds=0.01").status_code == 403
+        assert client.get("/debug/profile?seconds=0.01", headers={"X-Admin-Token": "wrong"}).status_code == 403
+        bad_format = client.get("/debug/profile?seconds=0.01&format=svg", headers={"X-Admin-Token": TOKEN})
+        response = client.get("/debug/profile?seconds=0.05&format=top", headers={"X-Admin-Token": TOKEN})
+    assert bad_format.status_code == 400
+    assert response.status_code == 200
+    assert response.headers["x-profile-format"] == "top"
+    assert response.text.startswith("# ")
+
+
+def test_request_profile_needs_token_before_parsing(monkeypatch, parse_calls):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+    with TestClient(main.app) as client:
+        header = _post_pdf(client, b"%PDF-profile-1", headers={"X-Profile": "pstats"})
+        query = _post_pdf(client, b"%PDF-profile-2", params={"profile": "pstats"},
+                          headers={"X-Admin-Token": "wrong"})
+        bad_format = _post_pdf(client, b"%PDF-profile-3", params={"profile": "svg"},
+                               headers={"X-Admin-Token": TOKEN})
+    assert header.status_code == query.status_code == 403
+    assert bad_format.status_code == 400
+    assert parse_calls == []
+
+
+def test_request_profile_disabled_without_admin_token(monkeypatch, parse_calls):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", "")
+    with TestClient(main.app) as client:
+        response = _post_pdf(client, b"%PDF-profile-4", headers={"X-Profile": "pstats", "X-Admin-Token": ""})
+        plain = _post_pdf(client, b"%PDF-profile-5")
+    assert response.status_code == 403
+    assert plain.status_code == 200 and plain.json()["success"]
+    assert len(parse_calls) == 1
+
+
+def test_request_profile_returns_pstats(monkeypatch, parse_calls):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+    with TestClient(main.app) as client:
+        response = _post_pdf(client, b"%PDF-profile-6", params={"profile": "pstats"},
+                             headers={"X-Admin-Token": TOKEN})
+    assert response.status_code == 200
+    assert response.headers["x-profile-format"] == "pstats"
+    assert "parse;dur=" in response.headers["server-timing"]
+    assert response.text.startswith("# request ")
+    assert "fake_parse" in response.text
+    assert len(parse_calls) == 1
+
+
+def test_sampler_only_samples_registered_threads():
+    stop = threading.Event()
+
+    def busy_registered():
+        while not stop.is_set():
+            sum(range(100))
+
+    def busy_other():
+        while not stop.is_set():
+            sum(range(100))
+
+    registered = threading.Thread(target=busy_registered)
+    other = threading.Thread(target=busy_other)
+    registered.start()
+    other.start()
+    sampler = StackSampler(interval_sec=0.001, all_threads=False)
+    sampler.add_thread(registered.ident)
+    sampler.start()
+    time.sleep(0.1)
+    sampler.stop()
+    stop.set()
+    registered.join()
+    other.join()
+    collapsed = sampler.collapsed()
+    assert "test_profiling.py:busy_registered" in collapsed
+    assert "busy_other" not in collapsed
+    for line in collapsed.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("threading.py:") and int(count) > 0
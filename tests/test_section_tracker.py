@@ -0,0 +1,63 @@
+"""_CoverageSectionTracker 보장 섹션 종료 판단 테스트"""
+from pdf_parser import _SECTION_END_EMPTY_PAGES, _CoverageSectionTracker
+
+COVERAGE = [["보장명", "가입금액"], ["암진단비", "1,000만원"]]
+AMOUNTS = [["뇌출혈진단비", "500만원"]]
+NO_AMOUNTS = [["구분", "내용"], ["해지환급금", "안내 참조"]]
+TOTAL = [["합계", "18,750"]]
+
+
+def _run(tracker, pages):
+    """[(tables, text)] 순서대로 skip/feed — 추출한(skip되지 않은) 페이지 번호 목록"""
+    scanned = []
+    for i, (tables, text) in enumerate(pages):
+        if tracker.skip(i, text):
+            continue
+        scanned.append(i)
+        tracker.feed(i, tables, text)
+    return scanned
+
+
+def test_section_does_not_end_before_coverage_table():
+    tracker = _CoverageSectionTracker()
+    pages = [([NO_AMOUNTS], "보통약관 안내")] * 5 + [([COVERAGE], "가입내용")]
+    assert _run(tracker, pages) == list(range(6))
+    assert tracker.started and not tracker.ended
+
+
+def test_terms_heading_after_start_ends_section():
+    tracker = _CoverageSectionTracker()
+    pages = [([COVERAGE], "가입내용"), ([AMOUNTS], "가입내용 계속"),
+             ([NO_AMOUNTS], "제 1 관 목적 및 용어"), ([COVERAGE], "부록")]
+    assert _run(tracker, pages) == [0, 1]
+    assert tracker.skipped_pages == {2, 3}
+
+
+def test_page_without_amounts_after_total_ends_section():
+    tracker = _CoverageSectionTracker()
+    pages = [([COVERAGE], "가입내용"), ([AMOUNTS, TOTAL], "가입내용"), ([NO_AMOUNTS], "유의사항"),
+             ([AMOUNTS], "다른 표")]
+    assert _run(tracker, pages) == [0, 1, 2]
+
+
+def test_empty_run_ends_section_and_amount_page_resets_it():
+    tracker = _CoverageSectionTracker()
+    gap = [([NO_AMOUNTS], "안내")] * (_SECTION_END_EMPTY_PAGES - 1)
+    pages = [([COVERAGE], "가입내용")] + gap + [([AMOUNTS], "가입내용")] + gap
+    assert _run(tracker, pages) == list(range(len(pages)))
+    assert not tracker.ended
+    assert tracker.feed(len(pages), [], "안내")
+    assert tracker.skip(len(pages) + 1)
+
+
+def test_close_on_total_ends_at_total_page():
+    tracker = _CoverageSectionTracker(close_on_total=True)
+    assert not tracker.feed(0, [COVERAGE], "보험가입내용")
+    assert tracker.feed(1, [AMOUNTS], "합계보험료 18,750원")
+    assert tracker.skip(2, "주계약 보장내용")
+
+
+def test_texts_come_from_page_texts_when_not_passed():
+    tracker = _CoverageSectionTracker(["가입내용", "특별약관 제1조"])
+    tracker.feed(0, [COVERAGE])
+    assert tracker.skip(1)
@@ -0,0 +1,92 @@
+"""SingleFlight / AsyncSingleFlight 동일 작업 합치기 테스트"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from singleflight import AsyncSingleFlight, SingleFlight, content_key
+
+
+def test_content_key_is_stable_and_length_prefixed():
+    assert content_key("a", b"x", 1) == content_key("a", b"x", 1)
+    assert content_key("ab", "c") != content_key("a", "bc")
+    assert content_key({"b": 1, "a": 2}) == content_key({"a": 2, "b": 1})
+
+
+def test_threads_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", work)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", work))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while flight.shared < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(5)
+    assert results == ["result"] * 4
+    assert calls == [1]
+    assert flight.stats() == {"executed": 1, "shared": 3, "in_flight": 0}
+
+
+def test_thread_error_is_shared_and_key_released():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 2) == 2
+    assert flight.do(None, lambda: 3) == 3
+
+
+def test_async_shares_running_task():
+    async def scenario():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        first = asyncio.ensure_future(flight.do("k", work, 1))
+        await asyncio.sleep(0)
+        assert flight.running("k")
+        second = await flight.do("k", work, 1)
+        assert await first == second == 2
+        assert calls == [1]
+        assert not flight.running("k")
+        assert flight.stats() == {"executed": 1, "shared": 1, "in_flight": 0}
+    asyncio.run(scenario())
+
+
+def test_async_leader_cancel_does_not_cancel_followers():
+    async def scenario():
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "done"
+    asyncio.run(scenario())
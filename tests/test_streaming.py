@@ -0,0 +1,72 @@
+"""/api/match-with-summary/stream 스트리밍 응답 테스트 (파싱/매칭은 가짜로 대체)"""
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    seen = {}
+
+    def fake_iter(pdf_items, read_coverages, threshold, deadline=None, timings=None, include_timings=False):
+        seen["paths"] = [path for _, path in pdf_items]
+        for pdf_idx, (name, path) in enumerate(pdf_items):
+            assert os.path.exists(path)
+            if name == "boom.pdf":
+                raise RuntimeError("PDF 파싱 실패")
+            yield {"pdf_index": pdf_idx, "pdf_name": name, "partial": name == "slow.pdf"}
+
+    monkeypatch.setattr(main, "_excel_layout", lambda path, sheet_name, template=None: (None, lambda col: []))
+    monkeypatch.setattr(main, "_iter_match_summary", fake_iter)
+    with TestClient(main.app) as test_client:
+        test_client.seen = seen
+        yield test_client
+
+
+def _files(*names):
+    return [("pdf_files", (name, b"%PDF-1.4")) for name in names] + [("excel_file", ("t.xlsx", b"xlsx"))]
+
+
+def _stream(client, names, **data):
+    with client.stream("POST", "/api/match-with-summary/stream", files=_files(*names), data=data) as response:
+        return response.status_code, response.headers, "".join(response.iter_text())
+
+
+def test_ndjson_one_line_per_pdf(client):
+    status, headers, body = _stream(client, ["a.pdf", "b.pdf"])
+    assert status == 200
+    assert headers["content-type"].startswith("application/x-ndjson")
+    assert headers["x-accel-buffering"] == "no"
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {"pdf_index": 0, "pdf_name": "a.pdf", "partial": False},
+        {"pdf_index": 1, "pdf_name": "b.pdf", "partial": False},
+    ]
+
+
+def test_sse_result_events_then_done(client):
+    status, headers, body = _stream(client, ["a.pdf", "slow.pdf"], output="sse")
+    assert headers["content-type"].startswith("text/event-stream")
+    events = [block.splitlines() for block in body.strip().split("\n\n")]
+    assert [lines[0] for lines in events] == ["event: result", "event: result", "event: done"]
+    assert json.loads(events[-1][1][len("data: "):]) == {"total_pdfs": 2, "partial": True}
+
+
+def test_error_is_last_item_and_resources_are_released(client):
+    status, _, body = _stream(client, ["a.pdf", "boom.pdf", "c.pdf"])
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert status == 200
+    assert lines[0]["pdf_name"] == "a.pdf"
+    assert lines[-1] == {"success": False, "error": "PDF 파싱 실패"}
+    assert len(lines) == 2
+    assert main.bulk_lane.admission.stats()["in_use"] == 0
+    assert not any(os.path.exists(path) for path in client.seen["paths"])
+
+
+def test_unknown_output_is_400(client):
+    status, _, body = _stream(client, ["a.pdf"], output="csv")
+    assert status == 400
+    assert json.loads(body)["success"] is False
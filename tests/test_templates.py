@@ -0,0 +1,74 @@
+"""TemplateRegistry 등록/조회/영속화 테스트"""
+import io
+
+import openpyxl
+import pytest
+
+from templates import TemplateRegistry, TemplateRegistryFull
+
+ROWS = ["보장분석", None, "회사", None, "상품명", "보험료", None, "실비질병/상해 종합입원", "암진단비", "합계", "상해사망"]
+
+
+def _workbook_bytes(rows=ROWS, title=None):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    if title:
+        ws.title = title
+    for i, value in enumerate(rows, 1):
+        ws.cell(row=i, column=2, value=value)
+    out = io.BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+def test_register_precomputes_structure_and_rows(tmp_path):
+    registry = TemplateRegistry(str(tmp_path))
+    template = registry.register("보장분석표.xlsx", _workbook_bytes())
+    sheet = template.sheet()
+    assert sheet.structure == {
+        "insurer_row": 4, "product_row": 5, "premium_row": 6, "reserve_row": None, "start_row": 8,
+    }
+    assert sheet.coverage_rows == [(8, "실비질병/상해 종합입원"), (9, "암진단비"), (11, "상해사망")]
+    assert sheet.coverages(5)[1] == {"row": 9, "특약명": "암진단비", "amount_col": 5}
+
+
+def test_same_content_same_id(tmp_path):
+    registry = TemplateRegistry(str(tmp_path))
+    content = _workbook_bytes()
+    first = registry.register("a.xlsx", content)
+    assert registry.register("b.xlsx", content) is first
+    assert registry.stats()["count"] == 1
+    assert registry.register("c.xlsx", _workbook_bytes(ROWS + ["질병사망"])).id != first.id
+
+
+def test_missing_sheet(tmp_path):
+    registry = TemplateRegistry(str(tmp_path))
+    with pytest.raises(KeyError):
+        registry.register("a.xlsx", _workbook_bytes(), sheet_name="없는시트")
+    template = registry.register("a.xlsx", _workbook_bytes(title="보장"), sheet_name="보장")
+    assert template.to_dict("보장")["sheet_name"] == "보장"
+
+
+def test_open_workbook_is_independent_copy(tmp_path):
+    template = TemplateRegistry(str(tmp_path)).register("a.xlsx", _workbook_bytes())
+    wb = template.open_workbook()
+    wb.active.cell(row=9, column=4, value=1000)
+    assert template.open_workbook().active.cell(row=9, column=4).value is None
+
+
+def test_persisted_across_restart_and_deleted(tmp_path):
+    template = TemplateRegistry(str(tmp_path)).register("보장분석표.xlsx", _workbook_bytes())
+    reloaded = TemplateRegistry(str(tmp_path))
+    restored = reloaded.get(template.id)
+    assert restored.filename == "보장분석표.xlsx"
+    assert restored.content == template.content
+    assert reloaded.delete(template.id)
+    assert not reloaded.delete(template.id)
+    assert TemplateRegistry(str(tmp_path)).get(template.id) is None
+
+
+def test_max_count(tmp_path):
+    registry = TemplateRegistry(str(tmp_path), max_count=1)
+    registry.register("a.xlsx", _workbook_bytes())
+    with pytest.raises(TemplateRegistryFull):
+        registry.register("b.xlsx", _workbook_bytes(ROWS + ["질병사망"]))
@@ -0,0 +1,36 @@
+"""상품명/보험료 스캐너 회귀 테스트 — 미리 컴파일 전 구현(benchmarks/text_scanners.py)과 비교"""
+import pytest
+
+from benchmarks.text_scanners import mismatches
+from pdf_parser import _detect_product_name_from_text, _extract_premium_from_texts
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("보험상품명 (무)흥국생명 다사랑건강보험", "흥국생명 다사랑건강보험"),
+    ("KB 플러스 건강보험(무배당)", "KB 플러스 건강보험"),
+    ("M-케어 건강보험(무배당)", "M-케어 건강보험"),
+    ("무배당삼성화재 건강보험 천만안심(2601.13)", "건강보험 천만안심"),
+    ("신한통합건강보험 원(ONE)(무배당, 갱신형)", "신한통합건강보험"),
+    ("무배당새로담는건강보험(해약환급금미지급형Ⅱ)", "새로담는건강보험"),
+    ("건강할때 가입하는 청춘어람플러스 종합보험2601", "청춘어람플러스"),
+    ("무배당현대해상퍼펙트플러스종합보험(연만기갱신형)", "퍼펙트플러스"),
+    ("(무)흥국 다사랑 암보험", "흥국 다사랑 암보험"),
+])
+def test_product_name_patterns(line, expected):
+    assert _detect_product_name_from_text(["가입설계서\n" + line]) == expected
+
+
+def test_product_name_skips_company_lines_and_later_pages():
+    pages = ["흥국생명보험(주)\n보험계약자 홍길동", "", "흥국 든든 건강보험\n메리츠 알파 건강보험"]
+    assert _detect_product_name_from_text(pages) == "흥국 든든 건강보험"
+    assert _detect_product_name_from_text(["가입설계서"]) == "상품명 미확인"
+
+
+def test_premium_priority_within_page_and_first_page_wins():
+    assert _extract_premium_from_texts(["보험료: 7,700원\n실납입보험료 52,300원"]) == 52300
+    assert _extract_premium_from_texts(["합 계 500", "합계보험료 18,750원", "실납입보험료 52,300원"]) == 18750
+    assert _extract_premium_from_texts(["안내"]) is None
+
+
+def test_random_pages_match_legacy():
+    assert mismatches(5000) == []
@@ -0,0 +1,61 @@
+"""StageTimings 누적/Server-Timing 헤더 테스트 + /api/parse-pdf 응답 헤더"""
+import re
+import time
+
+from fastapi.testclient import TestClient
+
+import main
+from coverage_record import Coverage
+from timings import StageTimings
+
+
+def test_stage_accumulates_and_describe_joins():
+    timings = StageTimings()
+    for _ in range(2):
+        with timings.stage("parse"):
+            time.sleep(0.01)
+    timings.add("match", 1.5)
+    timings.describe("parse", "kb:3p")
+    timings.describe("parse", 'lina:"2p"')
+    assert timings.timings["parse"] >= 20
+    assert timings.timings["match"] == 1.5
+    assert timings.descriptions["parse"] == 'kb:3p,lina:"2p"'
+
+
+def test_server_timing_header_format():
+    timings = StageTimings()
+    timings.add("queue", 0.04)
+    timings.add("parse", 12.34)
+    timings.describe("parse", 'kb:"3p"')
+    assert timings.server_timing_header(total=False) == "queue;dur=0.0, parse;dur=12.3;desc=\"kb:'3p'\""
+    assert re.fullmatch(r'.*, total;dur=\d+\.\d', timings.server_timing_header())
+
+
+def test_stage_records_time_when_block_raises():
+    timings = StageTimings()
+    try:
+        with timings.stage("excel_read"):
+            raise ValueError
+    except ValueError:
+        pass
+    assert "excel_read" in timings.timings
+
+
+def test_parse_pdf_server_timing(monkeypatch):
+    def fake_parse(pdf_path, deadline=None):
+        return {
+            "insurer_code": "kb", "insurer_name": "KB손해보험", "product_name": "KB 건강보험",
+            "premium": 50000, "coverages": [Coverage("암진단비", 10000000)], "partial": False,
+            "stats": {"elapsed_ms": 42.0, "page_count": 3, "timings": {"text": 5.0, "tables": 30.0}},
+        }
+
+    monkeypatch.setattr(main, "parse_pdf_all_in_one", fake_parse)
+    with TestClient(main.app) as client:
+        response = client.post("/api/parse-pdf?timings=true", files={"pdf_file": ("t.pdf", b"%PDF-timing")})
+    assert response.status_code == 200
+    entries = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+    assert entries == ["queue", "parse", "parse_text", "parse_tables", "total"]
+    assert 'parse;dur=42.0;desc="kb:3p"' in response.headers["server-timing"]
+    body = response.json()
+    assert body["timings"]["parse_ms"] == 42.0
+    assert body["timings"]["parse_stages"] == {"text": 5.0, "tables": 30.0}
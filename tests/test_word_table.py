@@ -0,0 +1,61 @@
+"""word_table 단어 좌표 테이블 복원 테스트"""
+import numpy as np
+
+from word_table import cluster_rows, find_word_tables
+
+
+def _words(rows, top=100, row_height=20, col_x=(50, 300)):
+    """[(셀, ...)] → PyMuPDF words 튜플 (x0, top, x1, bottom, text)"""
+    words = []
+    for r, cells in enumerate(rows):
+        y = top + r * row_height
+        for x, text in zip(col_x, cells):
+            if text:
+                words.append((x, y, x + 10 * len(text), y + 10, text))
+    return words
+
+
+def test_cluster_rows_within_tolerance():
+    order, row_ids = cluster_rows(np.array([10.0, 11.0, 30.0, 12.0]))
+    assert list(order) == [0, 1, 3, 2]
+    assert list(row_ids) == [0, 0, 0, 1]
+
+
+def test_table_rows_and_bbox():
+    rows = [("보장명", "가입금액"), ("암진단비", "1,000만원"), ("뇌출혈진단비", "500만원")]
+    tables = find_word_tables(_words(rows))
+    assert len(tables) == 1
+    table, bbox = tables[0]
+    assert table == [list(r) for r in rows]
+    assert bbox[0] == 50 and bbox[1] == 100 and bbox[3] == 150
+
+
+def test_single_cell_lines_are_not_tables():
+    words = _words([("보장명", "가입금액"), ("암진단비", "1,000만원")])
+    words.append((50, 400, 200, 410, "유의사항"))
+    tables = find_word_tables(words)
+    assert [table for table, _ in tables] == [[["보장명", "가입금액"], ["암진단비", "1,000만원"]]]
+
+
+def test_wrapped_cell_joins_row_above():
+    rows = [("보장명", "가입금액"), ("암진단비", "1,000만원"), ("(유사암제외)", None), ("상해사망", "1억원")]
+    table, _ = find_word_tables(_words(rows))[0]
+    assert table == [["보장명", "가입금액"], ["암진단비\n(유사암제외)", "1,000만원"], ["상해사망", "1억원"]]
+
+
+def test_word_table_path_is_opt_in(monkeypatch):
+    import pdf_parser
+
+    monkeypatch.setattr(pdf_parser, "PDF_WORD_TABLES", False)
+    assert not pdf_parser._use_word_tables("hanwha")
+    monkeypatch.setattr(pdf_parser, "PDF_WORD_TABLES", True)
+    assert pdf_parser._use_word_tables("hanwha") == pdf_parser.HAS_WORD_TABLES
+    assert not pdf_parser._use_word_tables("kb")
+
+
+def test_word_tables_without_amount_header_fall_back():
+    import pdf_parser
+
+    rows = [["암진단비", "1,000만원"], ["뇌출혈진단비", "500만원"]]
+    word_tables = {3: [(rows, (50, 100, 400, 150))]}
+    assert pdf_parser._extract_coverages_from_word_tables("hanwha", "x.pdf", [], word_tables) == ([], {})
@@ -0,0 +1,52 @@
+"""단계별 소요 시간 기록 + Server-Timing 헤더
+
+느린 매칭이 PyMuPDF, pdfplumber 테이블, 보험사 파서, match_coverages, excel_handler의
+반복 load/save 중 어디서 걸리는지 알 수 있도록 단계별 시간을 모은다.
+
+  - StageTimings.stage(이름): with 블록 소요 시간을 단계별로 누적 (ms)
+  - StageTimings.describe(이름, 설명): Server-Timing desc (보험사 코드, 페이지 수 등)
+  - server_timing_header(): `이름;dur=12.3;desc="..."` 목록 (브라우저 개발자 도구에 표시)
+"""
+import time
+from contextlib import contextmanager
+
+
+class StageTimings:
+    """단계 이름 → 누적 소요 시간 (ms)"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.timings = {}
+        self.descriptions = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.monotonic()
+        try:
+            yield self
+        finally:
+            self.add(name, (time.monotonic() - start) * 1000)
+
+    def add(self, name, elapsed_ms):
+        self.timings[name] = round(self.timings.get(name, 0.0) + elapsed_ms, 1)
+
+    def describe(self, name, text):
+        """단계 설명 추가 (같은 단계에 여러 번 붙이면 쉼표로 연결)"""
+        previous = self.descriptions.get(name)
+        self.descriptions[name] = f"{previous},{text}" if previous else text
+
+    def elapsed_ms(self):
+        return round((time.monotonic() - self.started_at) * 1000, 1)
+
+    def server_timing_header(self, total=True):
+        """Server-Timing 헤더 값 (total=True면 시작부터 지금까지를 total로 추가)"""
+        entries = []
+        for name, elapsed_ms in self.timings.items():
+            entry = f"{name};dur={elapsed_ms:.1f}"
+            if name in self.descriptions:
+                desc = self.descriptions[name].replace('"', "'")
+                entry += f';desc="{desc}"'
+            entries.append(entry)
+        if total:
+            entries.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(entries)
@@ -0,0 +1,166 @@
+"""PyMuPDF 단어 좌표 기반 테이블 복원 (NumPy 클러스터링)
+
+pdfplumber 테이블 추출은 페이지마다 pdfminer 레이아웃 분석 + 선 교차 계산을
+하기 때문에 느리다. 가입제안서의 보장 테이블은 열 위치가 고정된 단순 격자라서
+PyMuPDF get_text("words") 좌표만으로도 행/열을 복원할 수 있다.
+
+  - 행: 단어 top 좌표를 정렬해 y_tolerance 이상 벌어지는 곳에서 끊음
+  - 셀: 같은 행에서 x 간격이 col_gap 이상 벌어지는 곳에서 끊음
+  - 열: 여러 셀이 있는 행들의 셀 x 구간을 병합해 열 경계 결정
+
+결과는 pdfplumber extract_tables()와 같은 형태 (행 리스트, 빈 셀은 None)라서
+기존 테이블 파서(_extract_coverage_generic_from_cache 등)에 그대로 넣을 수 있다.
+"""
+import numpy as np
+
+
+def _word_arrays(words):
+    """PyMuPDF words 튜플 목록 → 좌표 배열 + 텍스트 리스트"""
+    coords = np.array([w[:4] for w in words], dtype=float)
+    texts = [w[4] for w in words]
+    return coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3], texts
+
+
+def cluster_rows(tops, y_tolerance=3):
+    """top 좌표를 행 번호로 클러스터링 (정렬 후 인접 차이가 y_tolerance 초과면 새 행)
+
+    Returns:
+        (order, row_ids) — order는 top 기준 정렬 인덱스, row_ids는 order 순서의 행 번호
+    """
+    order = np.argsort(tops, kind="stable")
+    breaks = np.diff(tops[order]) > y_tolerance
+    row_ids = np.concatenate(([0], np.cumsum(breaks)))
+    return order, row_ids
+
+
+def cluster_columns(seg_x0, seg_x1):
+    """셀 x 구간을 병합해 열 시작 좌표 배열 반환
+
+    x0 순으로 정렬하고 누적 최대 x1보다 오른쪽에서 시작하는 구간을 새 열로 본다.
+    """
+    if len(seg_x0) == 0:
+        return np.array([0.0])
+    order = np.argsort(seg_x0, kind="stable")
+    x0 = seg_x0[order]
+    reach = np.maximum.accumulate(seg_x1[order])
+    starts = np.concatenate(([True], x0[1:] > reach[:-1]))
+    return x0[starts]
+
+
+def words_to_grid(words, y_tolerance=3, col_gap=None):
+    """단어 좌표로 페이지 전체 셀 격자 복원
+
+    Args:
+        words: PyMuPDF page.get_text("words") 결과
+        y_tolerance: 같은 행으로 볼 top 좌표 차이 (pt)
+        col_gap: 셀을 나눌 단어 간 최소 x 간격 (pt). None이면 단어 높이 중앙값의 1.5배
+
+    Returns:
+        (grid, row_boxes) — grid는 행별 셀 텍스트 리스트 (빈 셀 None),
+        row_boxes는 행별 (x0, top, x1, bottom)
+    """
+    if not words:
+        return [], []
+    x0, top, x1, bottom, texts = _word_arrays(words)
+    if col_gap is None:
+        col_gap = 1.5 * float(np.median(bottom - top))
+
+    order, row_ids = cluster_rows(top, y_tolerance)
+
+    # 행 내부를 x 순으로 정렬 (행 번호 → x0)
+    by_row = np.lexsort((x0[order], row_ids))
+    idx = order[by_row]
+    rows = row_ids[by_row]
+
+    # 셀(연속 단어 묶음) 경계: 행이 바뀌거나 x 간격이 col_gap 이상
+    gaps = x0[idx][1:] - x1[idx][:-1]
+    new_seg = np.concatenate(([True], (rows[1:] != rows[:-1]) | (gaps >= col_gap)))
+    seg_ids = np.cumsum(new_seg) - 1
+    n_segs = int(seg_ids[-1]) + 1
+
+    seg_row = rows[new_seg]
+    seg_x0 = np.full(n_segs, np.inf)
+    seg_x1 = np.full(n_segs, -np.inf)
+    np.minimum.at(seg_x0, seg_ids, x0[idx])
+    np.maximum.at(seg_x1, seg_ids, x1[idx])
+
+    # 열 경계는 셀이 2개 이상인 행(표의 행)으로만 결정 — 문단 줄이 열을 합치지 않도록
+    segs_per_row = np.bincount(seg_row)
+    multi = segs_per_row[seg_row] >= 2
+    col_starts = cluster_columns(seg_x0[multi], seg_x1[multi])
+    seg_col = np.clip(np.searchsorted(col_starts, seg_x0, side="right") - 1, 0, None)
+
+    n_rows = int(rows[-1]) + 1
+    n_cols = len(col_starts)
+    grid = [[None] * n_cols for _ in range(n_rows)]
+    seg_texts = [[] for _ in range(n_segs)]
+    for seg, word_idx in zip(seg_ids.tolist(), idx.tolist()):
+        seg_texts[seg].append(texts[word_idx])
+    for seg in range(n_segs):
+        r, c = int(seg_row[seg]), int(seg_col[seg])
+        text = " ".join(seg_texts[seg])
+        grid[r][c] = text if grid[r][c] is None else grid[r][c] + " " + text
+
+    box_min = np.full((n_rows, 2), np.inf)
+    box_max = np.full((n_rows, 2), -np.inf)
+    np.minimum.at(box_min, rows, np.column_stack((x0[idx], top[idx])))
+    np.maximum.at(box_max, rows, np.column_stack((x1[idx], bottom[idx])))
+    row_boxes = [
+        (float(a[0]), float(a[1]), float(b[0]), float(b[1]))
+        for a, b in zip(box_min, box_max)
+    ]
+    return grid, row_boxes
+
+
+def split_tables(grid, row_boxes, min_cells=2):
+    """페이지 격자를 테이블 단위로 분리
+
+    셀이 min_cells개 이상인 행이 이어지는 구간을 하나의 테이블로 본다.
+    테이블 바로 아래 붙은 단일 셀 행(줄바꿈된 특약명 등)은 위 행의 같은 열에 이어 붙인다.
+    모든 행이 비어 있는 열은 제거한다.
+
+    Returns:
+        [(rows, bbox), ...] — rows는 pdfplumber extract_tables() 형태
+    """
+    tables = []
+    current = []
+    current_boxes = []
+
+    def _flush():
+        if len(current) >= 2:
+            keep = [j for j in range(len(current[0])) if any(row[j] for row in current)]
+            rows = [[row[j] for j in keep] for row in current]
+            bbox = (
+                min(b[0] for b in current_boxes), min(b[1] for b in current_boxes),
+                max(b[2] for b in current_boxes), max(b[3] for b in current_boxes),
+            )
+            tables.append((rows, bbox))
+
+    for row, box in zip(grid, row_boxes):
+        filled = [j for j, cell in enumerate(row) if cell]
+        if len(filled) >= min_cells:
+            current.append(list(row))
+            current_boxes.append(box)
+            continue
+        prev_box = current_boxes[-1] if current_boxes else None
+        if (prev_box and len(filled) == 1
+                and box[1] - prev_box[3] <= prev_box[3] - prev_box[1]):
+            # 바로 아래 붙은 단일 셀 행 = 줄바꿈된 셀 — 위 행에 이어 붙임
+            j = filled[0]
+            prev = current[-1]
+            prev[j] = row[j] if prev[j] is None else prev[j] + "\n" + row[j]
+            current_boxes[-1] = (
+                min(prev_box[0], box[0]), prev_box[1],
+                max(prev_box[2], box[2]), max(prev_box[3], box[3]),
+            )
+            continue
+        _flush()
+        current, current_boxes = [], []
+    _flush()
+    return tables
+
+
+def find_word_tables(words, y_tolerance=3, col_gap=None):
+    """PyMuPDF 단어 목록에서 테이블 목록 추출 — [(rows, bbox), ...]"""
+    grid, row_boxes = words_to_grid(words, y_tolerance, col_gap)
+    return split_tables(grid, row_boxes)